@@ -10,15 +10,32 @@ This will:
 1. Run doc_analyzer.py to analyze the documentation
 2. Run doc_fixer.py to generate fix suggestions
 3. Generate all 6 reports (analysis + fixes in .html, .md, .json formats)
+
+With --in-process both phases run in this process over one file list and
+one in-memory copy of the documents; a dry-run fix preview runs
+concurrently with the analysis.
 """
 
 import sys
 import os
 import argparse
 import subprocess
+import io
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from datetime import datetime
 
+def _print_title(description: str):
+    """Print a phase banner"""
+    print(f"\n{'='*70}")
+    print(f"📊 {description}")
+    print(f"{'='*70}")
+
+def _run_titled(description: str, stage) -> bool:
+    """Run a pipeline stage under a phase banner, streaming its output"""
+    _print_title(description)
+    return _run_stage(stage)
+
 def run_command(command: list, description: str, timeout: int = 1800) -> tuple[bool, str]:
     """
     Run a command with real-time output streaming and timeout.
@@ -31,9 +48,7 @@ def run_command(command: list, description: str, timeout: int = 1800) -> tuple[b
     Returns:
         Tuple of (success: bool, output: str)
     """
-    print(f"\n{'='*70}")
-    print(f"📊 {description}")
-    print(f"{'='*70}")
+    _print_title(description)
 
     output_lines = []
 
@@ -87,6 +102,236 @@ def run_command(command: list, description: str, timeout: int = 1800) -> tuple[b
         print(f"❌ {error_msg}", file=sys.stderr)
         return False, error_msg
 
+def _run_stage(stage) -> bool:
+    """Run a pipeline stage, reporting (not raising) its errors"""
+    try:
+        return stage() is not False
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        return False
+
+def _run_captured(stage) -> tuple[bool, str]:
+    """Run a pipeline stage with its output captured"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        success = _run_stage(stage)
+    return success, buffer.getvalue()
+
+def _stage_worker(stage, sender):
+    """Forked child: run a stage and send back (success, output)"""
+    sender.send(_run_captured(stage))
+    sender.close()
+
+def run_concurrently(first, second, timeout: int = 1800) -> tuple[tuple[bool, str], tuple[bool, str]]:
+    """
+    Run two stages at the same time, first in a forked child and second here.
+
+    The child inherits everything built so far (configuration, document
+    store) without re-reading or pickling it. Output of both stages is
+    captured so it can be printed in order once they finish.
+
+    Returns:
+        (success, output) of first and of second
+    """
+    import multiprocessing  # only needed here; keeps --help and subprocess mode fast
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_stage_worker, args=(first, sender))
+    process.start()
+    sender.close()
+
+    second_result = _run_captured(second)
+
+    try:
+        if receiver.poll(timeout):
+            first_result = receiver.recv()
+        else:
+            process.kill()
+            first_result = (False, f"Stage timed out after {timeout} seconds")
+    except EOFError:
+        first_result = (False, f"Stage process exited with code {process.exitcode}")
+    process.join()
+    return first_result, second_result
+
+def can_run_concurrently() -> bool:
+    """Whether run_concurrently can fork and has a spare CPU to run on"""
+    if (os.cpu_count() or 1) < 2:
+        return False
+    import multiprocessing
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+def run_in_process(args, output_dir: Path) -> bool:
+    """
+    Run analysis and fixes in this process over a shared document store
+
+    The tree is walked and each file read once; the analyzer and the fixer
+    chain both take their contents from the store. A dry-run fix preview
+    only reads documents, so it runs concurrently with the analysis (on
+    multi-core machines that can fork); applying fixes waits for the analysis.
+
+    Returns:
+        True if every phase that ran succeeded
+    """
+    # Imported here so `--help` and subprocess runs stay fast
+    from core.documents import DocumentStore
+    from doc_analyzer import DocumentationAnalyzer, apply_cli_options, load_config, prepare_repository
+    from doc_fixer import DocFixer
+
+    config = load_config(args.config)
+    apply_cli_options(config, docs_path=args.docs_path, repo_url=args.repo_url, repo_type=args.repo_type,
+                      repo_root=args.repo_root, no_ai=args.no_ai)
+    repo_manager = prepare_repository(config)
+    docs_path = repo_manager.repo_path
+    dry_run = not args.apply_fixes
+
+    # One walk and one read of every document for both phases
+    analyzer_files = [] if args.skip_analysis else repo_manager.get_files()
+    fixer_files = [] if args.skip_fixes else sorted(docs_path.rglob('*.mdx'))
+    documents = DocumentStore()
+    documents.load(analyzer_files)
+    documents.load(fixer_files)
+    print(f"📚 Loaded {len(documents)} documents")
+
+    formats = ['json', 'html', 'markdown'] if args.format == 'all' else [args.format]
+
+    def analysis_stage():
+        analyzer = DocumentationAnalyzer(repo_manager, config)
+        analyzer.documents = documents
+        report = analyzer.analyze_all(analyzer_files)
+        for output_format in formats:
+            analyzer.export_report(output_format, str(output_dir))
+        print(f"   Total issues: {report.total_issues}")
+        if args.profile:
+            print("\n⏱️  Per-check timings (slowest first):")
+            print(analyzer.profiler.format_table())
+
+    def fix_stage():
+        fixer = DocFixer(config_path=args.config, enable_style_guide=not args.no_ai)
+        fixer.documents = documents
+        stats = fixer.process_directory(docs_path, dry_run=dry_run, files=fixer_files)
+        report = fixer.create_report(docs_path=docs_path, dry_run=dry_run)
+        fixer.export_report(report, output_format=args.format, output_dir=output_dir)
+        print(stats.summary())
+        if args.profile:
+            print("\n⏱️  Per-fixer timings (slowest first):")
+            print(fixer.profiler.format_table())
+        return not stats.errors
+
+    analysis_title = "Running Documentation Analysis"
+    fix_title = "Running Documentation Fixer"
+    analysis_ok = fix_ok = True
+    if args.skip_analysis:
+        print("\n⏭️  Skipping analysis phase (--skip-analysis flag)")
+        fix_ok = _run_titled(fix_title, fix_stage)
+    elif args.skip_fixes:
+        analysis_ok = _run_titled(analysis_title, analysis_stage)
+        print("\n⏭️  Skipping fix generation phase (--skip-fixes flag)")
+    elif dry_run and can_run_concurrently():
+        print("\n⏳ Running analysis and fix preview concurrently (output follows when both finish)...")
+        (analysis_ok, analysis_output), (fix_ok, fix_output) = run_concurrently(analysis_stage, fix_stage)
+        for title, output in ((analysis_title, analysis_output), (fix_title, fix_output)):
+            _print_title(title)
+            print(output.rstrip())
+    else:
+        analysis_ok = _run_titled(analysis_title, analysis_stage)
+        fix_ok = _run_titled(fix_title, fix_stage)
+
+    if not analysis_ok:
+        print("\n❌ Analysis phase failed!", file=sys.stderr)
+    if not fix_ok:
+        print("\n❌ Fixer phase failed!", file=sys.stderr)
+    return analysis_ok and fix_ok
+
+def run_subprocesses(args, output_dir: Path) -> bool:
+    """
+    Run doc_analyzer.py and then doc_fixer.py as child processes
+
+    Returns:
+        True if every phase that ran succeeded
+    """
+    overall_success = True
+
+    # Build base command arguments that both scripts share
+    base_args = []
+
+    if args.docs_path:
+        base_args.append(args.docs_path)
+    if args.repo_url:
+        base_args.extend(['--repo-url', args.repo_url])
+    if args.repo_type and args.repo_type != 'auto':
+        base_args.extend(['--repo-type', args.repo_type])
+    if args.repo_root:
+        base_args.extend(['--repo-root', args.repo_root])
+    if args.config:
+        base_args.extend(['--config', args.config])
+    if args.format:
+        base_args.extend(['--format', args.format])
+    # Always pass the shared output directory to both scripts
+    base_args.extend(['--output', str(output_dir)])
+    if args.no_ai:
+        base_args.append('--no-ai')
+    if args.profile:
+        base_args.append('--profile')
+
+    # Run analysis phase
+    if not args.skip_analysis:
+        analyzer_cmd = [sys.executable, 'doc_analyzer.py'] + base_args
+        success, output = run_command(analyzer_cmd, "Running Documentation Analysis")
+
+        if not success:
+            print("\n❌ Analysis phase failed!", file=sys.stderr)
+            overall_success = False
+            if not args.skip_fixes:
+                print("⚠️  Continuing with fix generation despite analysis errors...", file=sys.stderr)
+    else:
+        print("\n⏭️  Skipping analysis phase (--skip-analysis flag)")
+
+    # Run fixer phase
+    if not args.skip_fixes:
+        # Build fixer-specific arguments (doc_fixer.py has different args)
+        fixer_cmd = [sys.executable, 'doc_fixer.py']
+
+        # Add path argument (required positional for fixer)
+        if args.docs_path:
+            fixer_cmd.append(args.docs_path)
+        elif args.repo_url:
+            # For remote repos, we need to use the local clone path
+            # The analyzer would have cloned it, so we can just use the repo name
+            import re
+            repo_name = re.sub(r'\.git$', '', args.repo_url.split('/')[-1])
+            fixer_cmd.append(f'./temp/{repo_name}')
+
+        # Add configuration file if specified
+        if args.config:
+            fixer_cmd.extend(['--config', args.config])
+
+        # Add format and output arguments (IMPORTANT: fixer needs same output dir)
+        if args.format:
+            fixer_cmd.extend(['--format', args.format])
+        fixer_cmd.extend(['--output', str(output_dir)])
+
+        # Add fix-specific arguments
+        if not args.apply_fixes:
+            fixer_cmd.append('--dry-run')  # Default is dry-run
+
+        # Pass --no-ai flag to fixer if set (disables slow StyleGuideValidator)
+        if args.no_ai:
+            fixer_cmd.append('--no-ai')
+
+        if args.profile:
+            fixer_cmd.append('--profile')
+
+        success, output = run_command(fixer_cmd, "Running Documentation Fixer")
+
+        if not success:
+            print("\n❌ Fixer phase failed!", file=sys.stderr)
+            overall_success = False
+    else:
+        print("\n⏭️  Skipping fix generation phase (--skip-fixes flag)")
+
+    return overall_success
+
 def main():
     parser = argparse.ArgumentParser(
         description='Unified documentation analyzer and fixer - analyzes .mdx files and generates comprehensive reports',
@@ -107,6 +352,9 @@ Examples:
 
   # Analyze remote repository
   python analyze_docs.py --repo-url https://github.com/user/docs --repo-type mintlify
+
+  # Single process: read the docs once, preview fixes while analyzing
+  python analyze_docs.py /path/to/docs --in-process
         """
     )
 
@@ -137,6 +385,8 @@ Examples:
                        help='Path to configuration file')
     parser.add_argument('--no-ai', action='store_true',
                        help='Disable AI-powered analysis features')
+    parser.add_argument('--profile', action='store_true',
+                       help='Print per-check and per-fixer timing tables')
 
     # Fix-specific arguments
     parser.add_argument('--apply-fixes', action='store_true',
@@ -150,6 +400,11 @@ Examples:
     parser.add_argument('--skip-fixes', action='store_true',
                        help='Skip fix generation phase, only run analysis')
 
+    # Pipeline arguments
+    parser.add_argument('--in-process', action='store_true',
+                       help='Run both phases in this process over one in-memory copy of the docs '
+                            '(a dry-run fix preview runs concurrently with the analysis)')
+
     args = parser.parse_args()
 
     # Validate arguments
@@ -159,9 +414,6 @@ Examples:
     if args.skip_analysis and args.skip_fixes:
         parser.error("Cannot skip both analysis and fixes")
 
-    # Track overall success
-    overall_success = True
-
     # Create shared timestamped directory for all reports if no custom output specified
     if not args.output:
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
@@ -172,26 +424,6 @@ Examples:
         shared_output_dir = Path(args.output)
         shared_output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build base command arguments that both scripts share
-    base_args = []
-
-    if args.docs_path:
-        base_args.append(args.docs_path)
-    if args.repo_url:
-        base_args.extend(['--repo-url', args.repo_url])
-    if args.repo_type and args.repo_type != 'auto':
-        base_args.extend(['--repo-type', args.repo_type])
-    if args.repo_root:
-        base_args.extend(['--repo-root', args.repo_root])
-    if args.config:
-        base_args.extend(['--config', args.config])
-    if args.format:
-        base_args.extend(['--format', args.format])
-    # Always pass the shared output directory to both scripts
-    base_args.extend(['--output', str(shared_output_dir)])
-    if args.no_ai:
-        base_args.append('--no-ai')
-
     print(f"\n{'='*70}")
     print(f"🚀 UNIFIED DOCUMENTATION ANALYZER & FIXER")
     print(f"{'='*70}")
@@ -199,60 +431,13 @@ Examples:
     print(f"Format: {args.format}")
     print(f"AI Analysis: {'Disabled' if args.no_ai else 'Enabled'}")
     print(f"Fix Mode: {'Apply' if args.apply_fixes else 'Preview (dry-run)'}")
+    print(f"Pipeline: {'In-process' if args.in_process else 'Subprocesses'}")
     print(f"{'='*70}")
 
-    # Run analysis phase
-    if not args.skip_analysis:
-        analyzer_cmd = [sys.executable, 'doc_analyzer.py'] + base_args
-        success, output = run_command(analyzer_cmd, "Running Documentation Analysis")
-
-        if not success:
-            print("\n❌ Analysis phase failed!", file=sys.stderr)
-            overall_success = False
-            if not args.skip_fixes:
-                print("⚠️  Continuing with fix generation despite analysis errors...", file=sys.stderr)
+    if args.in_process:
+        overall_success = run_in_process(args, shared_output_dir)
     else:
-        print("\n⏭️  Skipping analysis phase (--skip-analysis flag)")
-
-    # Run fixer phase
-    if not args.skip_fixes:
-        # Build fixer-specific arguments (doc_fixer.py has different args)
-        fixer_cmd = [sys.executable, 'doc_fixer.py']
-
-        # Add path argument (required positional for fixer)
-        if args.docs_path:
-            fixer_cmd.append(args.docs_path)
-        elif args.repo_url:
-            # For remote repos, we need to use the local clone path
-            # The analyzer would have cloned it, so we can just use the repo name
-            import re
-            repo_name = re.sub(r'\.git$', '', args.repo_url.split('/')[-1])
-            fixer_cmd.append(f'./temp/{repo_name}')
-
-        # Add configuration file if specified
-        if args.config:
-            fixer_cmd.extend(['--config', args.config])
-
-        # Add format and output arguments (IMPORTANT: fixer needs same output dir)
-        if args.format:
-            fixer_cmd.extend(['--format', args.format])
-        fixer_cmd.extend(['--output', str(shared_output_dir)])
-
-        # Add fix-specific arguments
-        if not args.apply_fixes:
-            fixer_cmd.append('--dry-run')  # Default is dry-run
-
-        # Pass --no-ai flag to fixer if set (disables slow StyleGuideValidator)
-        if args.no_ai:
-            fixer_cmd.append('--no-ai')
-
-        success, output = run_command(fixer_cmd, "Running Documentation Fixer")
-
-        if not success:
-            print("\n❌ Fixer phase failed!", file=sys.stderr)
-            overall_success = False
-    else:
-        print("\n⏭️  Skipping fix generation phase (--skip-fixes flag)")
+        overall_success = run_subprocesses(args, shared_output_dir)
 
     # Summary
     print(f"\n{'='*70}")
@@ -6,6 +6,7 @@ from analyzers.mintlify_validator import MintlifyValidator
 from analyzers.semantic_analyzer import SemanticAnalyzer
 from analyzers.content_duplication import ContentDuplicationDetector
 from analyzers.user_journey import UserJourneyAnalyzer
+from analyzers.readability import ReadabilityAnalyzer
 
 __all__ = [
     'RepositoryManager',
@@ -14,4 +15,5 @@ __all__ = [
     'SemanticAnalyzer',
     'ContentDuplicationDetector',
     'UserJourneyAnalyzer',
+    'ReadabilityAnalyzer',
 ]
@@ -1,11 +1,16 @@
 """Content duplication detection"""
 
+import hashlib
 from pathlib import Path
-from typing import List
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+from dataclasses import dataclass, field
 from typing import Optional
 from difflib import SequenceMatcher
 
+from core.documents import read_text
+from utils import hashed_embeddings
+from utils.signature_index import SignatureIndex
+
 
 # Re-import Issue dataclass (will be in __init__.py)
 @dataclass
@@ -33,6 +38,20 @@ class Issue:
         }
 
 
+@dataclass
+class DuplicateCluster:
+    """Paragraphs that are identical after case and whitespace normalization"""
+    paragraph: str  # first occurrence
+    files: List[str] = field(default_factory=list)  # files containing it, in first-seen order
+    occurrences: int = 0  # copies, repeats within a file included
+    locations: List[Tuple[str, int]] = field(default_factory=list)  # (file, first line) of every copy
+    fingerprint: str = ''  # hex digest (see ContentDuplicationDetector.fingerprint)
+
+    def crosses_files_with(self, other: 'DuplicateCluster') -> bool:
+        """True unless both paragraphs occur only in the same single file"""
+        return len(self.files) > 1 or self.files != other.files
+
+
 class ContentDuplicationDetector:
     """Detect content duplication and redundancy"""
 
@@ -40,56 +59,266 @@ class ContentDuplicationDetector:
         self.config = config.get('duplication_detection', {})
         self.threshold = self.config.get('similarity_threshold', 0.8)
         self.enabled = self.config.get('enabled', True)
+        self.semantic = self.config.get('semantic', {})
+        self.index_path = self.config.get('index_path')  # persistent signature index (optional)
 
     def find_duplicates(self, files: List[Path], issues: List[Issue]):
         """Find duplicate or highly similar content"""
         if not self.enabled:
             return
 
-        print("\n🔍 Detecting content duplication...")
-
         # Extract paragraphs from all files
         file_paragraphs = {}
         for file_path in files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Extract paragraphs (2+ lines of text)
-                    paragraphs = [p.strip() for p in content.split('\n\n') if len(p.strip()) > 100]
-                    file_paragraphs[str(file_path)] = paragraphs
+                file_paragraphs[str(file_path)] = self.extract_paragraphs(read_text(file_path))
             except Exception:
                 continue
 
-        # Compare paragraphs across files
-        checked_pairs = set()
+        self.find_duplicates_in(file_paragraphs, issues)
+
+    @staticmethod
+    def extract_paragraphs(content: str) -> List[Tuple[int, str]]:
+        """
+        Paragraphs long enough to compare (over 100 characters)
+
+        Returns:
+            (first line number, paragraph) pairs
+        """
+        paragraphs = []
+        line = 1
+        for block in content.split('\n\n'):
+            paragraph = block.strip()
+            if len(paragraph) > 100:
+                leading = block[:len(block) - len(block.lstrip())]
+                paragraphs.append((line + leading.count('\n'), paragraph))
+            line += block.count('\n') + 2
+        return paragraphs
+
+    @staticmethod
+    def fingerprint(paragraph: str) -> bytes:
+        """Hash of a paragraph's casefolded, whitespace-collapsed text"""
+        normalized = ' '.join(paragraph.casefold().split())
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+
+    def find_exact_duplicates(self, file_paragraphs: Dict[str, List[Tuple[int, str]]]) -> List[DuplicateCluster]:
+        """
+        Group identical paragraphs in one pass over their fingerprints
+
+        Args:
+            file_paragraphs: Paragraphs per file (see extract_paragraphs)
+
+        Returns:
+            One cluster per distinct paragraph, in first-seen order
+        """
+        clusters: Dict[bytes, DuplicateCluster] = {}
+        for file_path, paragraphs in file_paragraphs.items():
+            for line, paragraph in paragraphs:
+                key = self.fingerprint(paragraph)
+                cluster = clusters.get(key)
+                if cluster is None:
+                    cluster = clusters[key] = DuplicateCluster(paragraph, fingerprint=key.hex())
+                if file_path not in cluster.files:
+                    cluster.files.append(file_path)
+                cluster.occurrences += 1
+                cluster.locations.append((file_path, line))
+        return list(clusters.values())
+
+    def find_duplicates_in(self, file_paragraphs: Dict[str, List[Tuple[int, str]]], issues: List[Issue]):
+        """
+        Find duplicates among already extracted paragraphs
+
+        Identical paragraphs are grouped first and only one copy of each is
+        compared with SequenceMatcher (and, when semantic is enabled, by
+        embedding similarity to catch reworded copies). Similar pairs are
+        merged into connected components as they are found, and each
+        component that spans more than one file is reported once.
+
+        With index_path set, SequenceMatcher only checks MinHash/LSH
+        candidates of paragraphs not seen in an earlier run; matches among
+        unchanged paragraphs come from the saved index.
+
+        Each issue points at the first file (by path) and lists every
+        copy's file:line in its suggestion.
+
+        Args:
+            file_paragraphs: Paragraphs per file (see extract_paragraphs)
+            issues: List to append duplicate_content issues to
+        """
+        if not self.enabled:
+            return
+
+        print("\n🔍 Detecting content duplication...")
+
+        clusters = self.find_exact_duplicates(file_paragraphs)
+
+        # Compare paragraphs across files, joining similar ones into components
+        components = _UnionFind(len(clusters))
+        if self.index_path:
+            self._join_indexed(file_paragraphs, clusters, components)
+        else:
+            for i, j in self._cross_file_pairs(clusters):
+                similarity = self._calculate_similarity(clusters[i].paragraph, clusters[j].paragraph)
+                if similarity >= self.threshold:
+                    components.union(i, j, similarity)
+
+        if self.semantic.get('enabled', False):
+            self._join_reworded(clusters, components)
 
-        for file1, paras1 in file_paragraphs.items():
-            for file2, paras2 in file_paragraphs.items():
+        for members in components.groups():
+            files = sorted({f for i in members for f in clusters[i].files})
+            if len(files) < 2:
+                continue
+
+            locations = sorted({location for i in members for location in clusters[i].locations})
+            copies = sum(clusters[i].occurrences for i in members)
+            if len(members) == 1:
+                description = f'Identical paragraph in {len(files)} files ({copies} copies)'
+            else:
+                low, high = components.similarity(members[0])
+                matches = f'{int(low*100)}%' if int(low*100) == int(high*100) else f'{int(low*100)}-{int(high*100)}%'
+                kind = 'Reworded duplicate' if components.is_reworded(members[0]) else 'Highly similar'
+                description = f'{kind} content in {len(files)} files ({copies} paragraphs, {matches} similar)'
+
+            issues.append(Issue(
+                severity='medium',
+                category='gaps',
+                file_path=files[0],
+                line_number=locations[0][1],
+                issue_type='duplicate_content',
+                description=description,
+                suggestion=('Consider consolidating or cross-referencing instead of duplicating: '
+                            + ', '.join(f'{file_path}:{line}' for file_path, line in locations)),
+                context=clusters[members[0]].paragraph[:100] + '...'
+            ))
+
+    @staticmethod
+    def _cross_file_pairs(clusters: List[DuplicateCluster]) -> Iterator[Tuple[int, int]]:
+        """Each pair of clusters that crosses files once (see DuplicateCluster.crosses_files_with)"""
+        by_file: Dict[str, List[int]] = {}
+        shared = []  # clusters in several files pair with every other cluster
+        for i, cluster in enumerate(clusters):
+            if len(cluster.files) == 1:
+                by_file.setdefault(cluster.files[0], []).append(i)
+            else:
+                shared.append(i)
+
+        for file1, clusters1 in by_file.items():
+            for file2, clusters2 in by_file.items():
                 if file1 >= file2:  # Skip self and already checked pairs
                     continue
+                for i in clusters1:
+                    for j in clusters2:
+                        yield i, j
 
-                pair_key = (file1, file2)
-                if pair_key in checked_pairs:
-                    continue
-                checked_pairs.add(pair_key)
-
-                # Compare paragraphs
-                for i, p1 in enumerate(paras1):
-                    for j, p2 in enumerate(paras2):
-                        similarity = self._calculate_similarity(p1, p2)
-
-                        if similarity >= self.threshold:
-                            issues.append(Issue(
-                                severity='medium',
-                                category='gaps',
-                                file_path=f'{file1} & {file2}',
-                                line_number=None,
-                                issue_type='duplicate_content',
-                                description=f'Highly similar content detected ({int(similarity*100)}% similar)',
-                                suggestion='Consider consolidating or cross-referencing instead of duplicating',
-                                context=p1[:100] + '...'
-                            ))
+        single = [i for clusters1 in by_file.values() for i in clusters1]
+        for k, i in enumerate(shared):
+            for j in single + shared[k + 1:]:
+                yield i, j
+
+    def _join_indexed(self, file_paragraphs: Dict[str, List[Tuple[int, str]]], clusters: List[DuplicateCluster],
+                      components: '_UnionFind'):
+        """Join similar paragraphs using (and updating) the saved signature index"""
+        index = SignatureIndex.load_or_new(self.index_path, threshold=self.threshold)
+        changed_files = index.update_files({file_path: [paragraph for _, paragraph in paragraphs]
+                                            for file_path, paragraphs in file_paragraphs.items()})
+        position = {cluster.fingerprint: i for i, cluster in enumerate(clusters)}
+        reused = len(index.matches)
+
+        # With no file changed, every paragraph and match is already indexed
+        new = []
+        if changed_files:
+            index.retain(set(position))
+            reused = len(index.matches)
+
+            # Sign new paragraphs and verify their candidates; earlier ones are already indexed
+            new = [i for i, cluster in enumerate(clusters) if cluster.fingerprint not in index.signatures]
+            for i in new:
+                signature = index.signature(clusters[i].paragraph)
+                for other in sorted(index.candidates(signature)):
+                    similarity = self._calculate_similarity(clusters[i].paragraph,
+                                                            clusters[position[other]].paragraph)
+                    if similarity >= self.threshold:
+                        index.matches[(other, clusters[i].fingerprint)] = similarity
+                index.add(clusters[i].fingerprint, signature)
+
+        for (first, second), similarity in index.matches.items():
+            i, j = position[first], position[second]
+            if clusters[i].crosses_files_with(clusters[j]):
+                components.union(i, j, similarity)
+
+        if changed_files:
+            try:
+                index.save(self.index_path)
+            except OSError as e:
+                print(f"   ⚠️  Could not save duplicate index {self.index_path}: {e}")
+        print(f"   Signature index: {len(new)} new paragraphs in {len(changed_files)} changed files, "
+              f"{reused} saved matches reused")
+
+    def _join_reworded(self, clusters: List[DuplicateCluster], components: '_UnionFind'):
+        """Join paragraphs whose hashed TF-IDF embeddings are close but whose text differs"""
+        if not hashed_embeddings.NUMPY_AVAILABLE:
+            print("   ⚠️  Semantic duplicate detection needs numpy (pip install numpy), skipping")
+            return
+
+        embedder = hashed_embeddings.HashedEmbedder(self.semantic.get('dimensions', 256))
+        vectors = embedder.embed([cluster.paragraph for cluster in clusters])
+        # Rows of one file share a group; a paragraph in several files gets a group of its own
+        file_ids: Dict[str, int] = {}
+        groups = [file_ids.setdefault(cluster.files[0], len(file_ids)) if len(cluster.files) == 1 else -1 - i
+                  for i, cluster in enumerate(clusters)]
+
+        for i, j, similarity in hashed_embeddings.similar_pairs(
+                vectors, self.semantic.get('similarity_threshold', 0.5),
+                top_k=self.semantic.get('top_k', 5), block_size=self.semantic.get('block_size', 1024),
+                groups=groups):
+            if components.find(i) != components.find(j):
+                components.union(i, j, similarity, reworded=True)
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate text similarity ratio"""
         return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+
+
+class _UnionFind:
+    """Disjoint sets of 0..n-1 that also track the similarity range of each set's joins"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+        self.low: List[Optional[float]] = [None] * size
+        self.high: List[Optional[float]] = [None] * size
+        self.reworded = [False] * size  # joined by embedding similarity
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int, similarity: float, reworded: bool = False):
+        i, j = self.find(i), self.find(j)
+        if self.size[i] < self.size[j]:
+            i, j = j, i
+        if i != j:
+            self.parent[j] = i
+            self.size[i] += self.size[j]
+        self.reworded[i] = self.reworded[i] or self.reworded[j] or reworded
+        self.low[i] = min(v for v in (self.low[i], self.low[j], similarity) if v is not None)
+        self.high[i] = max(v for v in (self.high[i], self.high[j], similarity) if v is not None)
+
+    def similarity(self, i: int) -> Tuple[float, float]:
+        """(lowest, highest) similarity of the joins in i's set"""
+        root = self.find(i)
+        return self.low[root], self.high[root]
+
+    def is_reworded(self, i: int) -> bool:
+        return self.reworded[self.find(i)]
+
+    def groups(self) -> List[List[int]]:
+        """Members of each set, ordered by their smallest member"""
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(self.parent)):
+            groups.setdefault(self.find(i), []).append(i)
+        return list(groups.values())
@@ -1,9 +1,10 @@
 """MDX file parser for extracting frontmatter and components"""
 
 import re
-import yaml
 from typing import Tuple, Optional, List
 
+from utils.frontmatter import read_frontmatter
+
 
 class MDXParser:
     """Parse MDX files and extract frontmatter"""
@@ -11,20 +12,10 @@ class MDXParser:
     @staticmethod
     def parse_frontmatter(content: str) -> Tuple[Optional[dict], str]:
         """Extract YAML frontmatter and content"""
-        if not content.startswith('---'):
-            return None, content
-
-        # Find end of frontmatter
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            return None, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1])
-            content_body = parts[2]
-            return frontmatter, content_body
-        except yaml.YAMLError:
+        frontmatter = read_frontmatter(content)
+        if frontmatter is None:
             return None, content
+        return frontmatter.data, frontmatter.body(content)
 
     @staticmethod
     def extract_components(content: str) -> List[Tuple[str, int]]:
@@ -8,6 +8,7 @@ from typing import Optional
 # Import from parent package
 from analyzers.mdx_parser import MDXParser
 from analyzers.repository_manager import RepositoryManager
+from utils.frontmatter import read_frontmatter
 
 
 # Re-import Issue dataclass (will be in __init__.py)
@@ -56,7 +57,9 @@ class MintlifyValidator:
         if not file_path.endswith('.mdx'):
             return
 
-        frontmatter, _ = MDXParser.parse_frontmatter(content)
+        # Only the parsed block is needed; skip copying the body
+        block = read_frontmatter(content)
+        frontmatter = block.data if block else None
 
         # Check if frontmatter exists (critical for MDX)
         if frontmatter is None:
@@ -0,0 +1,379 @@
+"""Corpus-wide readability metrics"""
+
+import bisect
+import importlib.util
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Optional dependency: vectorizes the corpus-wide scores when installed.
+# Imported by ReadabilityScores, not here, to keep CLI startup fast.
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+# Below this many paragraphs the pure-Python scores are faster than
+# importing numpy (~0.1 s); numpy saves ~1 us per paragraph after that.
+VECTORIZE_MIN_PARAGRAPHS = 100_000
+
+
+# Re-import Issue dataclass (will be in __init__.py)
+@dataclass
+class Issue:
+    """Represents a documentation issue"""
+    severity: str  # 'critical', 'high', 'medium', 'low'
+    category: str  # 'clarity', 'ia', 'consistency', 'style', 'gaps', 'ux', 'mintlify'
+    file_path: str
+    line_number: Optional[int]
+    issue_type: str
+    description: str
+    suggestion: str
+    context: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'severity': self.severity,
+            'category': self.category,
+            'file': self.file_path,
+            'line': self.line_number,
+            'type': self.issue_type,
+            'description': self.description,
+            'suggestion': self.suggestion,
+            'context': self.context
+        }
+
+
+# (first line, words, sentences, syllables) of one paragraph
+ParagraphCounts = Tuple[int, int, int, int]
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])["\')\]]*\s+(?=["\'(\[]?[A-Z0-9])')
+_WORD = re.compile(r"[A-Za-z]+(?:['’-][A-Za-z]+)*|\d+(?:[.,]\d+)*")
+_VOWEL_GROUP = re.compile(r'[aeiouy]+')
+_MARKDOWN_LINK = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+_HTML_TAG = re.compile(r'<[^>]+>')
+_NON_PROSE = ('#', '<', '|', '>', '-', '*', '+', 'import ', 'export ', '{')
+_LIST_ITEM = re.compile(r'^\d+[.)]\s')
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Heuristic English syllable count (vowel groups, silent final e)"""
+    word = word.lower()
+    if word.isdigit():
+        return 1
+    count = len(_VOWEL_GROUP.findall(word))
+    if word.endswith('e') and not word.endswith(('le', 'ee', 'ye')) and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split prose into sentences on terminal punctuation followed by a capital"""
+    return [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+
+
+def _clean(line: str) -> str:
+    return _HTML_TAG.sub(' ', _MARKDOWN_LINK.sub(r'\1', line))
+
+
+def _body_start(lines: List[str]) -> int:
+    """Index of the first line after the frontmatter"""
+    if lines and lines[0].strip() == '---':
+        for i in range(1, len(lines)):
+            if lines[i].strip() == '---':
+                return i + 1
+    return 0
+
+
+def _is_prose(stripped: str) -> bool:
+    return bool(stripped) and not stripped.startswith(_NON_PROSE) and not _LIST_ITEM.match(stripped)
+
+
+def prose_paragraphs(content: str) -> List[Tuple[int, str]]:
+    """
+    Prose paragraphs of a Markdown/MDX file
+
+    Frontmatter, fenced code, headings, lists, tables, quotes and MDX
+    component lines are skipped; inline links and tags are reduced to
+    their text.
+
+    Returns:
+        (first line number, paragraph text) pairs
+    """
+    lines = content.split('\n')
+    paragraphs = []
+    current: List[str] = []
+    first_line = 0
+    in_code_block = False
+
+    def flush():
+        if current:
+            paragraphs.append((first_line, ' '.join(current)))
+            current.clear()
+
+    for i in range(_body_start(lines), len(lines)):
+        stripped = lines[i].strip()
+        if stripped.startswith('```'):
+            in_code_block = not in_code_block
+            flush()
+            continue
+        if in_code_block or not _is_prose(stripped):
+            flush()
+            continue
+        if not current:
+            first_line = i + 1
+        current.append(_clean(stripped))
+    flush()
+    return paragraphs
+
+
+def _count(words: List[str], text: str) -> Tuple[int, int]:
+    """(sentences, syllables) of a paragraph"""
+    return max(len(split_sentences(text)), 1), sum(count_syllables(word) for word in words)
+
+
+def score_paragraphs(content: str, min_words: int = 20) -> List[ParagraphCounts]:
+    """
+    Word, sentence and syllable counts of every prose paragraph
+
+    Args:
+        content: File content
+        min_words: Shorter paragraphs are skipped (their scores are noise)
+    """
+    counts = []
+    for line, text in prose_paragraphs(content):
+        words = _WORD.findall(text.replace('`', ''))
+        if len(words) < max(min_words, 1):
+            continue
+        counts.append((line, len(words)) + _count(words, text))
+    return counts
+
+
+@lru_cache(maxsize=32)
+def _term_pattern(terms: Tuple[str, ...]) -> Optional['re.Pattern']:
+    """One case-insensitive pattern matching any of terms as a whole word"""
+    if not terms:
+        return None
+    return re.compile('|'.join(rf'\b{re.escape(term)}\b' for term in terms), re.IGNORECASE)
+
+
+@dataclass
+class ReadabilityScan:
+    """Everything the per-file readability checks need, from one pass over the file"""
+    paragraphs: List[ParagraphCounts] = field(default_factory=list)  # at least min_words long
+    long_lines: List[Tuple[int, str]] = field(default_factory=list)  # (line, text)
+    long_sentences: List[Tuple[int, int, str]] = field(default_factory=list)  # (first line, words, sentence)
+    weak_terms: List[Tuple[int, str, str]] = field(default_factory=list)  # (line, term, text)
+
+
+def scan_file(content: str, min_words: int = 20, max_line_length: int = 100,
+              max_sentence_words: int = 30, avoid_terms: Sequence[str] = ()) -> ReadabilityScan:
+    """
+    Paragraph counts, long lines, long sentences and weak words of a file
+
+    Line checks cover every line outside code blocks except headings;
+    paragraphs and sentences are those of prose_paragraphs, and each
+    sentence is reported at the line it starts on.
+    """
+    scan = ReadabilityScan()
+    lines = content.split('\n')
+    body_start = _body_start(lines)
+    avoid_terms = tuple(avoid_terms)
+    weak = _term_pattern(avoid_terms)
+
+    current: List[str] = []
+    offsets: List[int] = []  # where each line of current starts in the joined text
+    first_line = 0
+    in_code_block = False
+
+    def flush():
+        if not current:
+            return
+        text = ' '.join(current)
+        words = _WORD.findall(text.replace('`', ''))
+        if len(words) > max_sentence_words:
+            start = 0
+            for sentence in split_sentences(text):
+                start = text.index(sentence, start)
+                count = len(_WORD.findall(sentence.replace('`', '')))
+                if count > max_sentence_words:
+                    line = first_line + bisect.bisect_right(offsets, start) - 1
+                    scan.long_sentences.append((line, count, sentence))
+                start += len(sentence)
+        if len(words) >= max(min_words, 1):
+            scan.paragraphs.append((first_line, len(words)) + _count(words, text))
+        current.clear()
+        offsets.clear()
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            in_code_block = not in_code_block
+            flush()
+            continue
+        if in_code_block:
+            continue
+
+        if not stripped.startswith('#'):
+            if len(line) > max_line_length and not stripped.startswith('http'):
+                scan.long_lines.append((i + 1, line))
+            if weak is not None and weak.search(line):
+                scan.weak_terms.extend(
+                    (i + 1, term, stripped) for term in avoid_terms
+                    if re.search(rf'\b{re.escape(term)}\b', line, re.IGNORECASE))
+
+        if i < body_start or not _is_prose(stripped):
+            flush()
+            continue
+        if not current:
+            first_line = i + 1
+        offsets.append(offsets[-1] + len(current[-1]) + 1 if current else 0)
+        current.append(_clean(stripped))
+    flush()
+    return scan
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile (numpy.percentile's default method)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class ReadabilityScores:
+    """
+    Paragraph scores of a whole documentation set, one array per metric
+
+    Flesch reading ease = 206.835 - 1.015 * words/sentence - 84.6 * syllables/word
+    Flesch-Kincaid grade = 0.39 * words/sentence + 11.8 * syllables/word - 15.59
+    """
+
+    def __init__(self, file_counts: Dict[str, Sequence[ParagraphCounts]]):
+        self.locations = [(path, row[0]) for path, rows in file_counts.items() for row in rows]
+        columns = [row[1:] for rows in file_counts.values() for row in rows]
+        self._np = None
+        if NUMPY_AVAILABLE and len(columns) >= VECTORIZE_MIN_PARAGRAPHS:
+            import numpy as np
+            self._np = np
+            counts = np.array(columns, dtype=float).reshape(-1, 3)
+            words, sentences, syllables = counts[:, 0], counts[:, 1], counts[:, 2]
+            self.words_per_sentence = words / sentences
+            self.syllables_per_word = syllables / words
+            self.reading_ease = 206.835 - 1.015 * self.words_per_sentence - 84.6 * self.syllables_per_word
+            self.grade_level = 0.39 * self.words_per_sentence + 11.8 * self.syllables_per_word - 15.59
+        else:
+            self.words_per_sentence = [words / sentences for words, sentences, _ in columns]
+            self.syllables_per_word = [syllables / words for words, _, syllables in columns]
+            self.reading_ease = [206.835 - 1.015 * wps - 84.6 * spw
+                                 for wps, spw in zip(self.words_per_sentence, self.syllables_per_word)]
+            self.grade_level = [0.39 * wps + 11.8 * spw - 15.59
+                                for wps, spw in zip(self.words_per_sentence, self.syllables_per_word)]
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def percentile(self, metric: str, q: float) -> float:
+        """Percentile q (0-100) of one metric over every paragraph"""
+        values = getattr(self, metric)
+        if not len(values):
+            return 0.0
+        if self._np is not None:
+            return float(self._np.percentile(values, q))
+        return _percentile(values, q)
+
+    def above(self, metric: str, threshold: float) -> List[int]:
+        """Indexes of paragraphs whose metric exceeds threshold"""
+        values = getattr(self, metric)
+        if self._np is not None:
+            return self._np.flatnonzero(values > threshold).tolist()
+        return [i for i, value in enumerate(values) if value > threshold]
+
+    def summary(self) -> Dict[str, Any]:
+        """Corpus distribution of the headline metrics"""
+        if not len(self):
+            return {}
+        return {
+            'paragraphs': len(self),
+            'grade_level': {
+                'p50': round(self.percentile('grade_level', 50), 1),
+                'p90': round(self.percentile('grade_level', 90), 1),
+            },
+            'reading_ease_p50': round(self.percentile('reading_ease', 50), 1),
+            'words_per_sentence_p50': round(self.percentile('words_per_sentence', 50), 1),
+        }
+
+
+class ReadabilityAnalyzer:
+    """Flag paragraphs that are hard to read relative to the rest of the doc set"""
+
+    def __init__(self, config: dict):
+        self.config = config.get('readability', {})
+        self.enabled = self.config.get('enabled', True)
+        self.min_words = self.config.get('min_paragraph_words', 20)
+        self.grade_percentile = self.config.get('grade_percentile', 95)
+        self.min_grade_level = self.config.get('min_grade_level', 12)
+        style_rules = config.get('style_rules', {})
+        self.max_line_length = style_rules.get('max_line_length', 100)
+        self.max_sentence_words = style_rules.get('max_sentence_length', 30)
+        self.avoid_terms = tuple(style_rules.get('avoid_terms', []))
+        self._last: Optional[Tuple[str, ReadabilityScan]] = None
+
+    def scan(self, content: str) -> ReadabilityScan:
+        """
+        Scan one file (see scan_file)
+
+        The last scan is kept, so the per-file checks and score share one
+        pass over the same content.
+        """
+        if self._last is not None and self._last[0] is content:
+            return self._last[1]
+        scan = scan_file(content, self.min_words, self.max_line_length,
+                         self.max_sentence_words, self.avoid_terms)
+        self._last = (content, scan)
+        return scan
+
+    def score(self, content: str) -> List[ParagraphCounts]:
+        """Per-paragraph counts of one file (empty when disabled)"""
+        return self.scan(content).paragraphs if self.enabled else []
+
+    def analyze(self, file_counts: Dict[str, Sequence[ParagraphCounts]], issues: List[Issue]) -> Dict[str, Any]:
+        """
+        Score every paragraph and flag the outliers
+
+        A paragraph is flagged when its Flesch-Kincaid grade is above both
+        the configured percentile of the doc set and min_grade_level.
+
+        Args:
+            file_counts: Paragraph counts per file (see score)
+            issues: List to append hard_to_read issues to
+
+        Returns:
+            Corpus summary (see ReadabilityScores.summary)
+        """
+        if not self.enabled:
+            return {}
+
+        scores = ReadabilityScores(file_counts)
+        if not len(scores):
+            return {}
+
+        print("\n📖 Scoring readability...")
+        threshold = max(scores.percentile('grade_level', self.grade_percentile), self.min_grade_level)
+        for i in scores.above('grade_level', threshold):
+            file_path, line = scores.locations[i]
+            issues.append(Issue(
+                severity='low',
+                category='clarity',
+                file_path=file_path,
+                line_number=line,
+                issue_type='hard_to_read',
+                description=(f'Paragraph reads at grade {float(scores.grade_level[i]):.1f} '
+                             f'(Flesch-Kincaid; {float(scores.words_per_sentence[i]):.0f} words/sentence), '
+                             f'above {threshold:.1f} for this doc set'),
+                suggestion='Use shorter sentences and simpler words'
+            ))
+
+        return scores.summary()
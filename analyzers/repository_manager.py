@@ -2,15 +2,12 @@
 
 import json
 import hashlib
+import importlib.util
 from pathlib import Path
 from typing import List
 
-# Try to import optional dependencies
-try:
-    import git
-    GIT_AVAILABLE = True
-except ImportError:
-    GIT_AVAILABLE = False
+# Optional dependency, imported only when a remote repository is cloned
+GIT_AVAILABLE = importlib.util.find_spec('git') is not None
 
 
 class RepositoryManager:
@@ -97,7 +94,8 @@ class RepositoryManager:
             if not should_exclude:
                 filtered_files.append(file)
 
-        return filtered_files
+        # Sorted so runs (and shards) see files in the same order on every filesystem
+        return sorted(filtered_files)
 
     def clone_remote_repo(self) -> Path:
         """Clone remote repository if configured"""
@@ -105,6 +103,8 @@ class RepositoryManager:
         if not remote_config.get('enabled') or not GIT_AVAILABLE:
             return self.repo_path
 
+        import git
+
         url = remote_config.get('url')
         branch = remote_config.get('branch', 'main')
 
@@ -5,10 +5,14 @@ import re
 import json
 import time
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
 from typing import Optional
-import anthropic
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.chunking import Chunk, chunk_document, dedupe_issues, estimate_tokens
+from utils.ai_telemetry import AITelemetry
+from utils.prompt_cache import cached_system_prompt
 
 
 # Import sanitize function from parent
@@ -65,6 +69,93 @@ class Issue:
         }
 
 
+# Fixed instruction prefix for clarity requests, sent as a cached system prompt.
+# Only the file content varies per request, so it goes in the user message.
+# The rubric and example keep it above the default model's cache minimum.
+CLARITY_SYSTEM_PROMPT = """You are a technical documentation analyst. Analyze the documentation you are given for clarity issues using evidence-based criteria.
+
+Apply these research-backed principles:
+
+1. **Cognitive Load (Nielsen Norman Group)**: Identify sentences >25 words that increase cognitive load
+2. **Information Scent (Pirolli & Card)**: Find unclear headings that don't indicate content
+3. **Progressive Disclosure**: Spot missing prerequisite information or context
+4. **Plain Language (plainlanguage.gov)**: Flag jargon/acronyms undefined on first use
+5. **Task-Oriented Writing (Redish)**: Identify ambiguous instructions lacking concrete steps
+
+Rubric for each issue_type:
+
+- **cognitive_load**: A sentence over 25 words, or one that stacks several conditions, clauses or parentheticals so the reader must hold them all at once. Do not flag long code samples, tables, URLs or lists of option names. Fix by splitting into one idea per sentence or turning a sequence into a numbered list.
+  Example: "If you are using the streaming endpoint and have enabled tool use, which requires the beta header, you should make sure that your client handles partial JSON before it attempts to parse the tool input." → "Streaming with tool use needs the beta header. Your client must also handle partial JSON before it parses the tool input."
+- **unclear_heading**: A heading that does not tell readers what the section contains or what they will be able to do, such as "Overview", "More details", "Other", "Notes" or a bare product name. Fix with a heading that names the task or concept: "Set up authentication", "How prompt caching works".
+  Example: "## Advanced" → "## Stream responses over server-sent events"
+- **missing_context**: The text assumes something the page never establishes: an installed SDK, an API key, an earlier step, a required account tier, or where a value comes from. Do not flag context that an earlier section of the same content already provides. Fix by adding a prerequisite sentence or a link to the setup page.
+  Example: "Now pass your key to the client." → "Pass the API key you created in the Console (Settings → API keys) to the client."
+- **undefined_jargon**: An acronym, internal name or specialist term used before it is defined or linked. Common terms for the audience (API, JSON, HTTP, SDK, CLI) do not need definitions. Fix by defining the term on first use or linking to its glossary entry.
+  Example: "Enable TTFT logging to debug latency." → "Enable time-to-first-token (TTFT) logging to see how long the first streamed token takes."
+- **ambiguous_instruction**: A step that says what to achieve but not how: "configure the client appropriately", "update your settings", "make sure it works". Fix with the concrete action, the exact parameter or value, and where to make the change.
+  Example: "Configure the timeout appropriately." → "Set `timeout=60` when you create the client to allow for long responses."
+
+Severity guide:
+- critical: readers cannot complete the task or will do it wrong (a missing required step, an instruction with no concrete action)
+- high: readers will likely stall, misread or need to search elsewhere
+- medium: the text works but costs readers extra effort
+
+Only report problems you can quote from the content. Do not report spelling, formatting, link or code-style problems; other checks cover those.
+
+For EVERY issue found (prioritize by severity, but include ALL), provide:
+
+{
+  "line_number": <exact line number, counting the first line of the content as 1>,
+  "quoted_text": "<exact text with issue>",
+  "issue_type": "<specific issue: cognitive_load | unclear_heading | missing_context | undefined_jargon | ambiguous_instruction>",
+  "severity": "<critical | high | medium based on user impact>",
+  "evidence": "<research principle violated and why it matters>",
+  "user_impact": "<specific consequence for reader: 'Users cannot...' or 'Developers will...')>",
+  "fix_approach": "<what strategy to use: simplify, split, define, add context, etc>",
+  "before": "<quoted problematic text>",
+  "after": "<concrete rewrite example>",
+  "citation": "<principle: Nielsen Norman Group, Google Dev Docs Style, etc>"
+}
+
+When the content holds several files, each wrapped in <file path="..."> ... </file>, analyze every file independently, add a "file" field with the path exactly as given, and count line_number from the first line of that file.
+
+Example response for content with one overloaded sentence on line 12 and an undefined acronym on line 20:
+
+[
+  {
+    "line_number": 12,
+    "quoted_text": "Before you can send requests you need to make sure that your workspace has been provisioned and that the key you generated has permission to call the endpoint you are using.",
+    "issue_type": "cognitive_load",
+    "severity": "high",
+    "evidence": "Cognitive Load: 33 words holding three separate requirements in one sentence",
+    "user_impact": "Users will miss one of the requirements and get permission errors",
+    "fix_approach": "split",
+    "before": "Before you can send requests you need to make sure that your workspace has been provisioned...",
+    "after": "Before you send requests, check that your workspace is provisioned. Your API key also needs permission for this endpoint.",
+    "citation": "Nielsen Norman Group"
+  },
+  {
+    "line_number": 20,
+    "quoted_text": "Watch the ITPM limit when batching.",
+    "issue_type": "undefined_jargon",
+    "severity": "medium",
+    "evidence": "Plain Language: acronym used without definition on first use",
+    "user_impact": "Developers will not know which rate limit to monitor",
+    "fix_approach": "define",
+    "before": "Watch the ITPM limit when batching.",
+    "after": "Watch the input tokens per minute (ITPM) rate limit when batching.",
+    "citation": "plainlanguage.gov"
+  }
+]
+
+If there are no issues, return an empty array: []
+
+Prioritize issues by user impact. Return ONLY valid JSON array."""
+
+# Upper bound on max_tokens for a packed multi-file request
+PACKED_MAX_OUTPUT_TOKENS = 8000
+
+
 class SemanticAnalyzer:
     """AI-powered semantic analysis using Claude"""
 
@@ -81,65 +172,182 @@ class SemanticAnalyzer:
         self.model = os.getenv('CLAUDE_MODEL') or self.config.get('default_model', 'claude-sonnet-4-5-20250929')
         self.max_tokens = int(os.getenv('AI_MAX_TOKENS', '2000'))
 
+        # Long files are split into chunks of this many (estimated) tokens
+        self.chunk_tokens = int(os.getenv('AI_CHUNK_TOKENS', '2000'))
+        self.max_workers = int(os.getenv('PARALLEL_THREADS') or config.get('analysis', {}).get('parallel_threads', 4))
+
+        # Small-file request packing (see analyze_clarity_batch)
+        analysis_config = config.get('analysis', {})
+        self.pack_small_files = os.getenv(
+            'AI_PACK_SMALL_FILES', str(analysis_config.get('pack_small_files', True))
+        ).lower() in ('true', '1', 'yes')
+        self.pack_tokens = int(os.getenv('AI_PACK_TOKENS', '6000'))
+        self.pack_file_tokens = int(os.getenv('AI_PACK_FILE_TOKENS', '1000'))
+
+        # Per-run call telemetry; cache_stats holds the cache read/write totals
+        self.telemetry = AITelemetry('semantic_analyzer')
+        self.cache_stats = self.telemetry.cache
+
         # Load API key from environment
         api_key = os.getenv('ANTHROPIC_API_KEY')
         if api_key and ai_enabled_env and ai_enabled_config:
+            import anthropic  # Heavy import; only needed when AI analysis runs
             self.claude_client = anthropic.Anthropic(api_key=api_key)
 
         self.enabled = self.claude_client is not None
 
     def analyze_clarity(self, file_path: str, content: str, issues: List[Issue]):
-        """AI-powered clarity analysis with evidence-based recommendations"""
+        """
+        AI-powered clarity analysis with evidence-based recommendations
+
+        Long files are split at heading/paragraph boundaries into chunks that
+        fit the token budget and analyzed concurrently, so the whole file is
+        covered rather than only its first lines.
+        """
         if not self.enabled:
             return
 
-        max_retries = 3
-        base_delay = 2  # seconds
-
-        for attempt in range(max_retries):
-            try:
-                # Sample and sanitize content to stay within limits and prevent JSON errors
-                lines = content.split('\n')
-                sample = '\n'.join(lines[:200])  # First 200 lines
-                sample = sanitize_content_for_ai(sample)  # Sanitize before sending
-
-                prompt = f"""You are a technical documentation analyst. Analyze this documentation for clarity issues using evidence-based criteria.
+        chunks = chunk_document(content, self.chunk_tokens)
+
+        if len(chunks) == 1:
+            chunk_results = [self._analyze_clarity_chunk(file_path, chunks[0], 1)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                chunk_results = list(executor.map(
+                    lambda chunk: self._analyze_clarity_chunk(file_path, chunk, len(chunks)),
+                    chunks
+                ))
+
+        merged = [issue for chunk_issues in chunk_results for issue in chunk_issues]
+        issues.extend(dedupe_issues(merged))
+
+    def packable(self, content: str) -> bool:
+        """True if analyze_clarity_batch would pack this file with others"""
+        return self.pack_small_files and estimate_tokens(content) <= self.pack_file_tokens
+
+    def analyze_clarity_batch(self, files: List[Tuple[str, str]], issues: List[Issue]):
+        """
+        Clarity analysis for many files with small-file request packing
+
+        Files at or below pack_file_tokens are bin-packed (first-fit
+        decreasing) into shared requests of up to pack_tokens, each file
+        labeled in the prompt, and the response is split back into per-file
+        issues. Larger files, and bins that end up holding a single file, use
+        the regular single-file path. All requests run concurrently.
+
+        Args:
+            files: (file_path, content) pairs
+            issues: List to append issues to
+        """
+        if not self.enabled or not files:
+            return
 
-Documentation file: {file_path}
+        single = []
+        small = []
+        for file_path, content in files:
+            if self.packable(content):
+                small.append((file_path, content, estimate_tokens(content)))
+            else:
+                single.append((file_path, content))
+
+        bins = []  # [used_tokens, [(file_path, content), ...]]
+        for file_path, content, tokens in sorted(small, key=lambda f: f[2], reverse=True):
+            for pack in bins:
+                if pack[0] + tokens <= self.pack_tokens:
+                    pack[0] += tokens
+                    pack[1].append((file_path, content))
+                    break
+            else:
+                bins.append([tokens, [(file_path, content)]])
+
+        packed = []
+        for _, members in bins:
+            if len(members) == 1:
+                single.append(members[0])
+            else:
+                packed.append(members)
+
+        if packed:
+            print(f"  📦 Packed {sum(len(p) for p in packed)} small files into {len(packed)} AI requests")
+
+        def run_single(item):
+            file_issues = []
+            self.analyze_clarity(item[0], item[1], file_issues)
+            return file_issues
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._analyze_clarity_packed, members) for members in packed]
+            futures += [executor.submit(run_single, item) for item in single]
+            for future in futures:
+                issues.extend(future.result())
+
+    def _analyze_clarity_chunk(self, file_path: str, chunk: Chunk, total_chunks: int) -> List[Issue]:
+        """Run the clarity prompt on one chunk and map line numbers back to the file"""
+        # Sanitize content to prevent JSON errors
+        sample = sanitize_content_for_ai(chunk.text)
+        location = f" (lines {chunk.start_line}-{chunk.end_line})" if total_chunks > 1 else ""
+
+        prompt = f"""Documentation file: {file_path}{location}
 
 Content:
-{sample}
-
-Apply these research-backed principles:
-
-1. **Cognitive Load (Nielsen Norman Group)**: Identify sentences >25 words that increase cognitive load
-2. **Information Scent (Pirolli & Card)**: Find unclear headings that don't indicate content
-3. **Progressive Disclosure**: Spot missing prerequisite information or context
-4. **Plain Language (plainlanguage.gov)**: Flag jargon/acronyms undefined on first use
-5. **Task-Oriented Writing (Redish)**: Identify ambiguous instructions lacking concrete steps
-
-For EVERY issue found (prioritize by severity, but include ALL), provide:
+{sample}"""
+
+        ai_issues = self._request_issue_list(prompt, file_path, self.max_tokens)
+        return [self._build_clarity_issue(file_path, chunk, ai_issue) for ai_issue in ai_issues]
+
+    def _analyze_clarity_packed(self, files: List[Tuple[str, str]]) -> List[Issue]:
+        """Run one clarity request over several small files and demultiplex the result"""
+        chunks = {}
+        sections = []
+        for file_path, content in files:
+            line_count = content.count('\n') + 1
+            chunks[file_path] = Chunk(content, 1, line_count, estimate_tokens(content))
+            sections.append(f'<file path="{file_path}">\n{sanitize_content_for_ai(content)}\n</file>')
+
+        label = f"{len(files)} packed files"
+        documents = '\n\n'.join(sections)
+
+        prompt = f"""Analyze each of these {len(files)} documentation files.
+
+{documents}"""
+
+        # Output scales with the number of files in the request
+        max_tokens = min(self.max_tokens * len(files), PACKED_MAX_OUTPUT_TOKENS)
+        ai_issues = self._request_issue_list(prompt, label, max_tokens)
+
+        results = []
+        for ai_issue in ai_issues:
+            file_path = ai_issue.get('file')
+            if file_path not in chunks:
+                # Fall back to whichever file contains the quoted text
+                file_path = next(
+                    (path for path, chunk in chunks.items() if chunk.find_line(ai_issue.get('quoted_text'))),
+                    None
+                )
+                if file_path is None:
+                    continue
+            results.append(self._build_clarity_issue(file_path, chunks[file_path], ai_issue))
 
-{{
-  "line_number": <exact line number>,
-  "quoted_text": "<exact text with issue>",
-  "issue_type": "<specific issue: cognitive_load | unclear_heading | missing_context | undefined_jargon | ambiguous_instruction>",
-  "severity": "<critical | high | medium based on user impact>",
-  "evidence": "<research principle violated and why it matters>",
-  "user_impact": "<specific consequence for reader: 'Users cannot...' or 'Developers will...')>",
-  "fix_approach": "<what strategy to use: simplify, split, define, add context, etc>",
-  "before": "<quoted problematic text>",
-  "after": "<concrete rewrite example>",
-  "citation": "<principle: Nielsen Norman Group, Google Dev Docs Style, etc>"
-}}
+        return dedupe_issues(results)
 
-Prioritize issues by user impact. Return ONLY valid JSON array."""
+    def _request_issue_list(self, prompt: str, label: str, max_tokens: int) -> List[Dict[str, Any]]:
+        """Send a prompt that returns a JSON array, retrying on rate limits"""
+        import anthropic  # Already loaded with the client; for RateLimitError
+        max_retries = 3
+        base_delay = 2  # seconds
+        start = time.perf_counter()
+        prompt_chars = len(CLARITY_SYSTEM_PROMPT) + len(prompt)
 
+        for attempt in range(max_retries):
+            message = None
+            try:
                 message = self.claude_client.messages.create(
                     model=self.model,
-                    max_tokens=self.max_tokens,
+                    max_tokens=max_tokens,
+                    system=cached_system_prompt(CLARITY_SYSTEM_PROMPT, self.model),
                     messages=[{"role": "user", "content": prompt}]
                 )
+                self.telemetry.record(self.model, (time.perf_counter() - start) * 1000, attempt, prompt_chars, message)
 
                 response_text = message.content[0].text.strip()
 
@@ -154,16 +362,16 @@ Prioritize issues by user impact. Return ONLY valid JSON array."""
                 json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
                 if not json_match:
                     # AI returned no issues or invalid response
-                    return
+                    return []
 
                 response_text = json_match.group().strip()
 
                 # Handle empty arrays gracefully
                 if response_text == '[]' or not response_text:
-                    return
+                    return []
 
                 try:
-                    ai_issues = json.loads(response_text)
+                    return json.loads(response_text)
                 except json.JSONDecodeError as e:
                     # Try to fix common JSON issues
                     # Remove trailing commas
@@ -172,63 +380,72 @@ Prioritize issues by user impact. Return ONLY valid JSON array."""
 
                     # Try again
                     try:
-                        ai_issues = json.loads(response_text)
+                        return json.loads(response_text)
                     except json.JSONDecodeError:
                         # If still failing, skip this clarity check
-                        print(f"⚠️ Skipping AI clarity check for {file_path}: Invalid JSON response", file=sys.stderr)
-                        return
-
-                for issue in ai_issues:  # Process all issues
-                        # Build detailed description with evidence
-                        description = (
-                            f"[{issue.get('issue_type', 'clarity_issue').replace('_', ' ').title()}] "
-                            f"{issue.get('user_impact', 'Impacts user comprehension')}. "
-                            f"Evidence: {issue.get('evidence', 'See citation')} "
-                            f"(Source: {issue.get('citation', 'Documentation research')})"
-                        )
-
-                        # Build actionable suggestion with before/after
-                        before_text = issue.get('before', issue.get('quoted_text', ''))[:100]
-                        after_text = issue.get('after', '')[:150]
-
-                        suggestion = (
-                            f"{issue.get('fix_approach', 'Review and improve')}. "
-                            f"Before: \"{before_text}{'...' if len(before_text) == 100 else ''}\" "
-                            f"→ After: \"{after_text}{'...' if len(after_text) == 150 else ''}\""
-                        )
-
-                        issues.append(Issue(
-                            severity=issue.get('severity', 'medium'),
-                            category='clarity',
-                            file_path=file_path,
-                            line_number=issue.get('line_number'),
-                            issue_type=f"ai_{issue.get('issue_type', 'clarity_check')}",
-                            description=description,
-                            suggestion=suggestion,
-                            context=issue.get('quoted_text', '')[:200]  # Add quoted text as context
-                        ))
-
-                # Success - break retry loop
-                return
+                        print(f"⚠️ Skipping AI clarity check for {label}: Invalid JSON response", file=sys.stderr)
+                        return []
 
             except anthropic.RateLimitError as e:
                 # Rate limit error (529) - retry with exponential backoff
                 if attempt < max_retries - 1:
                     delay = base_delay * (2 ** attempt)  # Exponential backoff: 2s, 4s, 8s
-                    print(f"  ⏳ Rate limit hit for {file_path}, retrying in {delay}s (attempt {attempt + 1}/{max_retries})...")
+                    print(f"  ⏳ Rate limit hit for {label}, retrying in {delay}s (attempt {attempt + 1}/{max_retries})...")
                     time.sleep(delay)
                 else:
-                    print(f"  ⚠️  AI clarity check failed for {file_path} after {max_retries} retries: Rate limit exceeded")
+                    print(f"  ⚠️  AI clarity check failed for {label} after {max_retries} retries: Rate limit exceeded")
+                    self.telemetry.record(self.model, (time.perf_counter() - start) * 1000, attempt,
+                                          prompt_chars, status='rate_limited')
 
             except json.JSONDecodeError as e:
                 # JSON parsing error - log and skip (content sanitization should prevent most of these)
-                print(f"  ⚠️  AI clarity check failed for {file_path}: JSON parsing error - {str(e)}")
-                return
+                print(f"  ⚠️  AI clarity check failed for {label}: JSON parsing error - {str(e)}")
+                return []
 
             except Exception as e:
                 # Other errors - log and skip
-                print(f"  ⚠️  AI clarity check failed for {file_path}: {str(e)}")
-                return
+                print(f"  ⚠️  AI clarity check failed for {label}: {str(e)}")
+                if message is None:
+                    self.telemetry.record(self.model, (time.perf_counter() - start) * 1000, attempt,
+                                          prompt_chars, status='error')
+                return []
+
+        return []
+
+    def _build_clarity_issue(self, file_path: str, chunk: Chunk, issue: Dict[str, Any]) -> Issue:
+        """Convert one AI clarity finding into an Issue with a file line number"""
+        # Build detailed description with evidence
+        description = (
+            f"[{issue.get('issue_type', 'clarity_issue').replace('_', ' ').title()}] "
+            f"{issue.get('user_impact', 'Impacts user comprehension')}. "
+            f"Evidence: {issue.get('evidence', 'See citation')} "
+            f"(Source: {issue.get('citation', 'Documentation research')})"
+        )
+
+        # Build actionable suggestion with before/after
+        before_text = issue.get('before', issue.get('quoted_text', ''))[:100]
+        after_text = issue.get('after', '')[:150]
+
+        suggestion = (
+            f"{issue.get('fix_approach', 'Review and improve')}. "
+            f"Before: \"{before_text}{'...' if len(before_text) == 100 else ''}\" "
+            f"→ After: \"{after_text}{'...' if len(after_text) == 150 else ''}\""
+        )
+
+        # Prefer locating the quoted text; fall back to the reported chunk line
+        line_number = chunk.find_line(issue.get('quoted_text')) or \
+            chunk.to_file_line(issue.get('line_number'))
+
+        return Issue(
+            severity=issue.get('severity', 'medium'),
+            category='clarity',
+            file_path=file_path,
+            line_number=line_number,
+            issue_type=f"ai_{issue.get('issue_type', 'clarity_check')}",
+            description=description,
+            suggestion=suggestion,
+            context=issue.get('quoted_text', '')[:200]  # Add quoted text as context
+        )
 
     def analyze_semantic_gaps(self, doc_structure: Dict[str, Any], issues: List[Issue], insights: List[str]):
         """Identify conceptual gaps in documentation coverage with evidence-based analysis"""
@@ -285,11 +502,17 @@ For EVERY gap found (prioritize critical gaps first, but include ALL), provide:
 
 Cite SPECIFIC files from the provided list. Return ONLY valid JSON array."""
 
-            message = self.claude_client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            start = time.perf_counter()
+            try:
+                message = self.claude_client.messages.create(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+            except Exception:
+                self.telemetry.record(self.model, (time.perf_counter() - start) * 1000, 0, len(prompt), status='error')
+                raise
+            self.telemetry.record(self.model, (time.perf_counter() - start) * 1000, 0, len(prompt), message)
 
             response_text = message.content[0].text.strip()
 
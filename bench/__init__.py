@@ -0,0 +1,33 @@
+"""
+Benchmark suite for the analyzer and fixers
+
+Generates synthetic Mintlify corpora and times each DocumentationAnalyzer
+phase, each analyzer check and module, and each fixer.
+"""
+
+from .corpus import CorpusSpec, generate_corpus, ensure_corpus
+from .cases import BenchCase, BenchContext, CASES, select_cases
+from .runner import run_suite, save_results, load_results
+from .compare import CaseDelta, compare_results, format_table
+from .redos import PatternSource, PatternAudit, collect_patterns, audit_patterns, format_report
+
+__all__ = [
+    'CorpusSpec',
+    'generate_corpus',
+    'ensure_corpus',
+    'BenchCase',
+    'BenchContext',
+    'CASES',
+    'select_cases',
+    'run_suite',
+    'save_results',
+    'load_results',
+    'CaseDelta',
+    'compare_results',
+    'format_table',
+    'PatternSource',
+    'PatternAudit',
+    'collect_patterns',
+    'audit_patterns',
+    'format_report',
+]
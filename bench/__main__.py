@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Benchmark command line
+
+Usage:
+    python -m bench run --pages 10 1000 --output bench/baseline.json
+    python -m bench run --pages 10000 --filter fixer. --repeats 3
+    python -m bench corpus /tmp/corpus --pages 500
+    python -m bench compare --pages 10
+    python -m bench compare --current results.json --tolerance 0.15
+    python -m bench startup
+    python -m bench redos --filter config.yaml validation_rules.yaml
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .cases import select_cases
+from .compare import DEFAULT_MEMORY_TOLERANCE, DEFAULT_TOLERANCE, compare_results, format_table
+from .corpus import CorpusSpec, generate_corpus
+from .redos import DEFAULT_BUDGET, DEFAULT_LENGTH, LENGTH_RATIO, audit_patterns, collect_patterns, format_report
+from .runner import DEFAULT_CORPUS_ROOT, load_results, measure, run_suite, save_results
+from .startup import STARTUP_BUDGET_MS, STARTUP_COMMANDS, import_profile, run_command
+
+DEFAULT_BASELINE = Path(__file__).parent / 'baseline.json'
+
+
+def add_corpus_arguments(parser: argparse.ArgumentParser):
+    """Corpus feature-mix options shared by the subcommands"""
+    defaults = CorpusSpec()
+    parser.add_argument('--lines', type=int, default=defaults.lines_per_page,
+                        help=f'Lines per page (default: {defaults.lines_per_page})')
+    parser.add_argument('--links', type=float, default=defaults.links_per_page,
+                        help=f'Links per page (default: {defaults.links_per_page})')
+    parser.add_argument('--code-blocks', type=float, default=defaults.code_blocks_per_page,
+                        help=f'Code blocks per page (default: {defaults.code_blocks_per_page})')
+    parser.add_argument('--components', type=float, default=defaults.components_per_page,
+                        help=f'Components per page (default: {defaults.components_per_page})')
+    parser.add_argument('--duplicate-rate', type=float, default=defaults.duplicate_rate,
+                        help=f'Share of duplicated paragraphs (default: {defaults.duplicate_rate})')
+    parser.add_argument('--violation-rate', type=float, default=defaults.violation_rate,
+                        help=f'Share of paragraphs with flagged terms (default: {defaults.violation_rate})')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='Random seed')
+
+
+def spec_from_args(args, pages: int = 0) -> CorpusSpec:
+    return CorpusSpec(
+        pages=pages,
+        lines_per_page=args.lines,
+        links_per_page=args.links,
+        code_blocks_per_page=args.code_blocks,
+        components_per_page=args.components,
+        duplicate_rate=args.duplicate_rate,
+        violation_rate=args.violation_rate,
+        seed=args.seed,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m bench', description='Analyzer and fixer benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help='Run the benchmark suite and write JSON results')
+    run.add_argument('--pages', type=int, nargs='+', default=[10, 1000],
+                     help='Corpus sizes in pages (default: 10 1000; add 10000 for the large tier)')
+    run.add_argument('--repeats', type=int, default=5, help='Timed runs per case (default: 5)')
+    run.add_argument('--filter', nargs='*', default=None, help='Only cases whose name contains one of these')
+    run.add_argument('--output', type=Path, default=None, help='Write results JSON here')
+    run.add_argument('--corpus-root', type=Path, default=DEFAULT_CORPUS_ROOT,
+                     help=f'Generated corpus cache (default: {DEFAULT_CORPUS_ROOT})')
+    run.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory run')
+    add_corpus_arguments(run)
+
+    corpus = subparsers.add_parser('corpus', help='Only generate a corpus')
+    corpus.add_argument('directory', type=Path, help='Output directory')
+    corpus.add_argument('--pages', type=int, default=100, help='Number of pages (default: 100)')
+    add_corpus_arguments(corpus)
+
+    compare = subparsers.add_parser('compare', help='Run the suite and fail on regressions against a baseline')
+    compare.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                         help='Baseline results (default: bench/baseline.json)')
+    compare.add_argument('--current', type=Path, default=None,
+                         help='Compare these saved results instead of running the suite')
+    compare.add_argument('--pages', type=int, nargs='+', default=None,
+                         help='Corpus sizes to run (default: every size in the baseline)')
+    compare.add_argument('--repeats', type=int, default=None,
+                         help='Timed runs per case (default: same as the baseline)')
+    compare.add_argument('--filter', nargs='*', default=None, help='Only cases whose name contains one of these')
+    compare.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                         help=f'Allowed relative slowdown of a median (default: {DEFAULT_TOLERANCE})')
+    compare.add_argument('--memory-tolerance', type=float, default=DEFAULT_MEMORY_TOLERANCE,
+                         help=f'Allowed relative peak-memory growth (default: {DEFAULT_MEMORY_TOLERANCE})')
+    compare.add_argument('--case-tolerance', action='append', default=[], metavar='CASE=TOLERANCE',
+                         help='Per-case tolerance override (repeatable)')
+    compare.add_argument('--output', type=Path, default=None, help='Also write the current results here')
+    compare.add_argument('--corpus-root', type=Path, default=DEFAULT_CORPUS_ROOT,
+                         help=f'Generated corpus cache (default: {DEFAULT_CORPUS_ROOT})')
+    compare.add_argument('--all', action='store_true', help='Show unchanged cases in the table too')
+
+    startup = subparsers.add_parser('startup', help='Time CLI startup and list the slowest imports')
+    startup.add_argument('--repeats', type=int, default=5, help='Runs per command (default: 5)')
+    startup.add_argument('--top', type=int, default=8, help='Imports to list per command (default: 8)')
+
+    redos = subparsers.add_parser('redos', help='Flag configured and built-in regexes with super-linear cost')
+    redos.add_argument('--filter', nargs='*', default=None, help='Only patterns whose source contains one of these')
+    redos.add_argument('--length', type=int, default=DEFAULT_LENGTH,
+                       help=f'Characters of the shorter adversarial input (default: {DEFAULT_LENGTH})')
+    redos.add_argument('--budget', type=float, default=DEFAULT_BUDGET,
+                       help=f'Seconds a single search may take (default: {DEFAULT_BUDGET:g})')
+    redos.add_argument('--top', type=int, default=None, help='Show only this many rows')
+    redos.add_argument('--output', type=Path, default=None, help='Write the ranked report JSON here')
+
+    return parser
+
+
+def run_redos(args) -> int:
+    sources = collect_patterns()
+    if args.filter:
+        sources = [s for s in sources if any(f in s.source for f in args.filter)]
+    if not sources:
+        print(f"❌ No patterns match: {' '.join(args.filter)}", file=sys.stderr)
+        return 1
+
+    print(f"⏱️  Auditing {len(sources)} patterns on {args.length}- and {args.length * LENGTH_RATIO}-character inputs")
+    audits = audit_patterns(sources, args.length, args.budget)
+    print()
+    print(format_report(audits, args.length, args.top))
+    print()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([a.to_dict() for a in audits], f, indent=2, default=str)
+        print(f"📄 Report written to: {args.output}")
+
+    flagged = [a for a in audits if a.flagged]
+    if flagged:
+        print(f"❌ {len(flagged)} pattern(s) with super-linear cost or over the {args.budget:g}s budget")
+        return 1
+    print(f"✅ All {len(audits)} patterns scale linearly")
+    return 0
+
+
+def run_startup(args) -> int:
+    over_budget = []
+    for name, command in STARTUP_COMMANDS.items():
+        measured = measure(lambda: run_command(command), args.repeats, memory=False)
+        icon = '✅' if measured['median_ms'] <= STARTUP_BUDGET_MS else '❌'
+        print(f"{icon} python {' '.join(command)}: {measured['median_ms']:.0f} ms median")
+        for module, cumulative_ms in import_profile(command)[:args.top]:
+            print(f"     {cumulative_ms:>8.1f} ms  {module}")
+        if measured['median_ms'] > STARTUP_BUDGET_MS:
+            over_budget.append(name)
+
+    if over_budget:
+        print(f"\n❌ Over the {STARTUP_BUDGET_MS} ms startup budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+def parse_case_tolerances(values) -> dict:
+    tolerances = {}
+    for value in values:
+        name, sep, tolerance = value.rpartition('=')
+        if not sep or not name:
+            raise ValueError(f"expected CASE=TOLERANCE, got '{value}'")
+        tolerances[name] = float(tolerance)
+    return tolerances
+
+
+def run_compare(args) -> int:
+    if not args.baseline.exists():
+        print(f"❌ Baseline not found: {args.baseline}", file=sys.stderr)
+        return 1
+    try:
+        case_tolerances = parse_case_tolerances(args.case_tolerance)
+    except ValueError as e:
+        print(f"❌ Invalid --case-tolerance: {e}", file=sys.stderr)
+        return 1
+
+    baseline = load_results(args.baseline)
+    expected = None
+    if args.current:
+        current = load_results(args.current)
+    else:
+        # Same corpus mix, sizes and sample count as the baseline so the medians are comparable
+        meta = baseline.get('meta', {})
+        spec = CorpusSpec(**meta.get('corpus', {}))
+        pages = args.pages or [int(p) for p in baseline.get('results', {})]
+        repeats = args.repeats or meta.get('repeats', 5)
+        cases = select_cases(args.filter)
+        if not cases:
+            print(f"❌ No benchmark cases match: {' '.join(args.filter)}", file=sys.stderr)
+            return 1
+        expected = {case.name for case in cases}
+
+        print(f"⏱️  Running {len(cases)} cases × {len(pages)} corpus sizes ({repeats} runs each)")
+        current = run_suite(pages, cases, repeats, spec, args.corpus_root,
+                            memory=any('peak_kb' in entry for size in baseline.get('results', {}).values()
+                                       for entry in size.values()))
+        if args.output:
+            save_results(current, args.output)
+            print(f"📄 Results written to: {args.output}")
+
+    deltas = compare_results(baseline, current, args.tolerance, args.memory_tolerance,
+                             case_tolerances, expected)
+    regressions = [d for d in deltas if d.regressed]
+
+    print(f"\n📊 Benchmark comparison against {args.baseline}\n")
+    print(format_table(deltas, only_changes=not args.all))
+    print()
+
+    if regressions:
+        print(f"❌ {len(regressions)} performance regression(s):")
+        for d in regressions:
+            change = d.time_change if d.status == 'slower' else d.memory_change
+            kind = 'time' if d.status == 'slower' else 'peak memory'
+            print(f"   {d.target} ({d.pages} pages): {kind} {change * 100:+.1f}%")
+        return 1
+
+    compared = sum(1 for d in deltas if d.status in ('ok', 'faster'))
+    print(f"✅ No regressions in {compared} compared cases")
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'corpus':
+        files = generate_corpus(args.directory, spec_from_args(args, args.pages))
+        print(f"✅ Generated {len(files)} pages in {args.directory}")
+        return 0
+
+    if args.command == 'compare':
+        return run_compare(args)
+
+    if args.command == 'startup':
+        return run_startup(args)
+
+    if args.command == 'redos':
+        return run_redos(args)
+
+    cases = select_cases(args.filter)
+    if not cases:
+        print(f"❌ No benchmark cases match: {' '.join(args.filter)}", file=sys.stderr)
+        return 1
+
+    print(f"⏱️  Running {len(cases)} cases × {len(args.pages)} corpus sizes ({args.repeats} runs each)")
+    results = run_suite(args.pages, cases, args.repeats, spec_from_args(args),
+                        args.corpus_root, memory=not args.no_memory)
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"📄 Results written to: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+Benchmark cases: analyzer phases, analyzer checks and modules, and fixers
+
+Each case's prepare(context) returns a zero-argument callable that does one
+full pass over the corpus; the runner times that callable. Cases with
+super-linear cost set max_pages so large corpora skip them instead of
+running for hours.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from analyzers import ContentDuplicationDetector, MDXParser, RepositoryManager, UserJourneyAnalyzer
+from core.config import Config
+from .startup import STARTUP_COMMANDS, run_command
+from doc_analyzer import AnalysisReport, DocumentationAnalyzer
+from fixers import (
+    AccessibilityFixer, BrokenLinkDetector, CalloutStandardizationFixer, CapitalizationFixer,
+    CodeBlockFixer, CodeLanguageTagFixer, FrontmatterFixer, GitHubInformedFixer,
+    HeadingHierarchyFixer, LinkTextImprover, LongSentenceSplitter, MissingPrerequisitesDetector,
+    PassiveVoiceConverter, ProductionCodeValidator, StyleGuideValidationFixer,
+    TerminologyConsistencyFixer, TerminologyFixer, URLFixer,
+)
+
+CONFIG_PATH = Path(__file__).parent.parent / 'config.yaml'
+
+FIXER_CLASSES = [
+    FrontmatterFixer, TerminologyFixer, URLFixer, CodeBlockFixer, GitHubInformedFixer,
+    StyleGuideValidationFixer, CodeLanguageTagFixer, HeadingHierarchyFixer, LinkTextImprover,
+    LongSentenceSplitter, PassiveVoiceConverter, MissingPrerequisitesDetector, CapitalizationFixer,
+    TerminologyConsistencyFixer, CalloutStandardizationFixer, BrokenLinkDetector,
+    ProductionCodeValidator, AccessibilityFixer,
+]
+
+
+class BenchContext:
+    """Corpus and the analyzer/fixer instances shared by every case for one corpus size"""
+
+    def __init__(self, corpus_dir: Path, files: List[Path]):
+        self.corpus_dir = Path(corpus_dir)
+        self.files = files
+        self.contents = {path: path.read_text(encoding='utf-8') for path in files}
+        self.relative = {path: str(path.relative_to(self.corpus_dir)) for path in files}
+
+        with open(CONFIG_PATH, 'r') as f:
+            self.config = yaml.safe_load(f) or {}
+        self.config.setdefault('repository', {})['path'] = str(self.corpus_dir)
+        self.config['repository']['type'] = 'mintlify'
+        self.config.setdefault('analysis', {})['enable_ai_analysis'] = False
+        self.config.setdefault('gap_detection', {})['semantic_analysis'] = {'enabled': False}
+
+        self.repo_manager = RepositoryManager(self.config)
+        self.repo_manager.platform_config = self.repo_manager.load_platform_config()
+        self.analyzer = DocumentationAnalyzer(self.repo_manager, self.config)
+        self.doc_structure = self.analyzer._build_doc_structure(files)
+
+        self.fixer_config = Config(CONFIG_PATH)
+        self._fixers: Dict[str, Any] = {}
+        self._fixer_issues: Dict[str, Dict[Path, list]] = {}
+
+    @property
+    def pages(self) -> int:
+        return len(self.files)
+
+    def reset_report(self):
+        """Fresh report so issue lists don't grow across repetitions"""
+        self.analyzer.report = AnalysisReport(timestamp='', total_files=len(self.files), total_issues=0)
+
+    def fixer(self, fixer_class):
+        """Shared fixer instance (AI disabled)"""
+        name = fixer_class.__name__
+        if name not in self._fixers:
+            fixer = fixer_class(self.fixer_config)
+            if isinstance(fixer, StyleGuideValidationFixer):
+                fixer.ai_client = None
+            self._fixers[name] = fixer
+        return self._fixers[name]
+
+    def auto_fixable(self, fixer_class) -> Dict[Path, list]:
+        """Auto-fixable issues per file for a fixer (computed once)"""
+        name = fixer_class.__name__
+        if name not in self._fixer_issues:
+            fixer = self.fixer(fixer_class)
+            self._fixer_issues[name] = {
+                path: [i for i in fixer.check_file(str(path), content) if i.auto_fixable]
+                for path, content in self.contents.items()
+            }
+        return self._fixer_issues[name]
+
+
+@dataclass
+class BenchCase:
+    """One benchmark: a name, the code it blames and how to build the timed callable"""
+    name: str
+    group: str  # phase | check | module | fixer | startup
+    target: str  # analyzer check, module method or fixer the case measures
+    prepare: Callable[[BenchContext], Callable[[], Any]]
+    max_pages: Optional[int] = None
+
+    def applies_to(self, pages: int) -> bool:
+        return self.max_pages is None or pages <= self.max_pages
+
+
+# ---------------------------------------------------------------- phases
+
+def _phase_file_checks(ctx: BenchContext):
+    def run():
+        ctx.reset_report()
+        for path in ctx.files:
+            ctx.analyzer.analyze_file(path)
+    return run
+
+
+def _phase_cross_file(ctx: BenchContext):
+    def run():
+        ctx.reset_report()
+        ctx.analyzer._build_doc_structure(ctx.files)
+        ctx.analyzer.analyze_information_architecture(ctx.files)
+        ctx.analyzer.analyze_consistency(ctx.files)
+    return run
+
+
+def _phase_advanced(ctx: BenchContext):
+    def run():
+        ctx.reset_report()
+        ctx.analyzer.detect_content_gaps(ctx.doc_structure)
+        ctx.analyzer.duplication_detector.find_duplicates(ctx.files, ctx.analyzer.report.issues)
+        ctx.analyzer.journey_analyzer.validate_journeys(ctx.doc_structure, ctx.analyzer.report.issues)
+    return run
+
+
+# ---------------------------------------------------------------- analyzer checks and modules
+
+def _analyzer_check(method: str):
+    def prepare(ctx: BenchContext):
+        check = getattr(ctx.analyzer, method)
+
+        def run():
+            ctx.reset_report()
+            for path, content in ctx.contents.items():
+                if method == 'check_links':
+                    check(content, ctx.relative[path], path)
+                else:
+                    check(content, ctx.relative[path])
+        return run
+    return prepare
+
+
+def _mintlify_validator(method: str):
+    def prepare(ctx: BenchContext):
+        validate = getattr(ctx.analyzer.mintlify_validator, method)
+
+        def run():
+            issues = []
+            for path, content in ctx.contents.items():
+                validate(ctx.relative[path], content, issues)
+            return issues
+        return run
+    return prepare
+
+
+def _find_duplicates(ctx: BenchContext):
+    detector = ContentDuplicationDetector(ctx.config)
+    # Disabled in config.yaml because of its cost; measured here regardless
+    detector.enabled = True
+    return lambda: detector.find_duplicates(ctx.files, [])
+
+
+def _validate_journeys(ctx: BenchContext):
+    journeys = UserJourneyAnalyzer(ctx.config)
+    return lambda: journeys.validate_journeys(ctx.doc_structure, [])
+
+
+def _parse_frontmatter(ctx: BenchContext):
+    return lambda: [MDXParser.parse_frontmatter(content) for content in ctx.contents.values()]
+
+
+def _extract_components(ctx: BenchContext):
+    return lambda: [MDXParser.extract_components(content) for content in ctx.contents.values()]
+
+
+def _get_files(ctx: BenchContext):
+    return ctx.repo_manager.get_files
+
+
+# ---------------------------------------------------------------- fixers
+
+def _fixer_check(fixer_class):
+    def prepare(ctx: BenchContext):
+        fixer = ctx.fixer(fixer_class)
+        return lambda: [fixer.check_file(str(path), content) for path, content in ctx.contents.items()]
+    return prepare
+
+
+def _fixer_fix(fixer_class):
+    def prepare(ctx: BenchContext):
+        fixer = ctx.fixer(fixer_class)
+        pending = [(path, issues) for path, issues in ctx.auto_fixable(fixer_class).items() if issues]
+        return lambda: [fixer.fix(str(path), ctx.contents[path], issues) for path, issues in pending]
+    return prepare
+
+
+# ---------------------------------------------------------------- startup
+
+def _startup(args: List[str]):
+    def prepare(ctx: BenchContext):
+        return lambda: run_command(args)
+    return prepare
+
+
+def build_cases() -> List[BenchCase]:
+    """Every benchmark case, in report order"""
+    cases = [
+        BenchCase('phase.file_checks', 'phase', 'DocumentationAnalyzer.analyze_file', _phase_file_checks),
+        BenchCase('phase.cross_file', 'phase', 'DocumentationAnalyzer (cross-file analysis)', _phase_cross_file),
+        BenchCase('phase.advanced', 'phase', 'DocumentationAnalyzer (advanced analysis)', _phase_advanced),
+    ]
+
+    for method in ('check_readability', 'check_style_guide', 'check_structure', 'check_formatting', 'check_links'):
+        cases.append(BenchCase(f'check.{method}', 'check', f'DocumentationAnalyzer.{method}', _analyzer_check(method)))
+
+    for method in ('validate_frontmatter', 'validate_components', 'validate_internal_links'):
+        cases.append(BenchCase(f'module.MintlifyValidator.{method}', 'module', f'MintlifyValidator.{method}',
+                               _mintlify_validator(method)))
+    cases += [
+        # find_duplicates runs SequenceMatcher on every paragraph pair across files
+        BenchCase('module.ContentDuplicationDetector.find_duplicates', 'module',
+                  'ContentDuplicationDetector.find_duplicates', _find_duplicates, max_pages=10),
+        BenchCase('module.UserJourneyAnalyzer.validate_journeys', 'module',
+                  'UserJourneyAnalyzer.validate_journeys', _validate_journeys),
+        BenchCase('module.MDXParser.parse_frontmatter', 'module', 'MDXParser.parse_frontmatter', _parse_frontmatter),
+        BenchCase('module.MDXParser.extract_components', 'module', 'MDXParser.extract_components', _extract_components),
+        BenchCase('module.RepositoryManager.get_files', 'module', 'RepositoryManager.get_files', _get_files),
+    ]
+
+    for fixer_class in FIXER_CLASSES:
+        name = fixer_class.__name__
+        cases.append(BenchCase(f'fixer.{name}.check_file', 'fixer', f'{name}.check_file', _fixer_check(fixer_class)))
+        cases.append(BenchCase(f'fixer.{name}.fix', 'fixer', f'{name}.fix', _fixer_fix(fixer_class)))
+
+    # Fresh-interpreter startup (imports); independent of corpus size
+    for name, args in STARTUP_COMMANDS.items():
+        cases.append(BenchCase(f'startup.{name}', 'startup', f"{' '.join(args)} (startup)", _startup(args)))
+
+    return cases
+
+
+CASES = build_cases()
+
+
+def select_cases(patterns: Optional[List[str]] = None) -> List[BenchCase]:
+    """Cases whose name contains any of the patterns (all cases without patterns)"""
+    if not patterns:
+        return list(CASES)
+    return [case for case in CASES if any(pattern in case.name for pattern in patterns)]
@@ -0,0 +1,159 @@
+"""
+Regression gate: compare benchmark results against a stored baseline
+
+Each case's median is compared with the baseline median. A case regresses
+when it is slower by more than its relative tolerance AND by more than an
+absolute floor (sub-millisecond cases are dominated by timer noise). The
+tolerance widens to the spread (max/min) of the baseline runs when the
+baseline itself was noisier than the default. Peak traced memory is
+compared the same way.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+DEFAULT_TOLERANCE = 0.25         # 25% slower
+DEFAULT_MEMORY_TOLERANCE = 0.20  # 20% more peak memory
+MIN_DELTA_MS = 2.0
+MIN_DELTA_KB = 256.0
+
+# Cases that are noisier than the rest (filesystem-bound)
+CASE_TOLERANCES = {
+    'module.RepositoryManager.get_files': 0.5,
+}
+
+
+@dataclass
+class CaseDelta:
+    """Baseline vs current for one case at one corpus size"""
+    name: str
+    target: str
+    pages: str
+    status: str  # ok | slower | memory | faster | new | missing | skipped
+    baseline_ms: Optional[float] = None
+    current_ms: Optional[float] = None
+    tolerance: float = DEFAULT_TOLERANCE
+    baseline_kb: Optional[float] = None
+    current_kb: Optional[float] = None
+
+    @property
+    def time_change(self) -> Optional[float]:
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return self.current_ms / self.baseline_ms - 1
+
+    @property
+    def memory_change(self) -> Optional[float]:
+        if not self.baseline_kb or self.current_kb is None:
+            return None
+        return self.current_kb / self.baseline_kb - 1
+
+    @property
+    def regressed(self) -> bool:
+        return self.status in ('slower', 'memory')
+
+
+def _noise_tolerance(entry: Dict[str, Any], tolerance: float) -> float:
+    """Tolerance widened to the observed spread of the baseline runs"""
+    median = entry.get('median_ms') or 0
+    if median <= 0 or 'max_ms' not in entry or 'min_ms' not in entry:
+        return tolerance
+    return max(tolerance, (entry['max_ms'] - entry['min_ms']) / median)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float = DEFAULT_TOLERANCE,
+                    memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE,
+                    case_tolerances: Optional[Dict[str, float]] = None,
+                    expected: Optional[Set[str]] = None) -> List[CaseDelta]:
+    """
+    Compare two result sets (see runner.py for the layout)
+
+    Args:
+        baseline: Stored baseline results
+        current: Results of the run under test
+        tolerance: Allowed relative slowdown of the median
+        memory_tolerance: Allowed relative growth of peak traced memory
+        case_tolerances: Per-case overrides of tolerance
+        expected: Case names the current run was meant to cover; baseline
+            cases outside it are not reported as missing (default: all)
+
+    Returns:
+        One CaseDelta per case and corpus size present in either result set
+    """
+    overrides = {**CASE_TOLERANCES, **(case_tolerances or {})}
+    deltas = []
+
+    for pages, current_cases in current.get('results', {}).items():
+        baseline_cases = baseline.get('results', {}).get(pages, {})
+        for name, entry in current_cases.items():
+            base = baseline_cases.get(name)
+            delta = CaseDelta(name=name, target=entry.get('target', ''), pages=pages, status='ok',
+                              current_ms=entry.get('median_ms'), current_kb=entry.get('peak_kb'))
+
+            if 'skipped' in entry or (base and 'skipped' in base):
+                delta.status = 'skipped'
+            elif base is None:
+                delta.status = 'new'
+            else:
+                delta.baseline_ms = base.get('median_ms')
+                delta.baseline_kb = base.get('peak_kb')
+                delta.tolerance = _noise_tolerance(base, overrides.get(name, tolerance))
+
+                slowdown_ms = (delta.current_ms or 0) - (delta.baseline_ms or 0)
+                growth_kb = (delta.current_kb or 0) - (delta.baseline_kb or 0)
+                if (delta.time_change or 0) > delta.tolerance and slowdown_ms > MIN_DELTA_MS:
+                    delta.status = 'slower'
+                elif (delta.memory_change or 0) > memory_tolerance and growth_kb > MIN_DELTA_KB:
+                    delta.status = 'memory'
+                elif (delta.time_change or 0) < -delta.tolerance and -slowdown_ms > MIN_DELTA_MS:
+                    delta.status = 'faster'
+            deltas.append(delta)
+
+        for name, base in baseline_cases.items():
+            if name not in current_cases and (expected is None or name in expected):
+                deltas.append(CaseDelta(name=name, target=base.get('target', ''), pages=pages, status='missing',
+                                        baseline_ms=base.get('median_ms'), baseline_kb=base.get('peak_kb')))
+
+    return deltas
+
+
+def _percent(change: Optional[float]) -> str:
+    return f"{change * 100:+.1f}%" if change is not None else '-'
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value:.2f}" if value is not None else '-'
+
+
+STATUS_ICONS = {
+    'ok': '✅',
+    'faster': '🚀',
+    'slower': '❌',
+    'memory': '❌',
+    'new': '🆕',
+    'missing': '⚠️ ',
+    'skipped': '⏭️ ',
+}
+
+
+def format_table(deltas: List[CaseDelta], only_changes: bool = False) -> str:
+    """Per-case delta table; regressions first, then by relative change"""
+    rows = [d for d in deltas if not only_changes or d.status not in ('ok', 'skipped')]
+    if not rows:
+        return "No benchmark changes"
+
+    rows.sort(key=lambda d: (not d.regressed, d.status != 'faster', -(d.time_change or 0)))
+    target_width = max(len('Responsible'), *(len(d.target) for d in rows))
+    lines = [
+        f"   {'Pages':>6}  {'Responsible':<{target_width}}  {'Base ms':>10}  {'Now ms':>10}  "
+        f"{'Time':>8}  {'Limit':>7}  {'Memory':>8}  Status",
+        '   ' + '-' * (target_width + 70),
+    ]
+    for d in rows:
+        lines.append(
+            f"{STATUS_ICONS.get(d.status, '  ')} {d.pages:>6}  {d.target:<{target_width}}  "
+            f"{_ms(d.baseline_ms):>10}  {_ms(d.current_ms):>10}  {_percent(d.time_change):>8}  "
+            f"{'+' + format(d.tolerance * 100, '.0f') + '%':>7}  {_percent(d.memory_change):>8}  {d.status}"
+        )
+    return '\n'.join(lines)
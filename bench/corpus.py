@@ -0,0 +1,194 @@
+"""
+Synthetic Mintlify corpus generator for benchmarks
+
+Builds a reproducible docs tree (docs.json + nested .mdx pages) whose size
+and feature mix are controlled by CorpusSpec: page length, link density,
+code blocks, components, paragraphs duplicated across pages and how often
+prose uses terms the style checks flag.
+"""
+
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List
+
+SECTIONS = ['get-started', 'guides', 'api', 'concepts', 'troubleshooting']
+
+WORDS = (
+    "request response client server model token message stream batch prompt "
+    "cache tool result error retry limit header payload endpoint config key "
+    "project workspace deploy build test review output input format schema "
+    "field value option default parameter version release update migrate"
+).split()
+
+# Phrases flagged by the terminology, style and capitalization checks
+VIOLATIONS = [
+    "You can simply utilize the client",
+    "in order to leverage the API",
+    "Prior to sending requests, just check the api key",
+    "The response was returned by the server",
+    "It is obviously very easy to configure claude code",
+    "Due to the fact that the json payload is large",
+    "Click here to see the sdk reference",
+]
+
+COMPONENTS = [
+    ("<Note>", "</Note>"),
+    ("<Tip>", "</Tip>"),
+    ("<Warning>", "</Warning>"),
+    ("<Info>", "</Info>"),
+    ("<Card title=\"Related\" href=\"/guides/page-0\">", "</Card>"),
+]
+
+CODE_SAMPLES = [
+    ("python", ["import anthropic", "", "client = anthropic.Anthropic()", "message = client.messages.create(",
+                "    model=\"claude-sonnet-4-5\",", "    max_tokens=1024,", ")", "print(message.content)"]),
+    ("bash", ["curl https://api.anthropic.com/v1/messages \\", "  -H \"x-api-key: $ANTHROPIC_API_KEY\" \\",
+              "  -d '{\"max_tokens\": 1024}'"]),
+    ("", ["{", "  \"model\": \"claude-sonnet-4-5\",", "  \"max_tokens\": 1024", "}"]),
+    ("typescript", ["import Anthropic from '@anthropic-ai/sdk';", "", "const client = new Anthropic();"]),
+]
+
+
+@dataclass
+class CorpusSpec:
+    """Size and feature mix of a synthetic corpus"""
+    pages: int = 100
+    lines_per_page: int = 120
+    links_per_page: float = 4.0      # internal + external links per page
+    broken_link_rate: float = 0.1    # share of internal links to missing pages
+    code_blocks_per_page: float = 2.0
+    components_per_page: float = 2.0
+    duplicate_rate: float = 0.05     # share of paragraphs copied from a shared pool
+    violation_rate: float = 0.15     # share of paragraphs containing a flagged phrase
+    seed: int = 42
+
+
+class _PageBuilder:
+    """Builds one page; all randomness comes from the shared generator"""
+
+    def __init__(self, spec: CorpusSpec, rng: random.Random, page_paths: List[str], shared: List[str]):
+        self.spec = spec
+        self.rng = rng
+        self.page_paths = page_paths
+        self.shared = shared
+
+    def sentence(self, words: int) -> str:
+        text = ' '.join(self.rng.choice(WORDS) for _ in range(words))
+        return text[0].upper() + text[1:] + '.'
+
+    def paragraph(self) -> str:
+        if self.shared and self.rng.random() < self.spec.duplicate_rate:
+            return self.rng.choice(self.shared)
+        sentences = [self.sentence(self.rng.randint(8, 30)) for _ in range(self.rng.randint(2, 4))]
+        if self.rng.random() < self.spec.violation_rate:
+            sentences.insert(self.rng.randrange(len(sentences)), self.rng.choice(VIOLATIONS) + '.')
+        return ' '.join(sentences)
+
+    def link(self) -> str:
+        roll = self.rng.random()
+        if roll < 0.3:
+            return f"[the {self.rng.choice(WORDS)} reference](https://docs.claude.com/en/docs/{self.rng.choice(WORDS)})"
+        if roll < 0.3 + 0.7 * self.spec.broken_link_rate:
+            return f"[missing page](/{self.rng.choice(SECTIONS)}/missing-{self.rng.randint(0, 999)})"
+        target = self.rng.choice(self.page_paths)
+        return f"[{self.rng.choice(WORDS)} guide](/{target})"
+
+    def build(self, index: int) -> str:
+        spec, rng = self.spec, self.rng
+        title = f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {index}"
+        lines = ['---', f'title: "{title}"']
+        if rng.random() > 0.05:
+            lines.append(f'description: "{self.sentence(12)}"')
+        lines += ['---', '', self.paragraph(), '']
+
+        # Spread links, code blocks and components across the sections
+        budget = {
+            'links': _count(rng, spec.links_per_page),
+            'code': _count(rng, spec.code_blocks_per_page),
+            'components': _count(rng, spec.components_per_page),
+        }
+        heading = 0
+        while len(lines) < spec.lines_per_page:
+            heading += 1
+            level = '##' if heading % 3 else '###'
+            lines += [f'{level} {rng.choice(WORDS).title()} {rng.choice(WORDS)} {heading}', '']
+
+            paragraph = self.paragraph()
+            if budget['links']:
+                paragraph += ' See ' + self.link() + '.'
+                budget['links'] -= 1
+            lines += [paragraph, '']
+
+            if budget['code'] and rng.random() < 0.5:
+                language, code = rng.choice(CODE_SAMPLES)
+                lines += ['```' + language] + code + ['```', '']
+                budget['code'] -= 1
+            elif budget['components'] and rng.random() < 0.5:
+                opening, closing = rng.choice(COMPONENTS)
+                lines += [opening, self.sentence(14), closing, '']
+                budget['components'] -= 1
+            elif rng.random() < 0.3:
+                lines += [f'{n}. {self.sentence(rng.randint(6, 14))}' for n in range(1, rng.randint(3, 6))] + ['']
+
+        return '\n'.join(lines) + '\n'
+
+
+def _count(rng: random.Random, mean: float) -> int:
+    """Integer count with the given mean"""
+    whole = int(mean)
+    return whole + (1 if rng.random() < mean - whole else 0)
+
+
+def page_path(index: int) -> str:
+    """Relative path (without extension) of the index-th page"""
+    return f"{SECTIONS[index % len(SECTIONS)]}/page-{index}"
+
+
+def generate_corpus(root: Path, spec: CorpusSpec) -> List[Path]:
+    """
+    Write a corpus to root
+
+    Args:
+        root: Directory to create (existing pages are overwritten)
+        spec: Corpus size and feature mix
+
+    Returns:
+        Paths of the generated .mdx files, in index order
+    """
+    root = Path(root)
+    rng = random.Random(spec.seed)
+    page_paths = [page_path(i) for i in range(spec.pages)]
+
+    builder = _PageBuilder(spec, rng, page_paths, shared=[])
+    builder.shared = [builder.paragraph() for _ in range(20)]
+
+    files = []
+    for index, rel_path in enumerate(page_paths):
+        path = root / f"{rel_path}.mdx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(builder.build(index), encoding='utf-8')
+        files.append(path)
+
+    navigation = [
+        {'group': section, 'pages': [p for p in page_paths if p.startswith(section + '/')]}
+        for section in SECTIONS
+    ]
+    (root / 'docs.json').write_text(json.dumps({'name': 'Benchmark docs', 'navigation': navigation}, indent=2))
+    (root / 'corpus.json').write_text(json.dumps(asdict(spec), indent=2))
+
+    return files
+
+
+def ensure_corpus(root: Path, spec: CorpusSpec) -> List[Path]:
+    """Generate the corpus unless root already holds one built from the same spec"""
+    root = Path(root)
+    marker = root / 'corpus.json'
+    if marker.exists():
+        try:
+            if json.loads(marker.read_text()) == asdict(spec):
+                return [root / f"{page_path(i)}.mdx" for i in range(spec.pages)]
+        except json.JSONDecodeError:
+            pass
+    return generate_corpus(root, spec)
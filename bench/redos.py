@@ -0,0 +1,328 @@
+"""
+ReDoS audit of configured and built-in patterns
+
+Collects the regexes the analyzer and fixers run (config.yaml,
+validation_rules.yaml and the fixers' pattern tables), times each one on
+adversarial inputs at two line lengths, and ranks them by how fast their
+cost grows. Inputs are derived from each pattern's parse tree: every
+repeated sub-pattern is pumped on its own (for catastrophic
+backtracking) and behind a repeated prefix (for matches that rescan the
+rest of the line from every start), plus plain long prose and
+whitespace lines. Linear patterns take ~4x longer on a 4x longer line;
+a growth exponent well above 1, or a search that outlives the time
+budget, gets the pattern flagged.
+"""
+
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+from utils.watchdog import CheckTimeout, Watchdog
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_CONFIG = ROOT / 'config.yaml'
+DEFAULT_RULES = ROOT / 'style_guide' / 'validation_rules.yaml'
+
+DEFAULT_LENGTH = 1000     # characters of the shorter input
+LENGTH_RATIO = 4          # the longer input is this many times longer
+DEFAULT_BUDGET = 1.0      # seconds a single search may take
+SUPERLINEAR = 1.5         # growth exponent above which a pattern is flagged
+NOISE_FLOOR = 0.0005      # seconds; faster searches are too quick to judge growth
+
+# (fixer, attribute, flags the fixer searches with, patterns in the table)
+FIXER_TABLES: List[Tuple[str, str, int, Callable]] = [
+    ('CapitalizationFixer', 'product_names', re.IGNORECASE, list),
+    ('CapitalizationFixer', 'feature_names', re.IGNORECASE, list),
+    ('CapitalizationFixer', 'model_names', re.IGNORECASE, list),
+    ('CapitalizationFixer', 'technical_terms', re.IGNORECASE, list),
+    ('CapitalizationFixer', 'general_concepts', re.IGNORECASE, list),
+    ('TerminologyConsistencyFixer', 'terminology_map', re.IGNORECASE,
+     lambda table: [pattern for variations in table.values() for pattern, _ in variations]),
+    ('PassiveVoiceConverter', 'passive_patterns', re.IGNORECASE, lambda table: [pattern for pattern, _ in table]),
+    ('PassiveVoiceConverter', 'exceptions', re.IGNORECASE, list),
+    ('CodeLanguageTagFixer', 'content_patterns', re.MULTILINE, lambda table: [pattern for pattern, _ in table]),
+    ('ProductionCodeValidator', 'production_patterns', 0,
+     lambda table: [pattern for groups in table.values() for patterns in groups.values() for pattern in patterns]),
+    ('ProductionCodeValidator', 'anti_patterns', 0,
+     lambda table: [pattern for patterns in table.values() for pattern in patterns]),
+]
+
+_FILLER = 'lorem ipsum dolor sit amet '
+
+_REPEATS = tuple(op for op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT,
+                               getattr(sre_parse, 'POSSESSIVE_REPEAT', None)) if op is not None)
+
+
+@dataclass
+class PatternSource:
+    """One regex and where it is configured"""
+    source: str
+    pattern: str
+    flags: int = 0
+
+
+@dataclass
+class PatternAudit:
+    """Timing of one pattern on its worst adversarial input"""
+    source: str
+    pattern: str
+    status: str                     # 'ok', 'superlinear', 'timeout' or 'invalid'
+    exponent: Optional[float] = None
+    worst_input: Optional[str] = None
+    short_ms: Optional[float] = None
+    long_ms: Optional[float] = None
+    error: Optional[str] = None
+    inputs: Dict[str, float] = field(default_factory=dict)  # input -> growth exponent
+
+    @property
+    def flagged(self) -> bool:
+        return self.status in ('superlinear', 'timeout', 'invalid')
+
+    def to_dict(self) -> dict:
+        return {
+            'source': self.source,
+            'pattern': self.pattern,
+            'status': self.status,
+            'exponent': self.exponent,
+            'worst_input': self.worst_input,
+            'short_ms': self.short_ms,
+            'long_ms': self.long_ms,
+            'error': self.error,
+        }
+
+
+def collect_patterns(config_path: Path = DEFAULT_CONFIG, rules_path: Path = DEFAULT_RULES) -> List[PatternSource]:
+    """Every regex in config.yaml, validation_rules.yaml and the fixers' pattern tables"""
+    from core.config import Config
+    from fixers import load_fixer_class
+
+    patterns: List[PatternSource] = []
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    style_rules = config.get('style_rules', {})
+    # The analyzer and TerminologyFixer search for these terms as \bterm\b
+    for term in list(style_rules.get('preferred_terms', {})) + list(style_rules.get('avoid_terms', [])):
+        patterns.append(PatternSource(f'config.yaml:style_rules[{term}]',
+                                      rf'\b{re.escape(term)}\b', re.IGNORECASE))
+    for rule in config.get('custom_rules', {}).get('patterns', []):
+        if rule.get('regex'):
+            patterns.append(PatternSource(f"config.yaml:custom_rules.{rule.get('name')}", rule['regex']))
+
+    with open(rules_path, 'r', encoding='utf-8') as f:
+        rules = {}
+        for document in yaml.safe_load_all(f):
+            rules.update(document or {})
+    for rule_type in ('critical_rules', 'high_priority_rules', 'medium_priority_rules', 'low_priority_rules'):
+        for rule in rules.get(rule_type) or []:
+            flags = 0 if rule.get('case_sensitive', True) else re.IGNORECASE
+            if rule.get('pattern'):
+                patterns.append(PatternSource(f"validation_rules.yaml:{rule.get('rule_id')}", rule['pattern'], flags))
+            for incorrect in rule.get('incorrect_patterns') or []:
+                if incorrect.get('pattern'):
+                    patterns.append(PatternSource(f"validation_rules.yaml:{rule.get('rule_id')}",
+                                                  incorrect['pattern'], flags))
+
+    fixers = {}
+    for name, attribute, flags, extract in FIXER_TABLES:
+        if name not in fixers:
+            fixers[name] = load_fixer_class(name)(Config(config_path))
+        for pattern in extract(getattr(fixers[name], attribute)):
+            patterns.append(PatternSource(f'{name}.{attribute}', pattern, flags))
+
+    # Tables repeat patterns (e.g. per language); audit each once per source
+    unique = {(p.source, p.pattern, p.flags): p for p in patterns}
+    return list(unique.values())
+
+
+def _class_sample(items) -> str:
+    """A character matched by a [...] set"""
+    if items and items[0][0] is sre_parse.NEGATE:
+        return 'a'
+    op, value = items[0]
+    if op is sre_parse.LITERAL:
+        return chr(value)
+    if op is sre_parse.RANGE:
+        return chr(value[0])
+    if op is sre_parse.CATEGORY:
+        return {sre_parse.CATEGORY_DIGIT: '0', sre_parse.CATEGORY_SPACE: ' '}.get(value, 'a')
+    return 'a'
+
+
+def _sample(items) -> str:
+    """A short string matched by a parsed (sub)pattern, taking each repeat at least once"""
+    parts = []
+    for op, value in items:
+        if op is sre_parse.LITERAL:
+            parts.append(chr(value))
+        elif op is sre_parse.NOT_LITERAL:
+            parts.append('b' if chr(value) == 'a' else 'a')
+        elif op is sre_parse.ANY:
+            parts.append('a')
+        elif op is sre_parse.IN:
+            parts.append(_class_sample(value))
+        elif op is sre_parse.CATEGORY:
+            parts.append(_class_sample([(op, value)]))
+        elif op in _REPEATS:
+            low, _, body = value
+            parts.append(_sample(body) * max(low, 1))
+        elif op is sre_parse.SUBPATTERN:
+            parts.append(_sample(value[-1]))
+        elif op is getattr(sre_parse, 'ATOMIC_GROUP', None):
+            parts.append(_sample(value))
+        elif op is sre_parse.BRANCH:
+            parts.append(_sample(value[1][0]))
+        # Anchors, lookarounds and backreferences consume nothing
+    return ''.join(parts)
+
+
+
+def _pumps(items, prefix: str = '') -> Iterator[Tuple[str, str]]:
+    """(text before, repeated unit) for every unbounded repeat of a parsed pattern"""
+    before = prefix
+    for op, value in items:
+        if op in _REPEATS:
+            low, high, body = value
+            if high is sre_parse.MAXREPEAT or high > 1:
+                unit = _sample(body)
+                if unit:
+                    yield before, unit
+            yield from _pumps(body, before)
+        elif op is sre_parse.SUBPATTERN:
+            yield from _pumps(value[-1], before)
+        elif op is getattr(sre_parse, 'ATOMIC_GROUP', None):
+            yield from _pumps(value, before)
+        elif op is sre_parse.BRANCH:
+            for alternative in value[1]:
+                yield from _pumps(alternative, before)
+        before += _sample([(op, value)])
+
+
+def _fill(unit: str, length: int) -> str:
+    return unit * max(length // len(unit), 1)
+
+
+def adversarial_inputs(pattern: str, flags: int, length: int) -> Dict[str, str]:
+    """Named inputs of about length characters that stress a pattern"""
+    parsed = sre_parse.parse(pattern, flags)
+    inputs = {
+        'prose': _fill(_FILLER, length),
+        'spaces': ' ' * length,
+        'word': 'a' * length,
+    }
+    sample = _sample(parsed)
+    if sample:
+        inputs['matches'] = _fill(sample + ' ', length)
+    for before, unit in _pumps(parsed):
+        label = repr(unit)[1:-1][:12]
+        # One long attempt that fails at the very end: exponential backtracking
+        inputs.setdefault(f'pump({label})', before + _fill(unit, length - len(before)) + '\x00')
+        # A start per prefix, each scanning the rest of the line: quadratic rescans
+        if before:
+            inputs.setdefault(f'repeat({repr(before + unit)[1:-1][:16]})', _fill(before + unit, length) + '\x00')
+    return inputs
+
+
+def _search_seconds(compiled, text: str, watchdog: Watchdog) -> float:
+    """Best per-call time of running finditer over text (repeated to be measurable)"""
+    def run():
+        for _ in compiled.finditer(text):
+            pass
+
+    best = math.inf
+    for _ in range(3):
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                watchdog.call('search', run)
+            elapsed = time.perf_counter() - start
+            if elapsed >= 0.002 or number >= 1024:
+                break
+            number *= 2
+        best = min(best, elapsed / number)
+    return best
+
+
+def audit_pattern(source: PatternSource, length: int = DEFAULT_LENGTH,
+                  budget: float = DEFAULT_BUDGET) -> PatternAudit:
+    """Time one pattern on its adversarial inputs at length and LENGTH_RATIO x length"""
+    try:
+        compiled = re.compile(source.pattern, source.flags)
+        short_inputs = adversarial_inputs(source.pattern, source.flags, length)
+        long_inputs = adversarial_inputs(source.pattern, source.flags, length * LENGTH_RATIO)
+    except (re.error, RecursionError) as e:
+        return PatternAudit(source.source, source.pattern, 'invalid', error=str(e))
+
+    watchdog = Watchdog(check_seconds=budget)
+    audit = PatternAudit(source.source, source.pattern, 'ok')
+    worst = (-math.inf, 0.0)
+    for name, short_text in short_inputs.items():
+        try:
+            short = _search_seconds(compiled, short_text, watchdog)
+            long = _search_seconds(compiled, long_inputs[name], watchdog)
+        except CheckTimeout:
+            audit.inputs[name] = math.inf
+            audit.status, audit.exponent, audit.worst_input = 'timeout', math.inf, name
+            audit.short_ms = audit.long_ms = None
+            return audit
+
+        if long < NOISE_FLOOR:
+            exponent = 1.0  # too fast to matter at any plausible line length
+        else:
+            exponent = math.log(long / max(short, 1e-9)) / math.log(LENGTH_RATIO)
+        audit.inputs[name] = round(exponent, 2)
+        if (exponent, long) > worst:
+            worst = (exponent, long)
+            audit.exponent = round(exponent, 2)
+            audit.worst_input = name
+            audit.short_ms = round(short * 1000, 3)
+            audit.long_ms = round(long * 1000, 3)
+
+    if audit.exponent is not None and audit.exponent >= SUPERLINEAR:
+        audit.status = 'superlinear'
+    return audit
+
+
+def audit_patterns(sources: List[PatternSource], length: int = DEFAULT_LENGTH,
+                   budget: float = DEFAULT_BUDGET) -> List[PatternAudit]:
+    """Audit every pattern, worst first"""
+    audits = [audit_pattern(source, length, budget) for source in sources]
+    audits.sort(key=lambda a: (not a.flagged, a.status != 'timeout',
+                               -(a.exponent if a.exponent is not None else math.inf), -(a.long_ms or 0)))
+    return audits
+
+
+STATUS_ICONS = {'timeout': '❌', 'superlinear': '⚠️', 'invalid': '❌', 'ok': '  '}
+
+
+def format_report(audits: List[PatternAudit], length: int = DEFAULT_LENGTH, top: Optional[int] = None) -> str:
+    """Ranked table: flagged patterns first, then by growth exponent"""
+    rows = audits[:top] if top else audits
+    if not rows:
+        return "No patterns to audit"
+    source_width = min(max(len('Source'), *(len(a.source) for a in rows)), 48)
+    long_label = f'ms@{length * LENGTH_RATIO}'
+    lines = [
+        f"   {'Source':<{source_width}}  {'Growth':>6}  {long_label:>10}  {'Worst input':<20}  Pattern",
+        '   ' + '-' * (source_width + 80),
+    ]
+    for a in rows:
+        growth = 'inf' if a.exponent == math.inf else ('-' if a.exponent is None else f'n^{a.exponent:.1f}')
+        long_ms = '-' if a.long_ms is None else f'{a.long_ms:.2f}'
+        pattern = a.pattern if len(a.pattern) <= 60 else a.pattern[:57] + '...'
+        lines.append(
+            f"{STATUS_ICONS[a.status]} {a.source[:source_width]:<{source_width}}  {growth:>6}  {long_ms:>10}  "
+            f"{(a.worst_input or a.error or '')[:20]:<20}  {pattern}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,162 @@
+"""
+Benchmark runner: times each case over generated corpora and writes JSON
+
+Result layout (also the baseline format):
+
+    {
+      "meta": {...environment and corpus spec...},
+      "results": {
+        "<pages>": {
+          "<case name>": {"target": ..., "median_ms": ..., "min_ms": ..., "max_ms": ...,
+                          "runs_ms": [...], "peak_kb": ...},
+          ...
+        }
+      }
+    }
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .cases import BenchCase, BenchContext, select_cases
+from .corpus import CorpusSpec, ensure_corpus
+
+DEFAULT_CORPUS_ROOT = Path(tempfile.gettempdir()) / 'docs_analyzer_bench'
+
+# Cases slower than this per pass get fewer samples and no traced memory run
+SLOW_CASE_MS = 2000
+SLOW_CASE_REPEATS = 3
+
+
+@contextmanager
+def quiet():
+    """Silence analyzer/fixer progress prints while timing"""
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        yield
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+
+
+def measure(func: Callable[[], Any], repeats: int, memory: bool = True) -> Dict[str, Any]:
+    """
+    Time func repeatedly; peak memory comes from one extra traced run
+
+    The first call warms caches and is discarded, unless it already took
+    longer than SLOW_CASE_MS: then it counts as a sample, at most
+    SLOW_CASE_REPEATS samples are taken and the traced run is skipped
+    (tracemalloc slows allocation-heavy code several times over, so it is
+    never enabled during timed runs).
+    """
+    def timed() -> float:
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        return (time.perf_counter() - start) * 1000
+
+    first = timed()
+    slow = first > SLOW_CASE_MS
+    if slow:
+        runs = [first] + [timed() for _ in range(min(repeats, SLOW_CASE_REPEATS) - 1)]
+    else:
+        runs = [timed() for _ in range(repeats)]
+
+    result = {
+        'median_ms': round(statistics.median(runs), 3),
+        'min_ms': round(min(runs), 3),
+        'max_ms': round(max(runs), 3),
+        'runs_ms': [round(run, 3) for run in runs],
+    }
+
+    if memory and not slow:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result['peak_kb'] = round(peak / 1024, 1)
+
+    return result
+
+
+def run_suite(pages_list: List[int], cases: Optional[List[BenchCase]] = None, repeats: int = 5,
+              spec: Optional[CorpusSpec] = None, corpus_root: Path = DEFAULT_CORPUS_ROOT,
+              memory: bool = True, progress: Callable[[str], None] = print) -> Dict[str, Any]:
+    """
+    Run cases against a corpus of each size
+
+    Args:
+        pages_list: Corpus sizes (number of pages)
+        cases: Cases to run (default: all)
+        repeats: Timed runs per case; the median is reported
+        spec: Corpus template; pages is overridden per size
+        corpus_root: Where generated corpora are cached
+        memory: Also record peak traced memory per case
+        progress: Callback for progress lines
+    """
+    cases = cases if cases is not None else select_cases()
+    spec = spec or CorpusSpec()
+
+    results: Dict[str, Any] = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeats': repeats,
+            'corpus': {k: v for k, v in asdict(spec).items() if k != 'pages'},
+        },
+        'results': {},
+    }
+
+    for pages in pages_list:
+        size_spec = replace(spec, pages=pages)
+        corpus_dir = Path(corpus_root) / f"pages-{pages}-seed-{size_spec.seed}"
+        progress(f"📚 Corpus: {pages} pages ({corpus_dir})")
+        files = ensure_corpus(corpus_dir, size_spec)
+
+        with quiet():
+            context = BenchContext(corpus_dir, files)
+
+        size_results = results['results'][str(pages)] = {}
+        for case in cases:
+            if not case.applies_to(pages):
+                size_results[case.name] = {'target': case.target, 'skipped': f'max_pages={case.max_pages}'}
+                continue
+
+            with quiet():
+                func = case.prepare(context)
+                measured = measure(func, repeats, memory=memory)
+
+            size_results[case.name] = {'target': case.target, **measured}
+            progress(f"   {case.name:<60} {measured['median_ms']:>10.2f} ms")
+
+    return results
+
+
+def save_results(results: Dict[str, Any], path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write('\n')
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
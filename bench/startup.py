@@ -0,0 +1,51 @@
+"""
+CLI startup benchmarks
+
+Times fresh interpreters running the entry points with --help and reads
+`python -X importtime` output to name the imports that dominate startup.
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Startup case name -> script arguments
+STARTUP_COMMANDS: Dict[str, List[str]] = {
+    'doc_analyzer': ['doc_analyzer.py', '--help'],
+    'doc_fixer': ['doc_fixer.py', '--help'],
+    'analyze_docs': ['analyze_docs.py', '--help'],
+}
+
+# Startup should stay well under a second; `bench startup` flags slower commands
+STARTUP_BUDGET_MS = 500
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def run_command(args: List[str]):
+    """Run one entry point in a fresh interpreter"""
+    subprocess.run([sys.executable] + args, cwd=REPO_ROOT, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=True)
+
+
+def import_profile(args: List[str]) -> List[Tuple[str, float]]:
+    """
+    Top-level imports of one command with their cumulative time
+
+    Returns:
+        (module, cumulative ms) for modules imported directly by the
+        script or its first-level imports, slowest first
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=REPO_ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        # Indentation is two spaces per nesting level; keep the outermost two levels
+        if match and len(match.group(3)) <= 3:
+            modules.append((match.group(4), int(match.group(2)) / 1000))
+    return sorted(modules, key=lambda module: module[1], reverse=True)
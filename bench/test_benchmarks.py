@@ -0,0 +1,52 @@
+"""
+pytest-benchmark entry point for the benchmark cases
+
+    pip install pytest-benchmark
+    BENCH_PAGES=10,1000 pytest bench/test_benchmarks.py --benchmark-json=results.json
+
+BENCH_PAGES lists the corpus sizes (default: 10). `python -m bench run`
+produces the same measurements in the baseline format without the plugin.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from bench.cases import CASES, BenchContext
+from bench.corpus import CorpusSpec, ensure_corpus
+from bench.runner import DEFAULT_CORPUS_ROOT, quiet
+
+PAGES = [int(p) for p in os.getenv('BENCH_PAGES', '10').split(',') if p.strip()]
+
+_contexts = {}
+
+
+def _context(pages: int) -> BenchContext:
+    if pages not in _contexts:
+        spec = CorpusSpec(pages=pages)
+        corpus_dir = DEFAULT_CORPUS_ROOT / f"pages-{pages}-seed-{spec.seed}"
+        files = ensure_corpus(corpus_dir, spec)
+        with quiet():
+            _contexts[pages] = BenchContext(corpus_dir, files)
+    return _contexts[pages]
+
+
+@pytest.mark.parametrize('pages', PAGES)
+@pytest.mark.parametrize('case', CASES, ids=[case.name for case in CASES])
+def test_case(benchmark, case, pages):
+    if not case.applies_to(pages):
+        pytest.skip(f'{case.name} only runs up to {case.max_pages} pages')
+
+    context = _context(pages)
+    with quiet():
+        func = case.prepare(context)
+    benchmark.group = f'{pages} pages'
+    benchmark.extra_info['target'] = case.target
+
+    def run():
+        with quiet():
+            func()
+
+    benchmark.pedantic(run, rounds=3, warmup_rounds=1)
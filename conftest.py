@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cost_ledger(tmp_path, monkeypatch):
+    """Keep AI call records from tests out of the shared cost ledger"""
+    ledger = tmp_path / 'ai_cost_ledger.jsonl'
+    monkeypatch.setenv('AI_COST_LEDGER', str(ledger))
+    return ledger
@@ -5,5 +5,6 @@ Contains shared models, configuration, and base classes
 
 from .models import FixResult, Issue
 from .config import Config
+from .documents import Document, DocumentStore
 
-__all__ = ['FixResult', 'Issue', 'Config']
+__all__ = ['FixResult', 'Issue', 'Config', 'Document', 'DocumentStore']
@@ -0,0 +1,205 @@
+"""
+File ingestion and the in-process document store
+
+SourceFile memory-maps large files (generated API references can be
+several MB) and decodes straight from the mapping, or only the lines or
+byte ranges a caller asks for; small files are read normally.
+
+DocumentStore reads each documentation file once so the analyzer and the
+fixer chain of a single-process run (analyze_docs.py --in-process) share
+the same contents instead of walking and reading the tree twice.
+DocumentFeatures are the cheap facts about a file the fixers' prefilters
+are checked against.
+"""
+
+import codecs
+import io
+import mmap
+import os
+from array import array
+from dataclasses import dataclass, fields
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+# Files at least this large are memory-mapped instead of read
+MMAP_THRESHOLD = 1 << 20
+
+
+class SourceFile:
+    """
+    One file's bytes, memory-mapped when large
+
+    Text is decoded on first use with the same newline handling as
+    open(path, 'r'). Line offsets and byte slices come from the raw bytes
+    without decoding the whole file; slices stay valid until close().
+    """
+
+    def __init__(self, path: Union[str, Path], mmap_threshold: int = MMAP_THRESHOLD):
+        self.path = Path(path)
+        self._text: Optional[str] = None
+        self._line_offsets: Optional[array] = None
+        with open(self.path, 'rb') as f:
+            self.size = os.fstat(f.fileno()).st_size
+            self.mapped = 0 < self.size and self.size >= mmap_threshold
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.mapped else f.read()
+
+    @property
+    def text(self) -> str:
+        """
+        Decoded contents (universal newlines)
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        if self._text is None:
+            text = str(self._data, 'utf-8')
+            if self._data.find(b'\r') != -1:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            self._text = text
+        return self._text
+
+    def char_count(self, chunk_size: int = MMAP_THRESHOLD) -> int:
+        """len(self.text), decoded a chunk at a time so the full text is never built"""
+        if self._text is not None:
+            return len(self._text)
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+        view = memoryview(self._data)
+        try:
+            count = 0
+            for start in range(0, self.size, chunk_size):
+                count += len(decoder.decode(view[start:start + chunk_size]))
+            return count + len(decoder.decode(b'', final=True))
+        finally:
+            view.release()
+
+    @property
+    def line_offsets(self) -> array:
+        """Byte offset where each line starts (lines end at \\n)"""
+        if self._line_offsets is None:
+            offsets = array('q', [0])
+            find = self._data.find
+            position = find(b'\n')
+            while position != -1:
+                offsets.append(position + 1)
+                position = find(b'\n', position + 1)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, counted like len(text.split('\\n'))"""
+        return len(self.line_offsets)
+
+    def line(self, number: int) -> str:
+        """Decoded line (1-based) without its line ending"""
+        offsets = self.line_offsets
+        if not 1 <= number <= len(offsets):
+            raise IndexError(f"{self.path} has no line {number}")
+        end = offsets[number] if number < len(offsets) else self.size
+        return str(self._data[offsets[number - 1]:end], 'utf-8').rstrip('\r\n')
+
+    def byte_slice(self, start: int, end: int) -> memoryview:
+        """Bytes start:end without copying (valid until close)"""
+        return memoryview(self._data)[start:end]
+
+    def close(self):
+        if self.mapped and not self._data.closed:
+            self._data.close()
+
+    def __enter__(self) -> 'SourceFile':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_text(path: Union[str, Path]) -> str:
+    """
+    Contents of a file (like open(path).read(), mmap-backed for large files)
+
+    Raises:
+        OSError, UnicodeDecodeError: As open().read() would for this file
+    """
+    with SourceFile(path) as source:
+        return source.text
+
+
+@dataclass(frozen=True)
+class DocumentFeatures:
+    """Markup a file contains, from substring scans (true may be a false alarm; false is certain)"""
+    has_code_blocks: bool
+    has_tables: bool
+    has_images: bool
+    has_links: bool
+
+    @classmethod
+    def of(cls, content: str) -> 'DocumentFeatures':
+        return cls(
+            has_code_blocks='```' in content,
+            has_tables='|' in content,
+            has_images='![' in content or '<img' in content,
+            has_links='](' in content or 'href=' in content,
+        )
+
+    @classmethod
+    def names(cls) -> List[str]:
+        return [f.name for f in fields(cls)]
+
+
+@dataclass
+class Document:
+    """One file's contents, or the error raised while reading it"""
+    path: Path
+    content: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @cached_property
+    def features(self) -> DocumentFeatures:
+        return DocumentFeatures.of(self.content or '')
+
+
+class DocumentStore:
+    """File contents keyed by path, read on first request"""
+
+    def __init__(self):
+        self._documents: Dict[Path, Document] = {}
+
+    def load(self, paths: Iterable[Path]) -> List[Document]:
+        """Read every path not already in the store"""
+        return [self._document(Path(path)) for path in paths]
+
+    def read(self, path: Path) -> str:
+        """
+        Contents of a file, reading it if needed
+
+        Raises:
+            OSError, UnicodeDecodeError: As open().read() would for this file
+        """
+        document = self._document(Path(path))
+        if document.error is not None:
+            raise document.error
+        return document.content
+
+    def features(self, path: Path) -> DocumentFeatures:
+        """Features of a file's stored contents (see read for errors)"""
+        document = self._document(Path(path))
+        if document.error is not None:
+            raise document.error
+        return document.features
+
+    def _document(self, path: Path) -> Document:
+        document = self._documents.get(path)
+        if document is None:
+            try:
+                document = Document(path=path, content=read_text(path))
+            except (OSError, UnicodeDecodeError) as e:
+                document = Document(path=path, error=e)
+            self._documents[path] = document
+        return document
+
+    def __contains__(self, path) -> bool:
+        return Path(path) in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
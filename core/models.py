@@ -78,6 +78,8 @@ class FixerStats:
     total_fixes_applied: int = 0
     fixes_by_type: dict = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
+    timeouts: List[str] = field(default_factory=list)  # fixer steps stopped by their time budget
+    prefilter_skips: dict = field(default_factory=dict)  # fixer name -> files its prefilters ruled out
 
     def add_result(self, result: FixResult):
         """Add a FixResult to statistics"""
@@ -100,7 +102,9 @@ class FixerStats:
             'files_modified': self.files_modified,
             'total_fixes_applied': self.total_fixes_applied,
             'fixes_by_type': self.fixes_by_type,
-            'errors': self.errors
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'prefilter_skips': self.prefilter_skips
         }
 
     def summary(self) -> str:
@@ -126,5 +130,17 @@ class FixerStats:
             if len(self.errors) > 5:
                 summary_lines.append(f"  ... and {len(self.errors) - 5} more")
 
+        if self.timeouts:
+            summary_lines.append(f"\nOut of time (skipped): {len(self.timeouts)}")
+            for timeout in self.timeouts[:5]:
+                summary_lines.append(f"  - {timeout}")
+            if len(self.timeouts) > 5:
+                summary_lines.append(f"  ... and {len(self.timeouts) - 5} more")
+
+        if self.prefilter_skips:
+            summary_lines.append("\nSkipped by prefilters:")
+            for fixer_name, count in sorted(self.prefilter_skips.items(), key=lambda x: x[1], reverse=True):
+                summary_lines.append(f"  - {fixer_name}: {count} file(s)")
+
         summary_lines.append(f"{'='*60}\n")
         return "\n".join(summary_lines)
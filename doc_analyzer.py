@@ -21,12 +21,10 @@ import hashlib
 import time
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set, Any
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from collections import defaultdict, Counter
 from datetime import datetime
 from urllib.parse import urlparse
-import anthropic
-from difflib import SequenceMatcher
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -39,8 +37,17 @@ from analyzers import (
     MintlifyValidator,
     SemanticAnalyzer,
     ContentDuplicationDetector,
-    UserJourneyAnalyzer
+    UserJourneyAnalyzer,
+    ReadabilityAnalyzer
 )
+from core.documents import DocumentStore, read_text
+from utils.profiling import Profiler
+from utils.sharding import check_complete, parse_shard, select_shard
+from utils.term_matrix import PhraseCounter, TermDocumentMatrix, normalize_term
+from utils.watchdog import CheckTimeout, Watchdog
+
+# Format tag of shard partial results (see --shard / --merge)
+PARTIAL_FORMAT = 'doc_analyzer.partial/2'
 
 
 def sanitize_content_for_ai(content: str) -> str:
@@ -69,13 +76,6 @@ def sanitize_content_for_ai(content: str) -> str:
 
     return content
 
-# Try to import optional dependencies
-try:
-    import git
-    GIT_AVAILABLE = True
-except ImportError:
-    GIT_AVAILABLE = False
-
 
 @dataclass
 class Issue:
@@ -101,6 +101,30 @@ class Issue:
             'context': self.context
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Issue':
+        """Inverse of to_dict"""
+        return cls(
+            severity=data['severity'],
+            category=data['category'],
+            file_path=data['file'],
+            line_number=data.get('line'),
+            issue_type=data['type'],
+            description=data['description'],
+            suggestion=data['suggestion'],
+            context=data.get('context')
+        )
+
+
+@dataclass
+class FileSummary:
+    """Per-file inputs of the cross-file phases, extracted while the file is analyzed"""
+    path: str  # relative to the repository root
+    headings: List[str] = field(default_factory=list)  # lowercased topics
+    term_counts: Dict[str, int] = field(default_factory=dict)  # tracked term variant -> occurrences
+    paragraphs: List[Tuple[int, str]] = field(default_factory=list)  # duplication candidates (first line, text)
+    readability: List[Tuple[int, int, int, int]] = field(default_factory=list)  # (line, words, sentences, syllables)
+
 
 @dataclass
 class AnalysisReport:
@@ -114,6 +138,8 @@ class AnalysisReport:
     issues: List[Issue] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
     ai_insights: List[str] = field(default_factory=list)
+    ai_usage: Dict[str, Any] = field(default_factory=dict)
+    readability: Dict[str, Any] = field(default_factory=dict)
     
     def add_issue(self, issue: Issue):
         self.issues.append(issue)
@@ -150,75 +176,201 @@ class DocumentationAnalyzer:
         self.semantic_analyzer = SemanticAnalyzer(config)
         self.duplication_detector = ContentDuplicationDetector(config)
         self.journey_analyzer = UserJourneyAnalyzer(config)
+        self.readability_analyzer = ReadabilityAnalyzer(config)
+
+        # Small files awaiting AI clarity analysis; sent together so they share requests
+        self._clarity_queue: List[Tuple[str, str]] = []
+
+        # Per-check timings (see --profile)
+        self.profiler = Profiler()
+
+        # Per-check and per-file time budgets (analysis.time_budgets)
+        self.watchdog = Watchdog.from_config(config.get('analysis', {}).get('time_budgets', {}))
+
+        # Cross-file inputs and per-file issues, keyed by relative path
+        self.file_summaries: Dict[str, FileSummary] = {}
+        self.file_issues: Dict[str, List[Issue]] = {}
+        self.clarity_issues: List[Issue] = []
+
+        # (index, count) when this run covers one shard (see --shard)
+        self.shard: Optional[Tuple[int, int]] = None
+
+        # Term variants tracked by the consistency analysis, counted once per file
+        self.term_variants = config.get('consistency', {}).get('term_variants', {})
+        self.term_counter = PhraseCounter(
+            variant for variant_info in self.term_variants.values() for variant in variant_info.get('variants', []))
+        self.term_matrix: Optional[TermDocumentMatrix] = None
+
+        # Contents shared with the fixers of a single-process run (see analyze_docs.py)
+        self.documents: Optional[DocumentStore] = None
     
-    def analyze_all(self) -> AnalysisReport:
-        """Run comprehensive analysis"""
+    def analyze_all(self, files: Optional[List[Path]] = None) -> AnalysisReport:
+        """
+        Run comprehensive analysis
+
+        Args:
+            files: Files to analyze (default: repo_manager.get_files())
+        """
         print("🔍 Starting documentation analysis...")
         print(f"Repository type: {self.repo_manager.repo_type}")
         
         # Get files
-        files = self.repo_manager.get_files()
+        if files is None:
+            files = self.repo_manager.get_files()
+        if self.shard:
+            index, count = self.shard
+            total = len(files)
+            files = select_shard(files, self.repo_manager.repo_path, index, count)
+            print(f"🧩 Shard {index}/{count}: {len(files)} of {total} files")
         self.report.total_files = len(files)
         
         print(f"Found {len(files)} documentation files")
         
         # Phase 1: File-level analysis
         for file_path in files:
-            print(f"  Analyzing: {file_path.relative_to(self.repo_manager.repo_path)}")
+            relative_path = str(file_path.relative_to(self.repo_manager.repo_path))
+            print(f"  Analyzing: {relative_path}")
+            before = len(self.report.issues)
             self.analyze_file(file_path)
+            self.file_issues[relative_path] = self.report.issues[before:]
+
+        # AI clarity analysis for queued files (small files are packed into shared requests)
+        if self._clarity_queue:
+            print(f"\n🤖 Running AI clarity analysis on {len(self._clarity_queue)} files...")
+            before = len(self.report.issues)
+            self._timed('analyzer', 'SemanticAnalyzer.analyze_clarity_batch',
+                        self.semantic_analyzer.analyze_clarity_batch, self._clarity_queue, self.report.issues)
+            self.clarity_issues = self.report.issues[before:]
+            self._clarity_queue = []
         
+        if self.shard:
+            # Cross-file phases need every shard; they run in --merge
+            print("\n🧩 Cross-file analysis deferred to --merge")
+        else:
+            self.analyze_cross_file(files)
+        
+        self._finish_report()
+        
+        print(f"\n✅ Analysis complete! Found {self.report.total_issues} issues")
+        return self.report
+    
+    def analyze_cross_file(self, files: List[Path]):
+        """Cross-file and advanced phases over the whole documentation set"""
+        summaries = self._summaries_for(files)
+
         # Phase 2: Cross-file analysis
         print("\n📊 Running cross-file analysis...")
-        doc_structure = self._build_doc_structure(files)
-        self.analyze_information_architecture(files)
-        self.analyze_consistency(files)
+        doc_structure = self._timed('cross_file', '_build_doc_structure', self._doc_structure, summaries)
+        self._timed('cross_file', 'analyze_information_architecture', self.analyze_information_architecture, files)
+        self._timed('cross_file', 'analyze_consistency', self.analyze_consistency, files)
         
         # Phase 3: Advanced analysis
         print("\n🧠 Running advanced analysis...")
-        self.detect_content_gaps(doc_structure)
-        self.duplication_detector.find_duplicates(files, self.report.issues)
-        self.journey_analyzer.validate_journeys(doc_structure, self.report.issues)
+        self._timed('cross_file', 'detect_content_gaps', self.detect_content_gaps, doc_structure)
+        file_paragraphs = {str(self.repo_manager.repo_path / s.path): s.paragraphs for s in summaries}
+        self._timed('analyzer', 'ContentDuplicationDetector.find_duplicates',
+                    self.duplication_detector.find_duplicates_in, file_paragraphs, self.report.issues)
+        self._timed('analyzer', 'UserJourneyAnalyzer.validate_journeys',
+                    self.journey_analyzer.validate_journeys, doc_structure, self.report.issues)
+        self.report.readability = self._timed(
+            'analyzer', 'ReadabilityAnalyzer.analyze', self.readability_analyzer.analyze,
+            {s.path: s.readability for s in summaries}, self.report.issues)
         
         # AI semantic analysis
         if self.semantic_analyzer.enabled:
             print("\n🤖 Running AI semantic analysis...")
-            self.semantic_analyzer.analyze_semantic_gaps(
-                doc_structure, 
-                self.report.issues, 
-                self.report.ai_insights
-            )
+            self._timed('analyzer', 'SemanticAnalyzer.analyze_semantic_gaps',
+                        self.semantic_analyzer.analyze_semantic_gaps,
+                        doc_structure, self.report.issues, self.report.ai_insights)
+    
+    def _finish_report(self):
+        """Summary counts, AI usage and recommendations once all issues are in"""
+        # Analyzer modules append to report.issues directly, bypassing add_issue's counters
+        (self.report.total_issues, self.report.issues_by_severity,
+         self.report.issues_by_category) = self._recalculate_summary()
+        
+        # AI call telemetry for this run (latency, tokens, cost) and cumulative ledger
+        telemetry = self.semantic_analyzer.telemetry
+        if telemetry.calls:
+            self.report.ai_usage = telemetry.to_dict()
+            print(telemetry.summary())
+            print(telemetry.cache.summary())
+            telemetry.write_ledger()
         
+        # Checks stopped by their time budget (from the issues, so merged shards count too)
+        timeouts = Counter(issue.context for issue in self.report.issues if issue.issue_type == 'check_timeout')
+        if timeouts:
+            print("\n⏱️  Checks that ran out of time:")
+            for check, count in timeouts.most_common():
+                print(f"  - {check}: {count} file{'s' if count != 1 else ''}")
+
         # Generate recommendations
         self.generate_recommendations()
-        
-        print(f"\n✅ Analysis complete! Found {self.report.total_issues} issues")
-        return self.report
     
+    def _timed(self, category: str, name: str, func, *args, file_path: Optional[str] = None):
+        """Call func(*args) under the profiler, counting issues it adds to the report"""
+        with self.profiler.measure(category, name, file_path, self.report.issues):
+            return func(*args)
+
+    def _budgeted(self, category: str, name: str, func, *args, file_path: str):
+        """
+        _timed under the watchdog; a check that runs out of time becomes a check_timeout issue
+
+        Raises:
+            CheckTimeout: If the file's budget is spent (its remaining checks are skipped)
+        """
+        try:
+            return self._timed(category, name, self.watchdog.call, name, func, *args, file_path=file_path)
+        except CheckTimeout as e:
+            self.report.add_issue(Issue(
+                severity='medium',
+                category='technical',
+                file_path=file_path,
+                line_number=None,
+                issue_type='check_timeout',
+                description=f'{name} stopped after {e.seconds:g}s ({e.scope} time budget)',
+                suggestion='Look for very long lines or unterminated markup, or raise analysis.time_budgets',
+                context=name
+            ))
+            if e.scope == 'file':
+                raise
+
     def analyze_file(self, file_path: Path):
         """Analyze a single file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read(file_path)
             
             relative_path = str(file_path.relative_to(self.repo_manager.repo_path))
+            self.file_summaries[relative_path] = self.summarize_file(relative_path, content)
             
-            # Phase 1 checks
-            if self.repo_manager.repo_type == 'mintlify':
-                self.mintlify_validator.validate_frontmatter(relative_path, content, self.report.issues)
-                self.mintlify_validator.validate_components(relative_path, content, self.report.issues)
-                self.mintlify_validator.validate_internal_links(relative_path, content, self.report.issues)
-            
-            # Core checks
-            self.check_readability(content, relative_path)
-            self.check_style_guide(content, relative_path)
-            self.check_structure(content, relative_path)
-            self.check_formatting(content, relative_path)
-            self.check_links(content, relative_path, file_path)
+            with self.watchdog.file(relative_path):
+                # Phase 1 checks
+                if self.repo_manager.repo_type == 'mintlify':
+                    for validate in (self.mintlify_validator.validate_frontmatter,
+                                     self.mintlify_validator.validate_components,
+                                     self.mintlify_validator.validate_internal_links):
+                        self._budgeted('analyzer', f'MintlifyValidator.{validate.__name__}', validate,
+                                       relative_path, content, self.report.issues, file_path=relative_path)
+
+                # Core checks
+                for check in (self.check_readability, self.check_style_guide,
+                              self.check_structure, self.check_formatting):
+                    self._budgeted('check', check.__name__, check, content, relative_path, file_path=relative_path)
+                self._budgeted('check', 'check_links', self.check_links, content, relative_path, file_path,
+                               file_path=relative_path)
             
             # AI-powered clarity check
             if self.semantic_analyzer.enabled and self.config.get('analysis', {}).get('enable_ai_analysis', True):
-                self.semantic_analyzer.analyze_clarity(relative_path, content, self.report.issues)
+                # Only packable files wait for phase 2; holding larger ones would keep the corpus in memory
+                if self.semantic_analyzer.packable(content):
+                    self._clarity_queue.append((relative_path, content))
+                else:
+                    self._timed('analyzer', 'SemanticAnalyzer.analyze_clarity',
+                                self.semantic_analyzer.analyze_clarity,
+                                relative_path, content, self.report.issues, file_path=relative_path)
         
+        except CheckTimeout:
+            pass  # file budget spent; reported by _budgeted
         except Exception as e:
             self.report.add_issue(Issue(
                 severity='high',
@@ -231,63 +383,50 @@ class DocumentationAnalyzer:
             ))
     
     def check_readability(self, content: str, file_path: str):
-        """Check readability metrics"""
-        lines = content.split('\n')
-        in_code_block = False
-        
-        for i, line in enumerate(lines, 1):
-            # Track code blocks
-            if line.strip().startswith('```'):
-                in_code_block = not in_code_block
-                continue
-            
-            if in_code_block or line.strip().startswith('#'):
-                continue
-            
-            # Check line length
-            max_length = self.style_rules.get('max_line_length', 100)
-            if len(line) > max_length and not line.strip().startswith('http'):
-                self.report.add_issue(Issue(
-                    severity='low',
-                    category='clarity',
-                    file_path=file_path,
-                    line_number=i,
-                    issue_type='line_too_long',
-                    description=f'Line exceeds {max_length} characters',
-                    suggestion='Break into shorter lines or sentences',
-                    context=line[:100] + '...' if len(line) > 100 else line
-                ))
-            
-            # Check sentence length
-            if line.strip() and not line.strip().startswith(('*', '-', '>', '|')):
-                word_count = len(line.split())
-                max_words = self.style_rules.get('max_sentence_length', 30)
-                if word_count > max_words:
-                    self.report.add_issue(Issue(
-                        severity='medium',
-                        category='clarity',
-                        file_path=file_path,
-                        line_number=i,
-                        issue_type='sentence_too_long',
-                        description=f'Sentence has {word_count} words (recommend <{max_words})',
-                        suggestion='Break into shorter sentences for better readability',
-                        context=line[:100] + '...' if len(line) > 100 else line
-                    ))
-            
-            # Check for weak words
-            avoid_terms = self.style_rules.get('avoid_terms', [])
-            for term in avoid_terms:
-                if re.search(rf'\b{re.escape(term)}\b', line, re.IGNORECASE):
-                    self.report.add_issue(Issue(
-                        severity='low',
-                        category='style',
-                        file_path=file_path,
-                        line_number=i,
-                        issue_type='weak_language',
-                        description=f'Avoid weak or unnecessary word: "{term}"',
-                        suggestion='Remove or replace with more precise language',
-                        context=line.strip()
-                    ))
+        """Check readability metrics (from the same scan as the paragraph scores)"""
+        scan = self.readability_analyzer.scan(content)
+        max_length = self.readability_analyzer.max_line_length
+        max_words = self.readability_analyzer.max_sentence_words
+
+        issues = []
+        for i, line in scan.long_lines:
+            issues.append((i, 0, Issue(
+                severity='low',
+                category='clarity',
+                file_path=file_path,
+                line_number=i,
+                issue_type='line_too_long',
+                description=f'Line exceeds {max_length} characters',
+                suggestion='Break into shorter lines or sentences',
+                context=line[:100] + '...' if len(line) > 100 else line
+            )))
+        for i, word_count, sentence in scan.long_sentences:
+            issues.append((i, 1, Issue(
+                severity='medium',
+                category='clarity',
+                file_path=file_path,
+                line_number=i,
+                issue_type='sentence_too_long',
+                description=f'Sentence has {word_count} words (recommend <{max_words})',
+                suggestion='Break into shorter sentences for better readability',
+                context=sentence[:100] + '...' if len(sentence) > 100 else sentence
+            )))
+        for i, term, line in scan.weak_terms:
+            issues.append((i, 2, Issue(
+                severity='low',
+                category='style',
+                file_path=file_path,
+                line_number=i,
+                issue_type='weak_language',
+                description=f'Avoid weak or unnecessary word: "{term}"',
+                suggestion='Remove or replace with more precise language',
+                context=line
+            )))
+
+        # Report in line order, as the checks read the file
+        issues.sort(key=lambda item: item[:2])
+        for _, _, issue in issues:
+            self.report.add_issue(issue)
     
     def check_style_guide(self, content: str, file_path: str):
         """Check style guide compliance"""
@@ -457,27 +596,16 @@ class DocumentationAnalyzer:
         """Analyze consistency across docs"""
         print("\n🎨 Analyzing consistency...")
         
-        term_usage = defaultdict(lambda: defaultdict(list))
-        
-        term_variants = self.config.get('consistency', {}).get('term_variants', {})
-        
-        for file_path in files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read().lower()
-                    
-                    for canonical, variant_info in term_variants.items():
-                        variants = variant_info.get('variants', [])
-                        for variant in variants:
-                            if variant.lower() in content:
-                                term_usage[canonical][variant].append(str(file_path))
-            except Exception:
-                pass
+        # Variant x file occurrence counts; per-term usage is a row lookup
+        self.term_matrix = TermDocumentMatrix.from_counts(
+            {summary.path: summary.term_counts for summary in self._summaries_for(files)})
         
         # Report inconsistencies
-        for canonical, variants in term_usage.items():
-            if len(variants) > 2:
-                variant_info = self.config['consistency']['term_variants'][canonical]
+        for canonical, variant_info in self.term_variants.items():
+            variants = {variant: self.term_matrix.document_frequency(normalize_term(variant))
+                        for variant in variant_info.get('variants', [])}
+            used = {variant: count for variant, count in variants.items() if count}
+            if len(used) > 2:
                 correct_term = variant_info.get('canonical', canonical)
                 
                 self.report.add_issue(Issue(
@@ -486,8 +614,9 @@ class DocumentationAnalyzer:
                     file_path='[multiple]',
                     line_number=None,
                     issue_type='term_inconsistency',
-                    description=f'Inconsistent usage of "{canonical}": {len(variants)} variants',
-                    suggestion=f'Standardize on: "{correct_term}"'
+                    description=f'Inconsistent usage of "{canonical}": {len(used)} variants',
+                    suggestion=f'Standardize on: "{correct_term}"',
+                    context=', '.join(f'{variant} ({count} files)' for variant, count in used.items())
                 ))
     
     def detect_content_gaps(self, doc_structure: Dict[str, Any]):
@@ -528,33 +657,94 @@ class DocumentationAnalyzer:
     
     def _build_doc_structure(self, files: List[Path]) -> Dict[str, Any]:
         """Build documentation structure for analysis"""
+        return self._doc_structure(self._summaries_for(files))
+    
+    def _doc_structure(self, summaries: List[FileSummary]) -> Dict[str, Any]:
+        """Documentation structure (files, categories, heading topics) from file summaries"""
         structure = {
             'files': [],
             'categories': defaultdict(list),
             'topics': defaultdict(list)
         }
         
-        for file_path in files:
-            rel_path = file_path.relative_to(self.repo_manager.repo_path)
-            structure['files'].append(str(rel_path))
+        for summary in summaries:
+            rel_path = Path(summary.path)
+            structure['files'].append(summary.path)
             
             # Category
             if len(rel_path.parts) > 1:
                 category = rel_path.parts[0]
-                structure['categories'][category].append(str(rel_path))
+                structure['categories'][category].append(summary.path)
             
-            # Extract topics from headings
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    headings = re.findall(r'^#+\s+(.+)$', content, re.MULTILINE)
-                    for heading in headings:
-                        structure['topics'][heading.lower()].append(str(rel_path))
-            except Exception:
-                pass
+            # Topics from headings
+            for heading in summary.headings:
+                structure['topics'][heading].append(summary.path)
         
         return structure
     
+    def summarize_file(self, relative_path: str, content: str) -> FileSummary:
+        """Extract what the cross-file phases need from one file"""
+        return FileSummary(
+            path=relative_path,
+            headings=[heading.lower() for heading in re.findall(r'^#+\s+(.+)$', content, re.MULTILINE)],
+            term_counts=self.term_counter.count_text(content),
+            paragraphs=(self.duplication_detector.extract_paragraphs(content)
+                        if self.duplication_detector.enabled else []),
+            readability=self.readability_analyzer.score(content)
+        )
+    
+    def _summaries_for(self, files: List[Path]) -> List[FileSummary]:
+        """Summaries of files, reading any that were not analyzed in this run"""
+        summaries = []
+        for file_path in files:
+            relative_path = str(file_path.relative_to(self.repo_manager.repo_path))
+            summary = self.file_summaries.get(relative_path)
+            if summary is None:
+                try:
+                    summary = self.summarize_file(relative_path, self._read(file_path))
+                except Exception:
+                    summary = FileSummary(path=relative_path)
+            summaries.append(summary)
+        return summaries
+    
+    def _read(self, file_path: Path) -> str:
+        """File contents, from the shared document store when there is one"""
+        if self.documents is not None:
+            return self.documents.read(file_path)
+        return read_text(file_path)
+    
+    def export_partial(self, output_path: Optional[str] = None) -> str:
+        """Export this shard's per-file issues and cross-file inputs for --merge"""
+        index, count = self.shard
+        filename = f'doc_analysis_shard_{index}_of_{count}.json'
+        if not output_path:
+            output_path = str(self._create_timestamped_report_dir() / filename)
+        elif Path(output_path).is_dir():
+            output_path = str(Path(output_path) / filename)
+        
+        partial = {
+            'format': PARTIAL_FORMAT,
+            'shard': {'index': index, 'count': count},
+            'timestamp': self.report.timestamp,
+            'repository': self.report.repository_info,
+            'files': [
+                {**asdict(self.file_summaries.get(path, FileSummary(path=path))),
+                 'issues': [issue.to_dict() for issue in issues]}
+                for path, issues in self.file_issues.items()
+            ],
+            'clarity_issues': [issue.to_dict() for issue in self.clarity_issues],
+            'ai_insights': self.report.ai_insights,
+            'ai_calls': [asdict(entry) for entry in self.semantic_analyzer.telemetry.records],
+            'profile': self.profiler.rows(),
+        }
+        
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(partial, f, indent=2)
+        
+        print(f"\n🧩 Shard {index}/{count} partial exported to: {output_path}")
+        return output_path
+    
     def generate_recommendations(self):
         """Generate high-level recommendations"""
         print("\n💡 Generating recommendations...")
@@ -611,12 +801,14 @@ class DocumentationAnalyzer:
 
     def export_report(self, output_format: str = 'json', output_path: Optional[str] = None):
         """Export analysis report"""
-        if output_format == 'json':
-            return self._export_json(output_path)
-        elif output_format == 'html':
-            return self._export_html(output_path)
-        elif output_format == 'markdown':
-            return self._export_markdown(output_path)
+        exporters = {
+            'json': self._export_json,
+            'html': self._export_html,
+            'markdown': self._export_markdown,
+        }
+        if output_format in exporters:
+            with self.profiler.measure('export', output_format):
+                return exporters[output_format](output_path)
 
     def _export_json(self, output_path: Optional[str]) -> str:
         """Export as JSON"""
@@ -641,6 +833,9 @@ class DocumentationAnalyzer:
             },
             'recommendations': self.report.recommendations,
             'ai_insights': self.report.ai_insights,
+            'ai_usage': self.report.ai_usage,
+            'readability': self.report.readability,
+            'profile': self.profiler.to_dict(),
             'issues': [issue.to_dict() for issue in self.report.issues]
         }
 
@@ -833,6 +1028,15 @@ class DocumentationAnalyzer:
             for insight in self.report.ai_insights:
                 md += f"- {insight}\n"
         
+        if self.report.ai_usage:
+            usage = self.report.ai_usage
+            md += "\n## 💵 AI Usage\n\n"
+            md += f"- **Calls:** {usage['calls']} ({usage['failed_calls']} failed, {usage['retries']} retries)\n"
+            md += f"- **Latency:** p50 {usage['latency_ms']['p50']:.0f} ms, p95 {usage['latency_ms']['p95']:.0f} ms\n"
+            md += f"- **Tokens:** {usage['tokens']['input']:,} input, {usage['tokens']['output']:,} output, "
+            md += f"{usage['tokens']['cache_read_input']:,} cache read\n"
+            md += f"- **Cost:** ${usage['cost_usd']:.4f}\n"
+        
         md += "\n## Detailed Issues\n\n"
         
         for severity in ['critical', 'high', 'medium', 'low']:
@@ -860,6 +1064,129 @@ class DocumentationAnalyzer:
         return output_path
 
 
+def merge_partials(partial_paths: List[str], config: dict,
+                   docs_path: Optional[str] = None) -> DocumentationAnalyzer:
+    """
+    Combine shard partials and run the cross-file phases over all of them
+
+    Args:
+        partial_paths: One partial per shard (see --shard)
+        config: Analyzer configuration
+        docs_path: Repository path for issue paths (default: as recorded by the shards)
+
+    Returns:
+        Analyzer whose report matches a single-node run over the whole set
+
+    Raises:
+        ValueError: If the partials are malformed or do not cover every shard exactly once
+    """
+    partials = []
+    for path in partial_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            partial = json.load(f)
+        if partial.get('format') != PARTIAL_FORMAT:
+            raise ValueError(f"{path} is not a doc_analyzer shard partial")
+        partials.append(partial)
+    if not partials:
+        raise ValueError("No partials to merge")
+    check_complete([(p['shard']['index'], p['shard']['count']) for p in partials])
+
+    repository = partials[0]['repository']
+    config.setdefault('repository', {})['path'] = docs_path or repository['path']
+    config['repository']['type'] = repository.get('type') or 'auto'
+
+    repo_manager = RepositoryManager(config)
+    repo_manager.platform_config = repo_manager.load_platform_config()
+    analyzer = DocumentationAnalyzer(repo_manager, config)
+
+    # Same order as a single-node run: per-file issues by path, then AI clarity, then cross-file
+    entries = sorted((entry for p in partials for entry in p['files']), key=lambda entry: Path(entry['path']))
+    order = {entry['path']: i for i, entry in enumerate(entries)}
+    for entry in entries:
+        analyzer.file_summaries[entry['path']] = FileSummary(
+            path=entry['path'],
+            headings=entry['headings'],
+            term_counts=entry['term_counts'],
+            paragraphs=[tuple(row) for row in entry['paragraphs']],
+            readability=[tuple(row) for row in entry.get('readability', [])]
+        )
+        for issue in entry['issues']:
+            analyzer.report.add_issue(Issue.from_dict(issue))
+
+    clarity = sorted((issue for p in partials for issue in p['clarity_issues']),
+                     key=lambda issue: order.get(issue['file'], len(order)))
+    for issue in clarity:
+        analyzer.report.add_issue(Issue.from_dict(issue))
+
+    analyzer.report.total_files = len(entries)
+    for p in partials:
+        analyzer.report.ai_insights.extend(p.get('ai_insights', []))
+        analyzer.semantic_analyzer.telemetry.merge_records(p.get('ai_calls', []))
+        analyzer.profiler.merge(p.get('profile', []))
+
+    print(f"🧩 Merged {len(partials)} shards: {len(entries)} files, {len(analyzer.report.issues)} per-file issues")
+    analyzer.analyze_cross_file([repo_manager.repo_path / entry['path'] for entry in entries])
+    analyzer._finish_report()
+
+    print(f"\n✅ Analysis complete! Found {analyzer.report.total_issues} issues")
+    return analyzer
+
+
+def load_config(config_path: Optional[str] = None) -> dict:
+    """Load the analyzer config (config.yaml in the working directory by default)"""
+    if config_path:
+        with open(config_path, 'r') as f:
+            return yaml.safe_load(f)
+    if os.path.exists('config.yaml'):
+        with open('config.yaml', 'r') as f:
+            return yaml.safe_load(f)
+    return {'repository': {}, 'analysis': {}}
+
+
+def apply_cli_options(config: dict, docs_path: Optional[str] = None, repo_url: Optional[str] = None,
+                      repo_type: str = 'auto', repo_root: Optional[str] = None, no_ai: bool = False):
+    """Override config with command-line options (shared with analyze_docs.py)"""
+    config.setdefault('repository', {})
+    config.setdefault('analysis', {})
+    
+    if repo_url:
+        config['repository']['remote'] = {
+            'enabled': True,
+            'url': repo_url,
+            'branch': 'main'
+        }
+    elif docs_path:
+        config['repository']['path'] = docs_path
+    
+    if repo_type != 'auto':
+        config['repository']['type'] = repo_type
+
+    if repo_root:
+        config['repository']['root'] = repo_root
+
+    if no_ai:
+        config['analysis']['enable_ai_analysis'] = False
+        config['gap_detection'] = config.get('gap_detection', {})
+        config['gap_detection']['semantic_analysis'] = {'enabled': False}
+
+
+def prepare_repository(config: dict) -> RepositoryManager:
+    """Repository manager with the remote cloned (if configured) and platform detected"""
+    repo_manager = RepositoryManager(config)
+    
+    # Handle remote cloning
+    if config.get('repository', {}).get('remote', {}).get('enabled'):
+        print("📥 Cloning remote repository...")
+        repo_manager.repo_path = repo_manager.clone_remote_repo()
+    
+    # Load platform config
+    repo_manager.platform_config = repo_manager.load_platform_config()
+    
+    print(f"📁 Repository: {repo_manager.repo_path}")
+    print(f"🔧 Platform: {repo_manager.repo_type}")
+    return repo_manager
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -921,69 +1248,85 @@ def main():
         help='Disable AI-powered analysis (faster but less comprehensive)'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print a per-check timing table after the run'
+    )
     
-    # Load configuration
-    if args.config:
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
-    elif os.path.exists('config.yaml'):
-        # Load config.yaml by default if it exists
-        with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
-    else:
-        config = {'repository': {}, 'analysis': {}}
+    parser.add_argument(
+        '--profile-output',
+        help='Also run under cProfile and write pstats data to this file',
+        default=None
+    )
     
-    # Determine repository path
-    if args.repo_url:
-        config['repository']['remote'] = {
-            'enabled': True,
-            'url': args.repo_url,
-            'branch': 'main'
-        }
-        docs_path = None  # Will be cloned
-    elif args.docs_path:
-        docs_path = args.docs_path
-        config['repository']['path'] = docs_path
-    elif 'repository' in config and 'path' in config['repository']:
-        docs_path = config['repository']['path']
-    else:
-        parser.error("Must specify docs_path, --config with repository.path, or --repo-url")
+    # Sharded runs
+    parser.add_argument(
+        '--shard',
+        help='Analyze only shard i of N (e.g. 2/4) and write a partial result for --merge',
+        default=None
+    )
     
-    # Override config with CLI args
-    if args.repo_type != 'auto':
-        config['repository']['type'] = args.repo_type
-
-    if args.repo_root:
-        config['repository']['root'] = args.repo_root
-
-    if args.no_ai:
-        config['analysis']['enable_ai_analysis'] = False
-        config['gap_detection'] = config.get('gap_detection', {})
-        config['gap_detection']['semantic_analysis'] = {'enabled': False}
+    parser.add_argument(
+        '--merge',
+        nargs='+',
+        metavar='PARTIAL',
+        help='Merge shard partials, run the cross-file analysis and write the full report',
+        default=None
+    )
     
-    # Initialize repository manager
-    repo_manager = RepositoryManager(config)
+    args = parser.parse_args()
     
-    # Handle remote cloning
-    if config.get('repository', {}).get('remote', {}).get('enabled'):
-        print("📥 Cloning remote repository...")
-        repo_manager.repo_path = repo_manager.clone_remote_repo()
+    shard = None
+    if args.shard:
+        if args.merge:
+            parser.error("--shard and --merge cannot be combined")
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
     
-    # Load platform config
-    repo_manager.platform_config = repo_manager.load_platform_config()
+    # Load configuration
+    config = load_config(args.config)
     
-    print(f"📁 Repository: {repo_manager.repo_path}")
-    print(f"🔧 Platform: {repo_manager.repo_type}")
+    # Determine repository path (--merge takes it from the partials)
+    if not (args.repo_url or args.docs_path or args.merge
+            or ('repository' in config and 'path' in config['repository'])):
+        parser.error("Must specify docs_path, --config with repository.path, or --repo-url")
     
-    # Initialize analyzer
-    analyzer = DocumentationAnalyzer(repo_manager, config)
+    # Override config with CLI args
+    apply_cli_options(config, docs_path=args.docs_path, repo_url=args.repo_url, repo_type=args.repo_type,
+                      repo_root=args.repo_root, no_ai=args.no_ai)
     
-    # Run analysis
-    report = analyzer.analyze_all()
+    if args.merge:
+        try:
+            analyzer = merge_partials(args.merge, config, args.docs_path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Cannot merge partials: {e}")
+            raise SystemExit(1)
+        repo_manager = analyzer.repo_manager
+        report = analyzer.report
+    else:
+        repo_manager = prepare_repository(config)
+        
+        # Initialize analyzer
+        analyzer = DocumentationAnalyzer(repo_manager, config)
+        analyzer.shard = shard
+        
+        # Run analysis (optionally under cProfile)
+        if args.profile_output:
+            import cProfile
+            profiler = cProfile.Profile()
+            report = profiler.runcall(analyzer.analyze_all)
+            profiler.dump_stats(args.profile_output)
+            print(f"📈 cProfile data written to: {args.profile_output} (view with: python -m pstats {args.profile_output})")
+        else:
+            report = analyzer.analyze_all()
     
-    # Export report
-    if args.format == 'all':
+    # Export report (a shard only writes its partial)
+    if shard:
+        analyzer.export_partial(args.output)
+    elif args.format == 'all':
         analyzer.export_report('json', args.output)
         analyzer.export_report('html', args.output)
         analyzer.export_report('markdown', args.output)
@@ -1002,6 +1345,16 @@ def main():
     
     if report.ai_insights:
         print(f"   AI Insights: {len(report.ai_insights)}")
+    
+    if report.ai_usage:
+        latency = report.ai_usage['latency_ms']
+        print(f"   AI calls: {report.ai_usage['calls']} "
+              f"(p50 {latency['p50']:.0f} ms, p95 {latency['p95']:.0f} ms)")
+        print(f"   AI cost: ${report.ai_usage['cost_usd']:.4f}")
+    
+    if args.profile:
+        print("\n⏱️  Per-check timings (slowest first):")
+        print(analyzer.profiler.format_table())
 
 
 if __name__ == '__main__':
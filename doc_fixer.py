@@ -15,37 +15,19 @@ Usage:
 import argparse
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import shutil
 from datetime import datetime
 import json
 from dataclasses import dataclass, field, asdict
 
 from core.config import Config
+from core.documents import DocumentFeatures, DocumentStore, read_text
 from core.models import FixResult, FixerStats
-from fixers import (
-    FrontmatterFixer,
-    TerminologyFixer,
-    URLFixer,
-    CodeBlockFixer,
-    GitHubInformedFixer,
-    StyleGuideValidationFixer,
-    # High-impact fixers
-    CodeLanguageTagFixer,
-    HeadingHierarchyFixer,
-    LinkTextImprover,
-    LongSentenceSplitter,
-    PassiveVoiceConverter,
-    MissingPrerequisitesDetector,
-    # Style consistency fixers
-    CapitalizationFixer,
-    TerminologyConsistencyFixer,
-    CalloutStandardizationFixer,
-    BrokenLinkDetector,
-    ProductionCodeValidator,
-    # Accessibility
-    AccessibilityFixer,
-)
+from utils.profiling import Profiler
+from utils.sharding import check_complete, parse_shard, select_shard
+from utils.watchdog import CheckTimeout, Watchdog
+from fixers import enabled_fixers, load_fixer_class
 import os
 
 
@@ -57,6 +39,7 @@ class FixReport:
     summary: Dict[str, Any]
     fixes: List[Dict[str, Any]] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
+    profile: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self):
         """Convert to dictionary for JSON export"""
@@ -65,7 +48,8 @@ class FixReport:
             'repository': self.repository,
             'summary': self.summary,
             'fixes': self.fixes,
-            'recommendations': self.recommendations
+            'recommendations': self.recommendations,
+            'profile': self.profile
         }
 
 
@@ -83,83 +67,32 @@ class DocFixer:
         """
         self.config = Config(config_path) if config_path else Config()
 
-        # Check environment variable for style guide validator toggle
-        env_enable = os.getenv('ENABLE_STYLE_GUIDE_VALIDATOR', 'true').lower()
-        if env_enable in ['false', '0', 'no']:
-            enable_style_guide = False
-
-        # Initialize core fixers (always enabled)
-        self.fixers = [
-            FrontmatterFixer(self.config),
-            TerminologyFixer(self.config),
-            URLFixer(self.config),
-            CodeBlockFixer(self.config),
-            GitHubInformedFixer(self.config)  # GitHub user-informed quality checks
-        ]
-
-        # Add style guide validator if enabled (uses Claude AI API)
-        if enable_style_guide:
-            try:
-                self.fixers.append(StyleGuideValidationFixer(self.config))
-                print("✓ Style Guide Validator enabled (with Claude AI analysis)")
-            except Exception as e:
-                print(f"⚠ Warning: Could not enable Style Guide Validator: {e}")
-
-        # High-impact fixers (toggleable via environment variables)
-        if os.getenv('ENABLE_CODE_LANGUAGE_FIXER', 'true').lower() not in ['false', '0', 'no']:
-            self.fixers.append(CodeLanguageTagFixer(self.config))
-            print("✓ Code Language Tag Fixer enabled")
-
-        if os.getenv('ENABLE_HEADING_HIERARCHY_FIXER', 'true').lower() not in ['false', '0', 'no']:
-            self.fixers.append(HeadingHierarchyFixer(self.config))
-            print("✓ Heading Hierarchy Fixer enabled")
-
-        if os.getenv('ENABLE_LINK_TEXT_IMPROVER', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(LinkTextImprover(self.config))
-            print("✓ Link Text Improver enabled (manual fix required)")
-
-        if os.getenv('ENABLE_LONG_SENTENCE_SPLITTER', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(LongSentenceSplitter(self.config))
-            print("✓ Long Sentence Splitter enabled")
-
-        if os.getenv('ENABLE_PASSIVE_VOICE_CONVERTER', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(PassiveVoiceConverter(self.config))
-            print("✓ Passive Voice Converter enabled (manual fix required)")
-
-        if os.getenv('ENABLE_MISSING_PREREQUISITES_DETECTOR', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(MissingPrerequisitesDetector(self.config))
-            print("✓ Missing Prerequisites Detector enabled (manual fix required)")
-
-        # Style consistency fixers (toggleable via environment variables)
-        if os.getenv('ENABLE_CAPITALIZATION_FIXER', 'true').lower() not in ['false', '0', 'no']:
-            self.fixers.append(CapitalizationFixer(self.config))
-            print("✓ Capitalization Fixer enabled")
-
-        if os.getenv('ENABLE_TERMINOLOGY_CONSISTENCY_FIXER', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(TerminologyConsistencyFixer(self.config))
-            print("✓ Terminology Consistency Fixer enabled")
-
-        if os.getenv('ENABLE_CALLOUT_STANDARDIZATION_FIXER', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(CalloutStandardizationFixer(self.config))
-            print("✓ Callout Standardization Fixer enabled")
-
-        if os.getenv('ENABLE_BROKEN_LINK_DETECTOR', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(BrokenLinkDetector(self.config))
-            print("✓ Broken Link Detector enabled (manual fix required)")
-
-        if os.getenv('ENABLE_PRODUCTION_CODE_VALIDATOR', 'false').lower() not in ['false', '0', 'no']:
-            self.fixers.append(ProductionCodeValidator(self.config))
-            print("✓ Production Code Validator enabled (manual fix required)")
-
-        # Accessibility fixer (WCAG 2.1 AA compliance)
-        if os.getenv('ENABLE_ACCESSIBILITY_FIXER', 'true').lower() not in ['false', '0', 'no']:
-            self.fixers.append(AccessibilityFixer(self.config))
-            print("✓ Accessibility Fixer enabled (WCAG 2.1 AA compliance)")
+        # Only enabled fixers are imported and instantiated (see fixers/registry.py);
+        # ENABLE_* environment variables toggle them
+        self.fixers = []
+        for spec in enabled_fixers(enable_style_guide):
+            if spec.name == 'StyleGuideValidationFixer':
+                # Uses Claude AI; a missing dependency or bad rules file only disables it
+                try:
+                    fixer = load_fixer_class(spec.name)(self.config)
+                except Exception as e:
+                    print(f"⚠ Warning: Could not enable Style Guide Validator: {e}")
+                    continue
+            else:
+                fixer = load_fixer_class(spec.name)(self.config)
+            self.fixers.append(fixer)
+            if spec.label:
+                print(f"✓ {spec.label}")
 
         self.stats = FixerStats()
         self.all_fix_results = []  # Store all fixes for report generation
+        self.shard = None  # (index, count) of a sharded run
+        self.profiler = Profiler()  # Per-fixer timings (see --profile)
+        self.documents: Optional[DocumentStore] = None  # Contents shared with the analyzer (analyze_docs.py)
+        self.watchdog = Watchdog.from_config(self.config.get('analysis.time_budgets', {}))
 
-    def process_directory(self, docs_path: Path, dry_run: bool = False, backup: bool = True) -> FixerStats:
+    def process_directory(self, docs_path: Path, dry_run: bool = False, backup: bool = True,
+                          shard: Optional[tuple] = None, files: Optional[List[Path]] = None) -> FixerStats:
         """
         Process all markdown/mdx files in directory
 
@@ -167,18 +100,25 @@ class DocFixer:
             docs_path: Path to documentation directory
             dry_run: If True, don't write changes to disk
             backup: If True, create backups before modifying
+            shard: Optional (index, count) to process only that shard's files
+            files: Files to process (default: every .mdx file under docs_path)
 
         Returns:
             FixerStats with summary of changes
         """
-        # Find all MDX files (not MD)
-        md_files = list(docs_path.rglob("*.mdx"))
+        # Find all MDX files (not MD), in a stable order
+        md_files = sorted(docs_path.rglob("*.mdx")) if files is None else files
+        self.shard = shard
+        if shard:
+            md_files = select_shard(md_files, docs_path, *shard)
 
         print(f"\n{'='*70}")
         print(f"Documentation Fixer")
         print(f"{'='*70}")
         print(f"Target directory: {docs_path}")
         print(f"Files found: {len(md_files)}")
+        if shard:
+            print(f"Shard: {shard[0]}/{shard[1]}")
         print(f"Mode: {'DRY RUN' if dry_run else 'LIVE'}")
         print(f"Backup: {'Enabled' if backup else 'Disabled'}")
         print(f"{'='*70}\n")
@@ -228,29 +168,53 @@ class DocFixer:
         """
         try:
             # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            if self.documents is not None:
+                original_content = self.documents.read(file_path)
+                features = self.documents.features(file_path)
+            else:
+                original_content = read_text(file_path)
+                features = DocumentFeatures.of(original_content)
 
             current_content = original_content
             all_fixes = []
             all_issues_fixed = []
 
-            # Apply each fixer in sequence
-            for fixer in self.fixers:
-                # Check for issues
-                issues = fixer.check_file(str(file_path), current_content)
-
-                # Filter to auto-fixable issues only
-                auto_fixable = [i for i in issues if i.auto_fixable]
-
-                if auto_fixable:
-                    # Apply fixes
-                    result = fixer.fix(str(file_path), current_content, auto_fixable)
-
-                    if result.content_changed:
-                        current_content = result.fixed_content
-                        all_fixes.extend(result.fixes_applied)
-                        all_issues_fixed.extend(result.issues_fixed)
+            # Apply each fixer in sequence; one that runs out of time is skipped for this file
+            with self.watchdog.file(str(file_path)):
+                for fixer in self.fixers:
+                    # Skip fixers whose prefilters rule this file out
+                    if features is None:
+                        features = DocumentFeatures.of(current_content)
+                    if not fixer.applies_to(current_content, features):
+                        self.stats.prefilter_skips[fixer.name] = self.stats.prefilter_skips.get(fixer.name, 0) + 1
+                        continue
+
+                    try:
+                        # Check for issues
+                        with self.profiler.measure('fixer.check_file', fixer.name, str(file_path)) as span:
+                            issues = self.watchdog.call(f'{fixer.name}.check_file', fixer.check_file,
+                                                        str(file_path), current_content)
+                            span.issues = len(issues)
+
+                        # Filter to auto-fixable issues only
+                        auto_fixable = [i for i in issues if i.auto_fixable]
+
+                        if auto_fixable:
+                            # Apply fixes
+                            with self.profiler.measure('fixer.fix', fixer.name, str(file_path)) as span:
+                                result = self.watchdog.call(f'{fixer.name}.fix', fixer.fix,
+                                                            str(file_path), current_content, auto_fixable)
+                                span.issues = len(result.issues_fixed)
+
+                            if result.content_changed:
+                                current_content = result.fixed_content
+                                features = None
+                                all_fixes.extend(result.fixes_applied)
+                                all_issues_fixed.extend(result.issues_fixed)
+                    except CheckTimeout as e:
+                        self.stats.timeouts.append(f"{file_path}: {e}")
+                        if e.scope == 'file':
+                            break
 
             return FixResult(
                 file_path=str(file_path),
@@ -298,31 +262,36 @@ class DocFixer:
             'files_modified': self.stats.files_modified,
             'total_fixes': self.stats.total_fixes_applied,
             'fixes_by_type': self.stats.fixes_by_type,
+            'errors': self.stats.errors,
+            'timeouts': self.stats.timeouts,
+            'prefilter_skips': self.stats.prefilter_skips,
             'mode': 'dry_run' if dry_run else 'applied'
         }
 
-        # Create recommendations
-        recommendations = []
-        if self.stats.total_fixes_applied > 0:
-            recommendations.append(f"{self.stats.total_fixes_applied} automatable fixes {'would be' if dry_run else 'were'} applied across {self.stats.files_modified} files")
-            recommendations.append("These fixes are mechanical changes that can be safely automated (capitalization, language tags, heading hierarchy, etc.)")
-        else:
-            recommendations.append("No automatable fixes found")
+        # AI call telemetry of the style guide checks (latency, tokens, cost)
+        for fixer in self.fixers:
+            if getattr(fixer, 'telemetry', None) and fixer.telemetry.calls:
+                summary['ai_usage'] = fixer.telemetry.to_dict()
+                print(fixer.telemetry.summary())
+                print(fixer.cache_stats.summary())
+                fixer.telemetry.write_ledger()
 
-        recommendations.append("Note: Issues requiring human judgment (clarity, passive voice, weak language, content gaps) are not auto-fixed and appear in the analysis report")
+        recommendations = build_recommendations(self.stats, dry_run)
 
-        if self.stats.errors:
-            recommendations.append(f"{len(self.stats.errors)} errors occurred during processing")
+        repository = {
+            'path': str(docs_path),
+            'type': 'local'
+        }
+        if self.shard:
+            repository['shard'] = {'index': self.shard[0], 'count': self.shard[1]}
 
         return FixReport(
             timestamp=datetime.now().isoformat(),
-            repository={
-                'path': str(docs_path),
-                'type': 'local'
-            },
+            repository=repository,
             summary=summary,
             fixes=all_fixes,
-            recommendations=recommendations
+            recommendations=recommendations,
+            profile=self.profiler.to_dict()
         )
 
     def export_report(self, report: FixReport, output_format: str = 'json', output_dir: Path = None) -> Path:
@@ -338,16 +307,19 @@ class DocFixer:
 
         if output_format == 'json' or output_format == 'all':
             json_path = output_dir / "doc_fix_report.json"
-            with open(json_path, 'w') as f:
-                json.dump(report.to_dict(), f, indent=2)
+            with self.profiler.measure('export', 'json'):
+                with open(json_path, 'w') as f:
+                    json.dump(report.to_dict(), f, indent=2)
 
         if output_format == 'html' or output_format == 'all':
             html_path = output_dir / "doc_fix_report.html"
-            self._export_html(report, html_path)
+            with self.profiler.measure('export', 'html'):
+                self._export_html(report, html_path)
 
         if output_format == 'markdown' or output_format == 'all':
             md_path = output_dir / "doc_fix_report.md"
-            self._export_markdown(report, md_path)
+            with self.profiler.measure('export', 'markdown'):
+                self._export_markdown(report, md_path)
 
         return output_dir
 
@@ -422,6 +394,102 @@ class DocFixer:
             f.write(md_content)
 
 
+def build_recommendations(stats: FixerStats, dry_run: bool) -> List[str]:
+    """Report recommendations from run statistics"""
+    recommendations = []
+    if stats.total_fixes_applied > 0:
+        recommendations.append(f"{stats.total_fixes_applied} automatable fixes {'would be' if dry_run else 'were'} applied across {stats.files_modified} files")
+        recommendations.append("These fixes are mechanical changes that can be safely automated (capitalization, language tags, heading hierarchy, etc.)")
+    else:
+        recommendations.append("No automatable fixes found")
+
+    recommendations.append("Note: Issues requiring human judgment (clarity, passive voice, weak language, content gaps) are not auto-fixed and appear in the analysis report")
+
+    if stats.errors:
+        recommendations.append(f"{len(stats.errors)} errors occurred during processing")
+
+    if stats.timeouts:
+        recommendations.append(f"{len(stats.timeouts)} fixer runs were skipped after exceeding analysis.time_budgets")
+
+    return recommendations
+
+
+def merge_fix_reports(report_paths: List[Path]) -> Tuple[FixReport, FixerStats]:
+    """
+    Combine the JSON fix reports of a sharded run into one report
+
+    Fixes keep the order of a single-node run (by file path); counts are summed.
+
+    Returns:
+        Merged report and the combined statistics
+
+    Raises:
+        ValueError: If the reports are not shard reports covering every shard exactly once
+    """
+    reports = []
+    for path in report_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            reports.append(json.load(f))
+    if not reports:
+        raise ValueError("No reports to merge")
+    if any('shard' not in report['repository'] for report in reports):
+        raise ValueError("Only reports written with --shard can be merged")
+    check_complete([(r['repository']['shard']['index'], r['repository']['shard']['count']) for r in reports])
+
+    modes = {report['summary']['mode'] for report in reports}
+    if len(modes) != 1:
+        raise ValueError(f"Shards ran in different modes: {sorted(modes)}")
+    dry_run = modes.pop() == 'dry_run'
+
+    stats = FixerStats()
+    profiler = Profiler()
+    fixes = []
+    for report in reports:
+        summary = report['summary']
+        stats.total_files_processed += summary['total_files']
+        stats.files_modified += summary['files_modified']
+        stats.total_fixes_applied += summary['total_fixes']
+        stats.errors.extend(summary.get('errors', []))
+        stats.timeouts.extend(summary.get('timeouts', []))
+        for fixer_name, count in summary.get('prefilter_skips', {}).items():
+            stats.prefilter_skips[fixer_name] = stats.prefilter_skips.get(fixer_name, 0) + count
+        for fix_type, count in summary['fixes_by_type'].items():
+            stats.fixes_by_type[fix_type] = stats.fixes_by_type.get(fix_type, 0) + count
+        fixes.extend(report['fixes'])
+        profiler.merge(report.get('profile', {}).get('checks', []))
+
+    # Stable sort keeps each file's fixes in the order the fixer chain applied them
+    fixes.sort(key=lambda fix: Path(fix['file']))
+
+    summary = {
+        'total_files': stats.total_files_processed,
+        'files_modified': stats.files_modified,
+        'total_fixes': stats.total_fixes_applied,
+        'fixes_by_type': stats.fixes_by_type,
+        'errors': stats.errors,
+        'timeouts': stats.timeouts,
+        'prefilter_skips': stats.prefilter_skips,
+        'mode': 'dry_run' if dry_run else 'applied'
+    }
+    ai_usage = [report['summary']['ai_usage'] for report in reports if 'ai_usage' in report['summary']]
+    if ai_usage:
+        summary['ai_usage'] = {
+            'calls': sum(usage['calls'] for usage in ai_usage),
+            'cost_usd': round(sum(usage['cost_usd'] for usage in ai_usage), 6),
+            'shards': ai_usage,
+        }
+
+    repository = {key: value for key, value in reports[0]['repository'].items() if key != 'shard'}
+    return FixReport(
+        timestamp=datetime.now().isoformat(),
+        repository=repository,
+        summary=summary,
+        fixes=fixes,
+        recommendations=build_recommendations(stats, dry_run),
+        profile=profiler.to_dict()
+    ), stats
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -446,6 +514,7 @@ Examples:
     parser.add_argument(
         'docs_directory',
         type=Path,
+        nargs='?',
         help='Path to documentation directory'
     )
 
@@ -486,8 +555,57 @@ Examples:
         help='Disable AI-powered analysis (StyleGuideValidator) for faster execution'
     )
 
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print a per-fixer timing table after the run'
+    )
+
+    parser.add_argument(
+        '--profile-output',
+        type=Path,
+        help='Also run under cProfile and write pstats data to this file'
+    )
+
+    parser.add_argument(
+        '--shard',
+        help='Process only shard i of N (e.g. 2/4); merge the JSON reports with --merge'
+    )
+
+    parser.add_argument(
+        '--merge',
+        type=Path,
+        nargs='+',
+        metavar='REPORT',
+        help='Merge the doc_fix_report.json files of a sharded run into one report'
+    )
+
     args = parser.parse_args()
 
+    if args.merge:
+        if args.shard:
+            parser.error("--shard and --merge cannot be combined")
+        try:
+            report, stats = merge_fix_reports(args.merge)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: Cannot merge reports: {e}", file=sys.stderr)
+            sys.exit(1)
+        exporter = DocFixer(config_path=args.config, enable_style_guide=False)
+        report_dir = exporter.export_report(report, output_format=args.format, output_dir=args.output)
+        print(stats.summary())
+        print(f"\nReports exported to: {report_dir}")
+        sys.exit(1 if stats.errors else 0)
+
+    if args.docs_directory is None:
+        parser.error("docs_directory is required unless --merge is used")
+
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+
     # Validate docs directory
     if not args.docs_directory.exists():
         print(f"Error: Directory not found: {args.docs_directory}", file=sys.stderr)
@@ -507,12 +625,21 @@ Examples:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Process directory
-    stats = fixer.process_directory(
-        docs_path=args.docs_directory,
-        dry_run=args.dry_run,
-        backup=not args.no_backup
-    )
+    # Process directory (optionally under cProfile)
+    process_kwargs = {
+        'docs_path': args.docs_directory,
+        'dry_run': args.dry_run,
+        'backup': not args.no_backup,
+        'shard': shard
+    }
+    if args.profile_output:
+        import cProfile
+        profiler = cProfile.Profile()
+        stats = profiler.runcall(fixer.process_directory, **process_kwargs)
+        profiler.dump_stats(str(args.profile_output))
+        print(f"📈 cProfile data written to: {args.profile_output} (view with: python -m pstats {args.profile_output})")
+    else:
+        stats = fixer.process_directory(**process_kwargs)
 
     # Create and export report
     report = fixer.create_report(
@@ -520,13 +647,19 @@ Examples:
         dry_run=args.dry_run
     )
 
-    # Export reports in requested format(s)
+    # Export reports in requested format(s); shards always write JSON for --merge
     report_dir = fixer.export_report(report, output_format=args.format, output_dir=args.output)
+    if shard and args.format not in ('json', 'all'):
+        fixer.export_report(report, output_format='json', output_dir=report_dir)
 
     # Print final summary
     print(stats.summary())
     print(f"\nReports exported to: {report_dir}")
 
+    if args.profile:
+        print("\n⏱️  Per-fixer timings (slowest first):")
+        print(fixer.profiler.format_table())
+
     # Also print JSON to stdout for API to capture
     print("\n=== JSON OUTPUT START ===")
     print(json.dumps(report.to_dict()))
@@ -8,30 +8,16 @@ import sys
 from pathlib import Path
 from typing import List, Tuple
 
-# Claude API Pricing (as of Jan 2025)
-# https://www.anthropic.com/pricing
-PRICING = {
-    'claude-3-5-haiku-20241022': {
-        'input': 0.80 / 1_000_000,   # $0.80 per million input tokens
-        'output': 4.00 / 1_000_000,  # $4 per million output tokens
-    },
-    'claude-sonnet-4-5-20250929': {
-        'input': 3.00 / 1_000_000,   # $3 per million input tokens
-        'output': 15.00 / 1_000_000,  # $15 per million output tokens
-    },
-    'claude-3-5-sonnet-20241022': {
-        'input': 3.00 / 1_000_000,
-        'output': 15.00 / 1_000_000,
-    },
-    'claude-opus-4-20250514': {
-        'input': 15.00 / 1_000_000,
-        'output': 75.00 / 1_000_000,
-    }
-}
+from core.documents import SourceFile
+from utils.ai_telemetry import PRICING, calibrate_from_ledger, ledger_path, load_ledger
+
+# Defaults used until the cost ledger has recorded real calls
+DEFAULT_CHARS_PER_TOKEN = 4
+DEFAULT_OUTPUT_TOKENS_PER_CALL = 500
 
-def count_tokens_estimate(text: str) -> int:
-    """Rough token estimation: ~4 chars per token for English"""
-    return len(text) // 4
+def count_tokens_estimate(chars: int, chars_per_token: float = DEFAULT_CHARS_PER_TOKEN) -> int:
+    """Token estimation from a character count: ~4 chars per token for English unless calibrated from the ledger"""
+    return int(chars / chars_per_token)
 
 def find_doc_files(path: str, patterns: List[str] = None) -> List[Path]:
     """Find all documentation files"""
@@ -45,17 +31,20 @@ def find_doc_files(path: str, patterns: List[str] = None) -> List[Path]:
 
     return sorted(files)
 
-def analyze_file_sizes(files: List[Path]) -> dict:
+def analyze_file_sizes(files: List[Path], chars_per_token: float = DEFAULT_CHARS_PER_TOKEN) -> dict:
     """Analyze file sizes and estimate tokens"""
     total_chars = 0
+    total_tokens = 0
     file_data = []
 
     for file_path in files:
         try:
-            content = file_path.read_text(encoding='utf-8')
-            chars = len(content)
-            tokens = count_tokens_estimate(content)
+            # Only the length is needed; large files are counted without building the text
+            with SourceFile(file_path) as source:
+                chars = source.char_count()
+            tokens = count_tokens_estimate(chars, chars_per_token)
             total_chars += chars
+            total_tokens += tokens
             file_data.append({
                 'path': str(file_path),
                 'chars': chars,
@@ -67,16 +56,21 @@ def analyze_file_sizes(files: List[Path]) -> dict:
     return {
         'files': file_data,
         'total_chars': total_chars,
-        'total_tokens': count_tokens_estimate(str(total_chars))
+        'total_tokens': total_tokens
     }
 
-def estimate_ai_cost(num_files: int, avg_file_tokens: int, model: str, max_tokens: int = 2000) -> dict:
+def estimate_ai_cost(num_files: int, avg_file_tokens: int, model: str, max_tokens: int = 2000,
+                     output_tokens_per_call: float = DEFAULT_OUTPUT_TOKENS_PER_CALL) -> dict:
     """
     Estimate API cost for analysis
 
     The analyzer does two types of AI analysis:
-    1. Per-file clarity analysis (first 200 lines of each file)
+    1. Per-file clarity analysis (whole file, split into AI_CHUNK_TOKENS chunks;
+       small files packed together into AI_PACK_TOKENS requests)
     2. One semantic gap analysis across all files (summary of all files)
+
+    output_tokens_per_call comes from the cost ledger once real calls have
+    been recorded.
     """
     if model not in PRICING:
         print(f"Warning: Unknown model {model}, using Sonnet pricing")
@@ -84,14 +78,24 @@ def estimate_ai_cost(num_files: int, avg_file_tokens: int, model: str, max_token
 
     pricing = PRICING[model]
 
-    # Per-file clarity analysis (samples first 200 lines ≈ 40% of avg file)
-    sample_ratio = 0.4  # Conservative estimate
-    input_per_file = int(avg_file_tokens * sample_ratio) + 150  # +150 for prompt
-    output_per_file = 500  # Typical output for clarity issues
+    # Per-file clarity analysis: every chunk repeats the instruction prompt
+    chunk_tokens = int(os.getenv('AI_CHUNK_TOKENS', '2000'))
+    chunks_per_file = max(1, -(-avg_file_tokens // chunk_tokens))
+    input_per_file = avg_file_tokens + 150 * chunks_per_file  # +150 for prompt per chunk
+    output_per_file = int(output_tokens_per_call * chunks_per_file)  # Typical output for clarity issues
 
     clarity_input_tokens = num_files * input_per_file
     clarity_output_tokens = num_files * output_per_file
 
+    # Small files are packed into shared requests, so the prompt is paid per request
+    pack_enabled = os.getenv('AI_PACK_SMALL_FILES', 'true').lower() in ('true', '1', 'yes')
+    pack_file_tokens = int(os.getenv('AI_PACK_FILE_TOKENS', '1000'))
+    if pack_enabled and num_files > 1 and avg_file_tokens <= pack_file_tokens:
+        pack_tokens = int(os.getenv('AI_PACK_TOKENS', '6000'))
+        files_per_request = max(1, pack_tokens // max(avg_file_tokens, 1))
+        requests = -(-num_files // files_per_request)
+        clarity_input_tokens = num_files * avg_file_tokens + 150 * requests
+
     # Semantic gap analysis (one request with summary of all files)
     gap_input_tokens = 1000 + (num_files * 100)  # Prompt + file summaries
     gap_output_tokens = max_tokens  # Full output
@@ -147,9 +151,21 @@ def main():
 
     print(f"✅ Found {len(files)} documentation files")
 
+    # Calibrate token estimates from recorded calls (semantic analyzer clarity requests)
+    calibration = calibrate_from_ledger(load_ledger(), component='semantic_analyzer')
+    if calibration:
+        chars_per_token = calibration['chars_per_token']
+        output_tokens_per_call = calibration['output_tokens_per_call']
+        print(f"\n📒 Calibrated from {calibration['calls']} recorded calls in {ledger_path()}")
+        print(f"   {chars_per_token:.2f} chars/token, {output_tokens_per_call:.0f} output tokens/call")
+    else:
+        chars_per_token = DEFAULT_CHARS_PER_TOKEN
+        output_tokens_per_call = DEFAULT_OUTPUT_TOKENS_PER_CALL
+        print(f"\n📒 No cost ledger yet ({ledger_path()}); using ~{DEFAULT_CHARS_PER_TOKEN} chars/token")
+
     # Analyze file sizes
     print("\n📏 Analyzing file sizes...")
-    file_stats = analyze_file_sizes(files)
+    file_stats = analyze_file_sizes(files, chars_per_token)
     avg_tokens = file_stats['total_tokens'] // len(files) if files else 0
 
     print(f"   Total characters: {file_stats['total_chars']:,}")
@@ -168,7 +184,8 @@ def main():
     print("=" * 70)
 
     for model_name, pricing in PRICING.items():
-        estimate = estimate_ai_cost(len(files), avg_tokens, model_name)
+        estimate = estimate_ai_cost(len(files), avg_tokens, model_name,
+                                    output_tokens_per_call=output_tokens_per_call)
         print(f"\n{model_name}:")
         print(f"   Input:  {estimate['total_input_tokens']:,} tokens × ${pricing['input']*1_000_000:.2f}/M = ${estimate['input_cost']:.4f}")
         print(f"   Output: {estimate['total_output_tokens']:,} tokens × ${pricing['output']*1_000_000:.2f}/M = ${estimate['output_cost']:.4f}")
@@ -180,7 +197,8 @@ def main():
     print("💡 Smart Testing Recommendations")
     print("=" * 70)
 
-    default_estimate = estimate_ai_cost(len(files), avg_tokens, 'claude-sonnet-4-5-20250929')
+    default_estimate = estimate_ai_cost(len(files), avg_tokens, 'claude-sonnet-4-5-20250929',
+                                        output_tokens_per_call=output_tokens_per_call)
 
     print(f"\n📊 Your Budget: $5.00")
     print(f"📊 Full Analysis Cost: ${default_estimate['total_cost']:.2f}")
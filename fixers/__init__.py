@@ -1,36 +1,26 @@
 """
 Fixers module for doc_fixer
-Contains all concrete fixer implementations
+Contains all concrete fixer implementations (imported lazily, see registry.py)
 """
 
 from .base import BaseFixer
-from .frontmatter import FrontmatterFixer
-from .terminology import TerminologyFixer
-from .urls import URLFixer
-from .code_blocks import CodeBlockFixer
-from .github_informed_fixer import GitHubInformedFixer
-from .style_guide_validator import StyleGuideValidationFixer
+from .registry import FIXERS, FIXERS_BY_NAME, enabled_fixers, load_fixer_class
 
-# High-impact fixers from comprehensive research
-from .code_language_tags import CodeLanguageTagFixer
-from .heading_hierarchy import HeadingHierarchyFixer
-from .link_text_improver import LinkTextImprover
-from .long_sentence_splitter import LongSentenceSplitter
-from .passive_voice_converter import PassiveVoiceConverter
-from .missing_prerequisites_detector import MissingPrerequisitesDetector
 
-# Style consistency fixers from style-consistency-analysis
-from .capitalization_fixer import CapitalizationFixer
-from .terminology_consistency_fixer import TerminologyConsistencyFixer
-from .callout_standardization_fixer import CalloutStandardizationFixer
-from .broken_link_detector import BrokenLinkDetector
-from .production_code_validator import ProductionCodeValidator
+def __getattr__(name):
+    """Import fixer classes on first access (`from fixers import TerminologyFixer`)"""
+    if name in FIXERS_BY_NAME:
+        fixer_class = load_fixer_class(name)
+        globals()[name] = fixer_class
+        return fixer_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Accessibility fixer
-from .accessibility_fixer import AccessibilityFixer
 
 __all__ = [
     'BaseFixer',
+    'FIXERS',
+    'enabled_fixers',
+    'load_fixer_class',
     'FrontmatterFixer',
     'TerminologyFixer',
     'URLFixer',
@@ -14,6 +14,7 @@ from typing import List, Dict, Optional
 from pathlib import Path
 
 from .base import BaseFixer
+from core.documents import DocumentFeatures
 from core.models import Issue, FixResult
 from core.config import Config
 
@@ -65,6 +66,9 @@ class AccessibilityFixer(BaseFixer):
         lines = content.split('\n')
         in_code_block = False
 
+        # Image and table checks only run on files that have images or tables
+        features = DocumentFeatures.of(content)
+
         for i, line in enumerate(lines, 1):
             # Track code blocks
             if line.strip().startswith('```'):
@@ -75,12 +79,14 @@ class AccessibilityFixer(BaseFixer):
                 continue
 
             # Check for images without alt text
-            image_issues = self._check_image_alt_text(line, i, file_path)
-            issues.extend(image_issues)
+            if features.has_images:
+                image_issues = self._check_image_alt_text(line, i, file_path)
+                issues.extend(image_issues)
 
             # Check for tables without headers
-            table_issues = self._check_table_accessibility(lines, i, file_path)
-            issues.extend(table_issues)
+            if features.has_tables:
+                table_issues = self._check_table_accessibility(lines, i, file_path)
+                issues.extend(table_issues)
 
             # Check for color-only information
             color_issues = self._check_color_only_info(line, i, file_path)
@@ -3,9 +3,10 @@ Base fixer class that all fixers inherit from
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 from pathlib import Path
 
+from core.documents import DocumentFeatures
 from core.models import Issue, FixResult
 from core.config import Config
 
@@ -13,6 +14,12 @@ from core.config import Config
 class BaseFixer(ABC):
     """Abstract base class for all fixers"""
 
+    # Prefilters DocFixer checks before check_file. Declare only what check_file
+    # can't find issues without: the file must contain at least one of
+    # required_substrings (if any) and have every DocumentFeatures flag in required_features.
+    required_substrings: Tuple[str, ...] = ()
+    required_features: Tuple[str, ...] = ()
+
     def __init__(self, config: Config):
         """
         Initialize fixer with configuration
@@ -57,6 +64,17 @@ class BaseFixer(ABC):
         """Return the name of this fixer"""
         pass
 
+    def applies_to(self, content: str, features: DocumentFeatures) -> bool:
+        """
+        Check the prefilters against a file
+
+        Returns:
+            False if check_file can't find anything in this file
+        """
+        if not all(getattr(features, feature) for feature in self.required_features):
+            return False
+        return not self.required_substrings or any(s in content for s in self.required_substrings)
+
     def can_fix(self, issue: Issue) -> bool:
         """
         Check if this fixer can handle a specific issue
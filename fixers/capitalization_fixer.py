@@ -16,6 +16,7 @@ from typing import List, Dict, Tuple
 from .base import BaseFixer
 from core.models import Issue, FixResult
 from core.config import Config
+from utils.protected_spans import protected_spans
 
 
 class CapitalizationFixer(BaseFixer):
@@ -79,6 +80,18 @@ class CapitalizationFixer(BaseFixer):
             r'\bVision\b(?! API)': 'vision',  # General capability
         }
 
+        # Compiled once: check_file and fix run every pattern over every line
+        self.compiled_patterns = [
+            (re.compile(pattern, re.IGNORECASE), correct_form)
+            for pattern, correct_form in {
+                **self.product_names,
+                **self.feature_names,
+                **self.model_names,
+                **self.technical_terms,
+                **self.general_concepts
+            }.items()
+        ]
+
     @property
     def name(self) -> str:
         return "Capitalization Fixer"
@@ -102,27 +115,23 @@ class CapitalizationFixer(BaseFixer):
             if line.strip().startswith(('http://', 'https://', '`')):
                 continue
 
-            # Check all capitalization patterns
-            all_patterns = {
-                **self.product_names,
-                **self.feature_names,
-                **self.model_names,
-                **self.technical_terms,
-                **self.general_concepts
-            }
-
-            for pattern, correct_form in all_patterns.items():
-                matches = list(re.finditer(pattern, line, re.IGNORECASE))
+            # Inline code and link targets are left alone; most lines have
+            # no miscapitalized term, so the spans are only built on demand
+            protected = None
 
-                for match in matches:
+            # Check all capitalization patterns
+            for compiled, correct_form in self.compiled_patterns:
+                for match in compiled.finditer(line):
                     incorrect_form = match.group(0)
 
                     # Skip if already correct (case-sensitive check)
                     if incorrect_form == correct_form:
                         continue
 
-                    # Skip if inside inline code
-                    if self._is_in_code(line, match.start()):
+                    # Skip if inside inline code or a link target
+                    if protected is None:
+                        protected = protected_spans(line)
+                    if match.start() in protected:
                         continue
 
                     issues.append(Issue(
@@ -148,15 +157,6 @@ class CapitalizationFixer(BaseFixer):
         lines = fixed_content.split('\n')
         in_code_block = False
 
-        # Combine all patterns
-        all_patterns = {
-            **self.product_names,
-            **self.feature_names,
-            **self.model_names,
-            **self.technical_terms,
-            **self.general_concepts
-        }
-
         for i, line in enumerate(lines):
             # Track code blocks
             if line.strip().startswith('```'):
@@ -171,20 +171,21 @@ class CapitalizationFixer(BaseFixer):
                 continue
 
             original_line = line
+            protected = protected_spans(original_line)
             changes_in_line = []
 
             # Apply all capitalization fixes
-            for pattern, correct_form in all_patterns.items():
+            for compiled, correct_form in self.compiled_patterns:
                 def replace_func(match):
                     incorrect = match.group(0)
                     if incorrect == correct_form:
                         return incorrect
-                    if self._is_in_code(original_line, match.start()):
+                    if match.start() in protected:
                         return incorrect
                     changes_in_line.append((incorrect, correct_form))
                     return correct_form
 
-                line = re.sub(pattern, replace_func, line, flags=re.IGNORECASE)
+                line = compiled.sub(replace_func, line)
 
             if line != original_line:
                 lines[i] = line
@@ -207,13 +208,6 @@ class CapitalizationFixer(BaseFixer):
             issues_fixed=issues_fixed
         )
 
-    def _is_in_code(self, line: str, position: int) -> bool:
-        """Check if position is inside inline code backticks"""
-        before_pos = line[:position]
-        backtick_count = before_pos.count('`')
-        # Odd number of backticks means we're inside code
-        return backtick_count % 2 == 1
-
     def _get_context(self, line: str, match: re.Match, context_len: int = 40) -> str:
         """Extract context around the match"""
         start = max(0, match.start() - context_len // 2)
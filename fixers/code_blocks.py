@@ -14,6 +14,8 @@ from fixers.base import BaseFixer
 class CodeBlockFixer(BaseFixer):
     """Fixes code block formatting issues"""
 
+    required_features = ('has_code_blocks',)
+
     def __init__(self, config: Config):
         super().__init__(config)
         self.require_language = config.code_blocks_require_language
@@ -28,6 +28,8 @@ class CodeLanguageTagFixer(BaseFixer):
     3. Shebang lines (#!/bin/bash → bash)
     """
 
+    required_features = ('has_code_blocks',)
+
     def __init__(self, config: Config):
         super().__init__(config)
 
@@ -11,6 +11,7 @@ import hashlib
 from core.models import Issue, FixResult
 from core.config import Config
 from fixers.base import BaseFixer
+from utils.frontmatter import read_frontmatter
 from utils.text_utils import extract_frontmatter, replace_frontmatter
 
 
@@ -35,7 +36,8 @@ class FrontmatterFixer(BaseFixer):
         if not file_path.endswith('.mdx') and not file_path.endswith('.md'):
             return issues
 
-        frontmatter, body, fm_lines = extract_frontmatter(content)
+        block = read_frontmatter(content)
+        frontmatter = block.data if block else None
 
         if frontmatter is None:
             # No frontmatter at all - CRITICAL
@@ -24,6 +24,8 @@ class HeadingHierarchyFixer(BaseFixer):
     Auto-fix: Adjusts heading levels to be sequential
     """
 
+    required_substrings = ('#',)
+
     @property
     def name(self) -> str:
         return "Heading Hierarchy Fixer"
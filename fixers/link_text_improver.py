@@ -24,6 +24,8 @@ class LinkTextImprover(BaseFixer):
     Auto-fix: Extracts context from surrounding text or URL
     """
 
+    required_substrings = ('](',)
+
     def __init__(self, config: Config):
         super().__init__(config)
 
@@ -33,6 +33,11 @@ class ProductionCodeValidator(BaseFixer):
     Auto-fix: Not auto-fixable (requires understanding context and requirements)
     """
 
+    # Issues come from API-call examples (see _contains_api_call) or credential anti-patterns
+    required_features = ('has_code_blocks',)
+    required_substrings = ('messages.create', 'client.messages', 'Anthropic(', 'anthropic.', 'fetch(',
+                           'axios.', 'requests.', 'api_key', 'api-key', 'apikey', 'ANTHROPIC_API_KEY')
+
     def __init__(self, config: Config):
         super().__init__(config)
 
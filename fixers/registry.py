@@ -0,0 +1,92 @@
+"""
+Fixer registry
+
+Lists every fixer with the module that defines it and the environment
+variable that toggles it, so doc_fixer only imports the fixers a run
+enables. Fixer modules (and their dependencies, e.g. anthropic for the
+style guide validator) are imported on first use.
+"""
+
+import importlib
+import os
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class FixerSpec:
+    """How to load and toggle one fixer"""
+    name: str                      # class name
+    module: str                    # module inside the fixers package
+    env_var: Optional[str] = None  # ENABLE_* toggle; None = always enabled
+    default: bool = True           # enabled when the toggle is unset
+    label: Optional[str] = None    # printed when enabled
+
+    def is_enabled(self) -> bool:
+        if self.env_var is None:
+            return True
+        return os.getenv(self.env_var, str(self.default).lower()).lower() not in ['false', '0', 'no']
+
+
+# In the order fixers run on each file
+FIXERS = [
+    # Core fixers (always enabled)
+    FixerSpec('FrontmatterFixer', 'frontmatter'),
+    FixerSpec('TerminologyFixer', 'terminology'),
+    FixerSpec('URLFixer', 'urls'),
+    FixerSpec('CodeBlockFixer', 'code_blocks'),
+    FixerSpec('GitHubInformedFixer', 'github_informed_fixer'),
+    # Uses Claude AI; also disabled by --no-ai
+    FixerSpec('StyleGuideValidationFixer', 'style_guide_validator', 'ENABLE_STYLE_GUIDE_VALIDATOR', True,
+              'Style Guide Validator enabled (with Claude AI analysis)'),
+    # High-impact fixers
+    FixerSpec('CodeLanguageTagFixer', 'code_language_tags', 'ENABLE_CODE_LANGUAGE_FIXER', True,
+              'Code Language Tag Fixer enabled'),
+    FixerSpec('HeadingHierarchyFixer', 'heading_hierarchy', 'ENABLE_HEADING_HIERARCHY_FIXER', True,
+              'Heading Hierarchy Fixer enabled'),
+    FixerSpec('LinkTextImprover', 'link_text_improver', 'ENABLE_LINK_TEXT_IMPROVER', False,
+              'Link Text Improver enabled (manual fix required)'),
+    FixerSpec('LongSentenceSplitter', 'long_sentence_splitter', 'ENABLE_LONG_SENTENCE_SPLITTER', False,
+              'Long Sentence Splitter enabled'),
+    FixerSpec('PassiveVoiceConverter', 'passive_voice_converter', 'ENABLE_PASSIVE_VOICE_CONVERTER', False,
+              'Passive Voice Converter enabled (manual fix required)'),
+    FixerSpec('MissingPrerequisitesDetector', 'missing_prerequisites_detector',
+              'ENABLE_MISSING_PREREQUISITES_DETECTOR', False,
+              'Missing Prerequisites Detector enabled (manual fix required)'),
+    # Style consistency fixers
+    FixerSpec('CapitalizationFixer', 'capitalization_fixer', 'ENABLE_CAPITALIZATION_FIXER', True,
+              'Capitalization Fixer enabled'),
+    FixerSpec('TerminologyConsistencyFixer', 'terminology_consistency_fixer',
+              'ENABLE_TERMINOLOGY_CONSISTENCY_FIXER', False, 'Terminology Consistency Fixer enabled'),
+    FixerSpec('CalloutStandardizationFixer', 'callout_standardization_fixer',
+              'ENABLE_CALLOUT_STANDARDIZATION_FIXER', False, 'Callout Standardization Fixer enabled'),
+    FixerSpec('BrokenLinkDetector', 'broken_link_detector', 'ENABLE_BROKEN_LINK_DETECTOR', False,
+              'Broken Link Detector enabled (manual fix required)'),
+    FixerSpec('ProductionCodeValidator', 'production_code_validator', 'ENABLE_PRODUCTION_CODE_VALIDATOR', False,
+              'Production Code Validator enabled (manual fix required)'),
+    # Accessibility (WCAG 2.1 AA compliance)
+    FixerSpec('AccessibilityFixer', 'accessibility_fixer', 'ENABLE_ACCESSIBILITY_FIXER', True,
+              'Accessibility Fixer enabled (WCAG 2.1 AA compliance)'),
+]
+
+FIXERS_BY_NAME = {spec.name: spec for spec in FIXERS}
+
+
+def load_fixer_class(name: str) -> type:
+    """
+    Import a fixer class by name
+
+    Raises:
+        KeyError: If no fixer has that name
+    """
+    spec = FIXERS_BY_NAME[name]
+    module = importlib.import_module(f'{__package__}.{spec.module}')
+    return getattr(module, spec.name)
+
+
+def enabled_fixers(enable_style_guide: bool = True) -> List[FixerSpec]:
+    """Specs of the fixers this run enables, in run order"""
+    return [
+        spec for spec in FIXERS
+        if spec.is_enabled() and (enable_style_guide or spec.name != 'StyleGuideValidationFixer')
+    ]
@@ -19,9 +19,8 @@ import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
-# Import anthropic for AI analysis
-import anthropic
 import os
 from dotenv import load_dotenv
 
@@ -31,6 +30,11 @@ load_dotenv()
 from .base import BaseFixer
 from core.models import Issue, FixResult
 from core.config import Config
+from utils.chunking import Chunk, chunk_document, dedupe_issues
+from utils.frontmatter import read_frontmatter
+from utils.ai_telemetry import AITelemetry
+from utils.prompt_cache import cached_system_prompt
+from utils.watchdog import finditer
 
 
 def sanitize_content_for_ai(content: str) -> str:
@@ -79,6 +83,113 @@ class ValidationRule:
     max_occurrences: Optional[int] = None
 
 
+# Fixed instruction prefix for style guide requests, sent as a cached system prompt.
+# The writing standards and examples keep it above the default model's cache minimum.
+STYLE_GUIDE_SYSTEM_PROMPT = """You are a technical documentation quality analyzer for Claude Documentation.
+
+Analyze the documentation content you are given against these style guide criteria:
+
+**Voice and Tone:**
+- Second person ("you") - not first person ("I", "we")
+- Active voice preferred over passive voice
+- Professional-conversational balance
+- Clear and direct language
+
+**Content Quality:**
+- Adequate context and prerequisites
+- Clear examples that illustrate concepts
+- Logical flow and progressive complexity
+- Completeness - no missing steps or assumptions
+
+**Style Issues:**
+- Avoid weak/dismissive words: "simply", "just", "easily", "obviously"
+- Avoid passive voice where active is clearer
+- Keep language precise and technical where appropriate
+
+Writing standards (from the Claude Documentation Style Guide):
+
+Voice: second person ("you"), active voice, direct.
+- Good: "You can use prompt caching to reduce costs"
+- Good: "Send a POST request to the `/messages` endpoint"
+- Good: "Configure your API key before making requests"
+- Bad: "One can use prompt caching..." (too formal)
+- Bad: "Costs can be reduced by using prompt caching" (passive voice)
+- Bad: "It is possible to configure..." (weak language)
+
+Clear, direct language:
+- "simply", "just", "easily": omit; they are dismissive to struggling users
+- "utilize", "leverage": use "use"; unnecessarily complex
+- "in order to": use "to"; wordier than needed
+- "please note that": omit or restructure; adds no value
+- "it is important to note": state the point directly; weak opening
+- Before: "You can simply leverage the API to easily implement this feature. Please note that you should configure authentication first."
+- After: "Configure authentication, then call the API to implement this feature."
+
+Paragraphs: at most 4 lines in rendered output. Long paragraphs should be split, turned into a bulleted list, or broken up with subheadings.
+
+Terminology:
+- Claude and Anthropic are always capitalized; API, SDK, CLI, JSON and HTTP are all caps; markdown is lowercase unless it starts a sentence
+- Write "API key" (not "api key" or "API Key"), "prompt caching" and "system prompt" (not title case in body text)
+
+How to judge each issue type:
+- "voice": first person ("we", "our", "I"), third person ("the user", "one") or passive constructions where the reader is the actor
+- "tone": condescending, marketing or overly casual language ("obviously", "amazing", "super easy"), or hedging that undermines instructions ("you might want to maybe")
+- "context": a step that relies on something the page never sets up (an installed SDK, an API key, an earlier step), or an example with no explanation of what it shows
+- "clarity": instructions that do not say how to act, vague references ("this", "it", "the above") with no clear antecedent, or steps out of order
+- "style": weak qualifiers, wordy phrases and terminology that break the standards above
+
+Do not report code samples, frontmatter, link targets or component markup, and do not repeat the same issue for every occurrence on a page; report the first and mention that it recurs.
+Severity: "high" when readers may fail the task or lose trust, "medium" when they will need extra effort, "low" for polish.
+
+Respond ONLY with a JSON array of issues found. Each issue should have:
+- "type": One of ["voice", "tone", "context", "clarity", "style"]
+- "severity": One of ["high", "medium", "low"]
+- "description": Brief description of the issue
+- "line_hint": Excerpt of problematic text (first 50 chars)
+- "suggestion": Specific suggestion for improvement
+
+If no issues found, respond with empty array: []
+
+Example response format:
+[
+  {
+    "type": "voice",
+    "severity": "medium",
+    "description": "Uses first person 'we' instead of second person 'you'",
+    "line_hint": "We recommend that you configure...",
+    "suggestion": "Change to: 'Configure your settings...'"
+  },
+  {
+    "type": "style",
+    "severity": "low",
+    "description": "Dismissive qualifier 'simply' (also used twice later on the page)",
+    "line_hint": "Simply add the header to your request",
+    "suggestion": "Change to: 'Add the header to your request'"
+  },
+  {
+    "type": "context",
+    "severity": "high",
+    "description": "Example calls the client before the page shows how to install the SDK or set the API key",
+    "line_hint": "client.messages.create(",
+    "suggestion": "Add a Prerequisites section covering SDK installation and the ANTHROPIC_API_KEY environment variable"
+  },
+  {
+    "type": "tone",
+    "severity": "medium",
+    "description": "Marketing language and hedging in an instruction",
+    "line_hint": "This amazing feature might be something you want to",
+    "suggestion": "Change to: 'Use batch processing to send up to 10,000 requests at once'"
+  },
+  {
+    "type": "clarity",
+    "severity": "high",
+    "description": "'Update it accordingly' does not say which setting to change or to what value",
+    "line_hint": "If the request times out, update it accordingly",
+    "suggestion": "Change to: 'If the request times out, raise the client timeout (for example, timeout=120)'"
+  }
+]"""
+
+
 class StyleGuideValidationFixer(BaseFixer):
     """
     Validates and fixes documentation against style guide rules
@@ -102,6 +213,7 @@ class StyleGuideValidationFixer(BaseFixer):
         model = os.getenv('CLAUDE_MODEL')
 
         if api_key and model:
+            import anthropic  # Heavy import; only needed when AI analysis runs
             self.ai_client = anthropic.Anthropic(api_key=api_key)
             self.ai_model = model
         elif api_key and not model:
@@ -111,6 +223,17 @@ class StyleGuideValidationFixer(BaseFixer):
             print("⚠ Warning: CLAUDE_MODEL set but ANTHROPIC_API_KEY not found in .env")
             print("  Style guide AI analysis will be disabled. Add ANTHROPIC_API_KEY to .env")
 
+        # Long bodies are split into chunks of this many (estimated) tokens
+        self.chunk_tokens = int(os.getenv('AI_CHUNK_TOKENS', '2000'))
+        self.max_workers = int(os.getenv('PARALLEL_THREADS') or self.config.get('analysis.parallel_threads', 4))
+
+        # Seconds a rule pattern may search one body (enforced when the regex module is installed)
+        self.pattern_timeout = self.config.get('analysis.time_budgets.per_pattern', 0)
+
+        # Per-run call telemetry; cache_stats holds the cache read/write totals
+        self.telemetry = AITelemetry('style_guide_validator')
+        self.cache_stats = self.telemetry.cache
+
         # Categorize rules by automation level
         self.highly_automatable = []
         self.moderately_automatable = []
@@ -204,23 +327,10 @@ class StyleGuideValidationFixer(BaseFixer):
 
     def _extract_frontmatter(self, content: str) -> tuple:
         """Extract YAML frontmatter and body content"""
-        if not content.startswith('---\n'):
-            return {}, content
-
-        try:
-            # Find end of frontmatter
-            end_match = re.search(r'\n---\n', content[4:])
-            if not end_match:
-                return {}, content
-
-            end_pos = end_match.end() + 4
-            frontmatter_text = content[4:end_pos-4]
-            body = content[end_pos:]
-
-            frontmatter = yaml.safe_load(frontmatter_text)
-            return frontmatter or {}, body
-        except:
+        frontmatter = read_frontmatter(content)
+        if frontmatter is None:
             return {}, content
+        return frontmatter.data or {}, frontmatter.body(content)
 
     def _check_highly_automatable(self, file_path: str, content: str, frontmatter: dict, body: str) -> List[Issue]:
         """Check highly automatable rules (regex-based, auto-fixable)"""
@@ -275,7 +385,7 @@ class StyleGuideValidationFixer(BaseFixer):
                 if multiline:
                     flags |= re.MULTILINE
 
-                matches = list(re.finditer(rule.pattern, body, flags))
+                matches = finditer(rule.pattern, body, flags, self.pattern_timeout)
 
                 # Check max occurrences
                 if rule.max_occurrences and len(matches) > rule.max_occurrences:
@@ -316,7 +426,7 @@ class StyleGuideValidationFixer(BaseFixer):
                     correct = pattern_dict.get('correct')
                     flags = 0 if rule.case_sensitive else re.IGNORECASE
 
-                    matches = list(re.finditer(pattern, body, flags))
+                    matches = finditer(pattern, body, flags, self.pattern_timeout)
                     for match in matches:
                         # Skip if already correct
                         if match.group() == correct:
@@ -420,74 +530,58 @@ class StyleGuideValidationFixer(BaseFixer):
         - Example relevance and clarity
         - Progressive complexity flow
         - Overall documentation quality
-        """
-        issues = []
 
+        The body is split into token-budgeted chunks at heading/paragraph
+        boundaries and the chunks are analyzed concurrently.
+        """
         if not self.ai_client or not body.strip():
-            return issues
-
+            return []
+
+        # Lines before the body (frontmatter) so chunk lines map to file lines
+        body_line_offset = content[:len(content) - len(body)].count('\n')
+        chunks = chunk_document(body, self.chunk_tokens, line_offset=body_line_offset)
+
+        if len(chunks) == 1:
+            chunk_results = [self._check_chunk_with_ai(file_path, chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                chunk_results = list(executor.map(
+                    lambda chunk: self._check_chunk_with_ai(file_path, chunk),
+                    chunks
+                ))
+
+        return dedupe_issues(issue for chunk_issues in chunk_results for issue in chunk_issues)
+
+    def _check_chunk_with_ai(self, file_path: str, chunk: Chunk) -> List[Issue]:
+        """Run the style guide prompt on one chunk of the body"""
+        import anthropic  # Already loaded with the client; for RateLimitError
+        issues = []
         max_retries = 3
         base_delay = 2  # seconds
 
-        for attempt in range(max_retries):
-            try:
-                # Sanitize content before sending to prevent JSON parsing errors
-                sanitized_body = sanitize_content_for_ai(body[:3000])
-
-                # Prepare content for AI analysis
-                analysis_prompt = f"""You are a technical documentation quality analyzer for Claude Documentation.
-
-Analyze this documentation content against these style guide criteria:
-
-**Voice and Tone:**
-- Second person ("you") - not first person ("I", "we")
-- Active voice preferred over passive voice
-- Professional-conversational balance
-- Clear and direct language
-
-**Content Quality:**
-- Adequate context and prerequisites
-- Clear examples that illustrate concepts
-- Logical flow and progressive complexity
-- Completeness - no missing steps or assumptions
-
-**Style Issues:**
-- Avoid weak/dismissive words: "simply", "just", "easily", "obviously"
-- Avoid passive voice where active is clearer
-- Keep language precise and technical where appropriate
-
-Content to analyze:
-{sanitized_body}{'...' if len(body) > 3000 else ''}
-
-Respond ONLY with a JSON array of issues found. Each issue should have:
-- "type": One of ["voice", "tone", "context", "clarity", "style"]
-- "severity": One of ["high", "medium", "low"]
-- "description": Brief description of the issue
-- "line_hint": Excerpt of problematic text (first 50 chars)
-- "suggestion": Specific suggestion for improvement
+        # Sanitize content before sending to prevent JSON parsing errors
+        sanitized_body = sanitize_content_for_ai(chunk.text)
 
-If no issues found, respond with empty array: []
-
-Example response format:
-[
-  {{
-    "type": "voice",
-    "severity": "medium",
-    "description": "Uses first person 'we' instead of second person 'you'",
-    "line_hint": "We recommend that you configure...",
-    "suggestion": "Change to: 'Configure your settings...'"
-  }}
-]
-"""
+        # Only the content varies; the instructions are a cached system prefix
+        analysis_prompt = f"""Content to analyze:
+{sanitized_body}"""
+        prompt_chars = len(STYLE_GUIDE_SYSTEM_PROMPT) + len(analysis_prompt)
+        start = time.perf_counter()
 
+        for attempt in range(max_retries):
+            response = None
+            try:
                 response = self.ai_client.messages.create(
                     model=self.ai_model,
                     max_tokens=2000,
+                    system=cached_system_prompt(STYLE_GUIDE_SYSTEM_PROMPT, self.ai_model),
                     messages=[{
                         "role": "user",
                         "content": analysis_prompt
                     }]
                 )
+                self.telemetry.record(self.ai_model, (time.perf_counter() - start) * 1000, attempt,
+                                      prompt_chars, response)
 
                 # Parse AI response
                 ai_response = response.content[0].text.strip()
@@ -518,11 +612,7 @@ Example response format:
                 # Convert AI issues to Issue objects
                 for ai_issue in ai_issues:
                     # Find approximate line number from line_hint
-                    line_num = None
-                    if 'line_hint' in ai_issue and ai_issue['line_hint']:
-                        hint_pos = body.find(ai_issue['line_hint'][:50])
-                        if hint_pos >= 0:
-                            line_num = content[:hint_pos].count('\n') + 1
+                    line_num = chunk.find_line(ai_issue.get('line_hint'))
 
                     issues.append(Issue(
                         severity=ai_issue.get('severity', 'medium'),
@@ -547,6 +637,8 @@ Example response format:
                     time.sleep(delay)
                 else:
                     print(f"  ⚠️  AI analysis failed for {file_path} after {max_retries} retries: Rate limit exceeded")
+                    self.telemetry.record(self.ai_model, (time.perf_counter() - start) * 1000, attempt,
+                                          prompt_chars, status='rate_limited')
 
             except json.JSONDecodeError as e:
                 # JSON parsing error - log and skip
@@ -556,6 +648,9 @@ Example response format:
             except Exception as e:
                 # Other errors - log and skip
                 print(f"  ⚠️  AI analysis error for {file_path}: {e}")
+                if response is None:
+                    self.telemetry.record(self.ai_model, (time.perf_counter() - start) * 1000, attempt,
+                                          prompt_chars, status='error')
                 return issues
 
         return issues
@@ -10,6 +10,11 @@ from core.models import Issue, FixResult
 from core.config import Config
 from fixers.base import BaseFixer
 from utils.text_utils import word_boundary_replace
+from utils.protected_spans import url_spans
+
+# Join the unprotected segments while terms are replaced: non-word characters
+# (so a word boundary) that no term can match; the first one absent from the content is used
+_SEPARATORS = ['\x00'] + [chr(c) for c in range(0xE000, 0xF900)]
 
 
 class TerminologyFixer(BaseFixer):
@@ -131,10 +136,12 @@ class TerminologyFixer(BaseFixer):
 
     def fix(self, file_path: str, content: str, issues: List[Issue]) -> FixResult:
         """Apply terminology fixes while preserving URLs"""
-        # Step 1: Protect URLs and links by replacing them with placeholders
-        protected_content, url_map = self._protect_urls(content)
+        # Replacements run over the text between link targets, hrefs and bare URLs,
+        # joined by a separator that is a word boundary and never matches a term
+        segments = url_spans(content).segments(content)
+        separator = next(s for s in _SEPARATORS if s not in content)
+        editable = separator.join(segment for segment, protected in segments if not protected)
 
-        fixed_content = protected_content
         fixes_applied = []
         issues_fixed = []
 
@@ -151,10 +158,10 @@ class TerminologyFixer(BaseFixer):
 
                 # Use word boundary replacement to avoid partial matches
                 pattern = r'\b' + re.escape(old_term) + r'\b'
-                before_fix = fixed_content
-                fixed_content = re.sub(pattern, new_term, fixed_content, flags=re.IGNORECASE)
+                before_fix = editable
+                editable = re.sub(pattern, new_term, editable, flags=re.IGNORECASE)
 
-                if before_fix != fixed_content:
+                if before_fix != editable:
                     fix_msg = f"Replaced '{old_term}' with '{new_term}'"
                     if fix_msg not in fixes_applied:
                         fixes_applied.append(fix_msg)
@@ -169,17 +176,20 @@ class TerminologyFixer(BaseFixer):
 
                 # Use exact word boundary replacement
                 pattern = r'\b' + re.escape(old_text) + r'\b'
-                before_fix = fixed_content
-                fixed_content = re.sub(pattern, new_text, fixed_content)
+                before_fix = editable
+                editable = re.sub(pattern, new_text, editable)
 
-                if before_fix != fixed_content:
+                if before_fix != editable:
                     fix_msg = f"Fixed capitalization: '{old_text}' → '{new_text}'"
                     if fix_msg not in fixes_applied:
                         fixes_applied.append(fix_msg)
                         issues_fixed.append(issue)
 
-        # Step 2: Restore original URLs
-        fixed_content = self._restore_urls(fixed_content, url_map)
+        # Put the edited segments back between the protected ones in one pass
+        fixed_content = content
+        if fixes_applied:
+            edited = iter(editable.split(separator))
+            fixed_content = ''.join(segment if protected else next(edited) for segment, protected in segments)
 
         return FixResult(
             file_path=file_path,
@@ -189,70 +199,6 @@ class TerminologyFixer(BaseFixer):
             issues_fixed=issues_fixed
         )
 
-    def _protect_urls(self, content: str) -> tuple:
-        """
-        Replace URLs and paths with placeholders to prevent modification
-
-        Returns:
-            Tuple of (protected_content, url_map) where url_map maps placeholders back to originals
-        """
-        url_map = {}
-        placeholder_counter = 0
-        protected_content = content
-
-        # Pattern 1: Markdown links [text](url) - protect the URL part only
-        def replace_markdown_link(match):
-            nonlocal placeholder_counter
-            text = match.group(1)
-            url = match.group(2)
-            placeholder = f"__URL_PLACEHOLDER_{placeholder_counter}__"
-            url_map[placeholder] = url
-            placeholder_counter += 1
-            return f"[{text}]({placeholder})"
-
-        protected_content = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', replace_markdown_link, protected_content)
-
-        # Pattern 2: HTML href attributes - protect the URL value
-        def replace_href(match):
-            nonlocal placeholder_counter
-            quote = match.group(1)
-            url = match.group(2)
-            placeholder = f"__URL_PLACEHOLDER_{placeholder_counter}__"
-            url_map[placeholder] = url
-            placeholder_counter += 1
-            return f'href={quote}{placeholder}{quote}'
-
-        protected_content = re.sub(r'href=([\"\'])([^\"\']+)\1', replace_href, protected_content)
-
-        # Pattern 3: Bare URLs (less common but handle them)
-        def replace_bare_url(match):
-            nonlocal placeholder_counter
-            url = match.group(0)
-            placeholder = f"__URL_PLACEHOLDER_{placeholder_counter}__"
-            url_map[placeholder] = url
-            placeholder_counter += 1
-            return placeholder
-
-        protected_content = re.sub(r'https?://[^\s\)]+', replace_bare_url, protected_content)
-
-        return protected_content, url_map
-
-    def _restore_urls(self, content: str, url_map: dict) -> str:
-        """
-        Restore original URLs from placeholders
-
-        Args:
-            content: Content with placeholders
-            url_map: Mapping of placeholders to original URLs
-
-        Returns:
-            Content with original URLs restored
-        """
-        restored_content = content
-        for placeholder, original_url in url_map.items():
-            restored_content = restored_content.replace(placeholder, original_url)
-        return restored_content
-
     def _is_url_line(self, line: str) -> bool:
         """
         Check if a line contains URLs that we should skip during checking
@@ -16,6 +16,7 @@ from typing import List, Dict
 from .base import BaseFixer
 from core.models import Issue, FixResult
 from core.config import Config
+from utils.protected_spans import protected_spans
 
 
 class TerminologyConsistencyFixer(BaseFixer):
@@ -116,6 +117,9 @@ class TerminologyConsistencyFixer(BaseFixer):
             if line.strip().startswith(('http://', 'https://', '`')):
                 continue
 
+            # Inline code and link targets are left alone
+            protected = protected_spans(line)
+
             # Check terminology patterns
             for preferred_term, variations in self.terminology_map.items():
                 for pattern, context_pattern in variations:
@@ -132,8 +136,8 @@ class TerminologyConsistencyFixer(BaseFixer):
                         if incorrect_term.lower() == preferred_term.lower():
                             continue
 
-                        # Skip if inside inline code
-                        if self._is_in_code(line, match.start()):
+                        # Skip if inside inline code or a link target
+                        if match.start() in protected:
                             continue
 
                         # Check context pattern if specified
@@ -185,12 +189,13 @@ class TerminologyConsistencyFixer(BaseFixer):
                 continue
 
             original_line = line
+            protected = protected_spans(original_line)
 
             # Apply terminology fixes
             for preferred_term, variations in self.terminology_map.items():
                 for pattern, context_pattern in variations:
                     def replace_func(match):
-                        if self._is_in_code(original_line, match.start()):
+                        if match.start() in protected:
                             return match.group(0)
 
                         # Check context if specified
@@ -225,12 +230,6 @@ class TerminologyConsistencyFixer(BaseFixer):
             issues_fixed=issues_fixed
         )
 
-    def _is_in_code(self, line: str, position: int) -> bool:
-        """Check if position is inside inline code backticks"""
-        before_pos = line[:position]
-        backtick_count = before_pos.count('`')
-        return backtick_count % 2 == 1
-
     def _get_context(self, line: str, match: re.Match, context_len: int = 60) -> str:
         """Extract context around the match"""
         start = max(0, match.start() - context_len // 2)
@@ -16,6 +16,8 @@ from fixers.base import BaseFixer
 class URLFixer(BaseFixer):
     """Fixes URL and link issues"""
 
+    required_substrings = ('](',)
+
     def __init__(self, config: Config):
         super().__init__(config)
         self.internal_must_be_relative = config.internal_links_must_be_relative
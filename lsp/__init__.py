@@ -0,0 +1,21 @@
+"""
+Language Server Protocol front end for the documentation analyzer
+
+Surfaces DocumentationAnalyzer checks and fixer issues as editor diagnostics
+while writers type, and offers auto-fixable issues as code actions.
+
+Usage:
+    python -m lsp [--config config.yaml]
+    python -m lsp.benchmark --lines 2000 --edits 300
+"""
+
+from .documents import TextDocument
+from .diagnostics import DiagnosticsEngine, DocumentState
+from .server import DocsLanguageServer
+
+__all__ = [
+    'TextDocument',
+    'DiagnosticsEngine',
+    'DocumentState',
+    'DocsLanguageServer',
+]
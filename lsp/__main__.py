@@ -0,0 +1,5 @@
+"""Run the documentation language server: python -m lsp"""
+
+from .server import main
+
+main()
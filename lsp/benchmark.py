@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Edit-replay benchmark for the language server diagnostics engine
+
+Opens a synthetic page, replays a seeded sequence of keystroke-sized edits
+and measures the fast-lane latency per edit against a budget.
+
+Usage:
+    python -m lsp.benchmark --lines 2000 --edits 300 --budget-ms 50
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .diagnostics import DiagnosticsEngine
+from .documents import TextDocument
+from .server import settle_heap
+
+PAGE_BLOCKS = [
+    "## Configure the client",
+    "",
+    "You can simply utilize the client to leverage the API in order to send requests.",
+    "The request is validated by the server and the response was returned to the caller.",
+    "See [the reference](./reference.mdx) or [click here](https://docs.claude.com/en/api) for details.",
+    "",
+    "```python",
+    "import anthropic",
+    "client = anthropic.Anthropic()",
+    "```",
+    "",
+    "<Note>",
+    "Set your API key before you run the example.",
+    "</Note>",
+    "",
+]
+
+
+def build_page(line_count: int) -> str:
+    """Build a Mintlify page with roughly line_count lines"""
+    lines = ['---', 'title: "Benchmark page"', 'description: "Synthetic page used to benchmark editor diagnostics"', '---', '']
+    while len(lines) < line_count:
+        lines.extend(PAGE_BLOCKS)
+    return '\n'.join(lines[:line_count])
+
+
+def build_edits(document: TextDocument, count: int, seed: int) -> List[Dict]:
+    """
+    Build a seeded edit sequence: mostly typing, some new lines and deletions
+
+    Positions are chosen against the line count at generation time and
+    clamped on replay, matching what an editor would send.
+    """
+    rng = random.Random(seed)
+    edits = []
+    line_count = len(document.lines)
+
+    for _ in range(count):
+        line = rng.randrange(5, line_count)
+        roll = rng.random()
+        if roll < 0.8:
+            # Type a character at the end of a line
+            edits.append({'line': line, 'kind': 'type', 'text': rng.choice('abcdefghij ')})
+        elif roll < 0.9:
+            edits.append({'line': line, 'kind': 'newline', 'text': '\n'})
+            line_count += 1
+        else:
+            edits.append({'line': line, 'kind': 'delete_line', 'text': ''})
+            line_count -= 1
+    return edits
+
+
+def to_change(document: TextDocument, edit: Dict) -> Dict:
+    """Convert a benchmark edit into an LSP content change"""
+    line = min(edit['line'], len(document.lines) - 1)
+    end_char = len(document.lines[line])
+
+    if edit['kind'] == 'delete_line' and line + 1 < len(document.lines):
+        return {
+            'range': {'start': {'line': line, 'character': 0}, 'end': {'line': line + 1, 'character': 0}},
+            'text': '',
+        }
+    position = {'line': line, 'character': end_char}
+    return {'range': {'start': position, 'end': position}, 'text': edit['text']}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def run_benchmark(engine: DiagnosticsEngine, lines: int, edits: int, seed: int) -> Dict:
+    """Replay an edit sequence and collect fast-lane latencies (ms)"""
+    document = TextDocument('file:///benchmark/page.mdx', build_page(lines), position_encoding='utf-32')
+
+    open_start = time.perf_counter()
+    state = engine.open(document)
+    open_ms = (time.perf_counter() - open_start) * 1000
+
+    latencies = []
+    for edit in build_edits(document, edits, seed):
+        start = time.perf_counter()
+        engine.apply_changes(state, [to_change(document, edit)])
+        engine.run_fast(state)
+        engine.to_diagnostics(state)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    slow_start = time.perf_counter()
+    engine.run_slow(state)
+    slow_ms = (time.perf_counter() - slow_start) * 1000
+
+    return {
+        'lines': lines,
+        'edits': edits,
+        'open_ms': open_ms,
+        'p50_ms': statistics.median(latencies),
+        'p95_ms': percentile(latencies, 95),
+        'max_ms': max(latencies),
+        'slow_lane_ms': slow_ms,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay edits against the LSP diagnostics engine')
+    parser.add_argument('--lines', type=int, default=2000, help='Page length in lines (default: 2000)')
+    parser.add_argument('--edits', type=int, default=300, help='Number of edits to replay (default: 300)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for the edit sequence')
+    parser.add_argument('--budget-ms', type=float, default=50.0, help='p95 fast-lane budget per edit (default: 50)')
+    parser.add_argument('--config', type=Path, default=None, help='Path to configuration file (YAML)')
+    args = parser.parse_args()
+
+    # Keep fixer start-up chatter out of the results
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        engine = DiagnosticsEngine.from_config(args.config)
+        engine.analyzer.repo_manager.repo_type = 'mintlify'
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+    # As the server does once after initialize
+    settle_heap()
+
+    results = run_benchmark(engine, args.lines, args.edits, args.seed)
+
+    print(f"⏱️  LSP edit replay: {results['lines']} lines, {results['edits']} edits")
+    print(f"   Open (both lanes):  {results['open_ms']:.1f} ms")
+    print(f"   Fast lane p50:      {results['p50_ms']:.2f} ms")
+    print(f"   Fast lane p95:      {results['p95_ms']:.2f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"   Fast lane max:      {results['max_ms']:.2f} ms")
+    print(f"   Slow lane (fixers): {results['slow_lane_ms']:.1f} ms")
+
+    if results['p95_ms'] > args.budget_ms:
+        print("❌ p95 latency exceeds budget")
+        sys.exit(1)
+    print("✅ Within budget")
+
+
+if __name__ == '__main__':
+    main()
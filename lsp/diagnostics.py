@@ -0,0 +1,273 @@
+"""
+Incremental diagnostics for open documents
+
+Checks are split into two lanes:
+- Fast lane (every keystroke, after a short debounce): the line-local
+  DocumentationAnalyzer checks, memoized per line so only edited lines are
+  re-checked, plus the cheap document-level structure/formatting/frontmatter
+  checks.
+- Slow lane (after the writer pauses): component validation and the fixer
+  chain, which need the whole document and are too slow to run per edit.
+"""
+
+import dataclasses
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from doc_analyzer import AnalysisReport, DocumentationAnalyzer, RepositoryManager
+from .documents import TextDocument
+
+# Issue severity -> LSP DiagnosticSeverity
+SEVERITY_MAP = {
+    'critical': 1,  # Error
+    'high': 1,
+    'medium': 2,    # Warning
+    'low': 3,       # Information
+}
+
+DIAGNOSTIC_SOURCE = 'docs-analyzer'
+
+
+class DocumentState:
+    """Cached analysis state for one open document"""
+
+    def __init__(self, document: TextDocument, relative_path: str):
+        self.document = document
+        self.relative_path = relative_path
+        # (line text, inside code block) -> issues reported for that line at line 1
+        self.line_cache: Dict[Tuple[str, bool], List[Any]] = {}
+        self.fast_issues: List[Any] = []
+        # (issue, fixer that reported it or None for analyzer checks)
+        self.slow_issues: List[Tuple[Any, Any]] = []
+        self.fast_ms = 0.0
+        self.slow_ms = 0.0
+
+
+class DiagnosticsEngine:
+    """Runs analyzer checks and fixers against open documents"""
+
+    def __init__(self, analyzer: DocumentationAnalyzer, fixers: Optional[list] = None):
+        self.analyzer = analyzer
+        self.fixers = fixers or []
+
+    @classmethod
+    def from_config(cls, config_path: Optional[Path] = None, workspace_root: Optional[Path] = None) -> 'DiagnosticsEngine':
+        """
+        Build an engine from config.yaml with AI analysis disabled
+
+        AI checks take seconds per request, so they are never run per edit.
+        """
+        from doc_fixer import DocFixer
+
+        if config_path is None:
+            config_path = Path(__file__).parent.parent / 'config.yaml'
+
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+
+        config.setdefault('repository', {})
+        config.setdefault('analysis', {})['enable_ai_analysis'] = False
+        config.setdefault('gap_detection', {})['semantic_analysis'] = {'enabled': False}
+        if workspace_root:
+            config['repository']['path'] = str(workspace_root)
+
+        repo_manager = RepositoryManager(config)
+        repo_manager.platform_config = repo_manager.load_platform_config()
+
+        analyzer = DocumentationAnalyzer(repo_manager, config)
+        fixers = DocFixer(config_path=config_path, enable_style_guide=False).fixers
+        return cls(analyzer, fixers)
+
+    @property
+    def is_mintlify(self) -> bool:
+        return self.analyzer.repo_manager.repo_type == 'mintlify'
+
+    def open(self, document: TextDocument) -> DocumentState:
+        """Start tracking a document and run both lanes once"""
+        try:
+            relative_path = str(document.path.relative_to(self.analyzer.repo_manager.repo_path))
+        except ValueError:
+            relative_path = document.path.name
+
+        state = DocumentState(document, relative_path)
+        self.run_fast(state)
+        self.run_slow(state)
+        return state
+
+    def apply_changes(self, state: DocumentState, changes: List[Dict[str, Any]]):
+        """
+        Apply content changes and keep slow-lane results anchored
+
+        Slow-lane issues on edited lines are dropped; issues below the edit
+        are shifted so they stay on the right line until the next slow run.
+        """
+        for change in changes:
+            start, old_end, new_count = state.document.apply_change(change)
+            delta = new_count - (old_end - start)
+
+            kept = []
+            for issue, fixer in state.slow_issues:
+                line = (issue.line_number or 1) - 1
+                if start <= line < old_end and issue.line_number is not None:
+                    continue
+                if line >= old_end and issue.line_number is not None:
+                    issue.line_number += delta
+                kept.append((issue, fixer))
+            state.slow_issues = kept
+
+    def _collect(self, check, *args) -> List[Any]:
+        """Run a DocumentationAnalyzer check and return only its issues"""
+        self.analyzer.report = AnalysisReport(timestamp='', total_files=0, total_issues=0)
+        check(*args)
+        return self.analyzer.report.issues
+
+    def _check_line(self, state: DocumentState, line: str, in_code_block: bool) -> List[Any]:
+        """Line-local checks for a single line, reported at line 1"""
+        issues = []
+        relative_path = state.relative_path
+
+        # check_readability skips fence lines and code block contents
+        if not in_code_block and not line.strip().startswith('```'):
+            issues.extend(self._collect(self.analyzer.check_readability, line, relative_path))
+        issues.extend(self._collect(self.analyzer.check_style_guide, line, relative_path))
+        issues.extend(self._collect(self.analyzer.check_links, line, relative_path, state.document.path))
+
+        if self.is_mintlify:
+            self.analyzer.mintlify_validator.validate_internal_links(relative_path, line, issues)
+
+        return issues
+
+    def run_fast(self, state: DocumentState) -> List[Any]:
+        """Re-run fast-lane checks, re-checking only lines missing from the cache"""
+        start_time = time.perf_counter()
+
+        issues = []
+        cache = state.line_cache
+        new_cache = {}
+        in_code_block = False
+
+        for i, line in enumerate(state.document.lines):
+            key = (line, in_code_block)
+            line_issues = new_cache.get(key)
+            if line_issues is None:
+                line_issues = cache.get(key)
+                if line_issues is None:
+                    line_issues = self._check_line(state, line, in_code_block)
+                new_cache[key] = line_issues
+
+            for issue in line_issues:
+                issues.append(dataclasses.replace(issue, line_number=i + 1))
+
+            if line.strip().startswith('```'):
+                in_code_block = not in_code_block
+
+        # Keep the cache bounded to lines currently in the document
+        state.line_cache = new_cache
+
+        text = state.document.text
+        issues.extend(self._collect(self.analyzer.check_structure, text, state.relative_path))
+        issues.extend(self._collect(self.analyzer.check_formatting, text, state.relative_path))
+        if self.is_mintlify:
+            self.analyzer.mintlify_validator.validate_frontmatter(state.relative_path, text, issues)
+
+        state.fast_issues = issues
+        state.fast_ms = (time.perf_counter() - start_time) * 1000
+        return issues
+
+    def run_slow(self, state: DocumentState) -> List[Tuple[Any, Any]]:
+        """Re-run whole-document component validation and the fixer chain"""
+        start_time = time.perf_counter()
+
+        text = state.document.text
+        file_path = str(state.document.path)
+        results = []
+
+        if self.is_mintlify:
+            component_issues = []
+            self.analyzer.mintlify_validator.validate_components(state.relative_path, text, component_issues)
+            results.extend((issue, None) for issue in component_issues)
+
+        for fixer in self.fixers:
+            try:
+                for issue in fixer.check_file(file_path, text):
+                    results.append((issue, fixer))
+            except Exception:
+                # A failing fixer must not take down the editor session
+                continue
+
+        state.slow_issues = results
+        state.slow_ms = (time.perf_counter() - start_time) * 1000
+        return results
+
+    def issues(self, state: DocumentState) -> List[Any]:
+        """All issues currently known for a document"""
+        return state.fast_issues + [issue for issue, _ in state.slow_issues]
+
+    def to_diagnostics(self, state: DocumentState) -> List[Dict[str, Any]]:
+        """Convert current issues into LSP Diagnostic objects"""
+        document = state.document
+        last_line = len(document.lines) - 1
+        diagnostics = []
+
+        for issue in self.issues(state):
+            line = min(max((issue.line_number or 1) - 1, 0), last_line)
+            message = issue.description
+            if issue.suggestion:
+                message += f"\n{issue.suggestion}"
+
+            diagnostics.append({
+                'range': document.line_range(line),
+                'severity': SEVERITY_MAP.get(issue.severity, 3),
+                'code': issue.issue_type,
+                'source': DIAGNOSTIC_SOURCE,
+                'message': message,
+            })
+
+        return diagnostics
+
+    def code_actions(self, state: DocumentState, lsp_range: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Offer auto-fixable fixer issues in the requested range as quick fixes"""
+        first = lsp_range['start']['line']
+        last = lsp_range['end']['line']
+        text = state.document.text
+        file_path = str(state.document.path)
+
+        actions = []
+        seen_titles = set()
+
+        for issue, fixer in state.slow_issues:
+            if fixer is None or not getattr(issue, 'auto_fixable', False):
+                continue
+            line = (issue.line_number or 1) - 1
+            if not first <= line <= last:
+                continue
+
+            try:
+                result = fixer.fix(file_path, text, [issue])
+            except Exception:
+                continue
+            if not result.content_changed:
+                continue
+
+            title = f"{fixer.name}: {', '.join(result.fixes_applied) or issue.description}"
+            if title in seen_titles:
+                continue
+            seen_titles.add(title)
+
+            actions.append({
+                'title': title,
+                'kind': 'quickfix',
+                'edit': {
+                    'changes': {
+                        state.document.uri: [{
+                            'range': state.document.full_range(),
+                            'newText': result.fixed_content,
+                        }]
+                    }
+                },
+            })
+
+        return actions
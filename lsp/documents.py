@@ -0,0 +1,103 @@
+"""
+In-memory text documents kept open by the language server
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+from pathlib import Path
+
+
+def uri_to_path(uri: str) -> Path:
+    """Convert a file:// URI into a local path"""
+    parsed = urlparse(uri)
+    return Path(unquote(parsed.path))
+
+
+def _utf16_to_index(line: str, character: int) -> int:
+    """Map a UTF-16 code unit offset onto a Python string index"""
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+class TextDocument:
+    """
+    Open document stored as a list of lines
+
+    Edits are applied in place so each keystroke only touches the lines in
+    the edited range instead of rebuilding the whole text.
+    """
+
+    def __init__(self, uri: str, text: str, version: int = 0, position_encoding: str = 'utf-16'):
+        self.uri = uri
+        self.path = uri_to_path(uri) if uri.startswith('file:') else Path(uri)
+        self.version = version
+        self.position_encoding = position_encoding
+        self.lines: List[str] = text.split('\n')
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+    def _index(self, line: int, character: int) -> int:
+        if line >= len(self.lines):
+            return 0
+        if self.position_encoding == 'utf-16':
+            return _utf16_to_index(self.lines[line], character)
+        return min(character, len(self.lines[line]))
+
+    def apply_change(self, change: Dict[str, Any]) -> Tuple[int, int, int]:
+        """
+        Apply one TextDocumentContentChangeEvent
+
+        Args:
+            change: Either {'text': ...} (full sync) or {'range': ..., 'text': ...}
+
+        Returns:
+            Tuple of (start_line, old_end_line, new_line_count) describing the
+            replaced 0-based line span [start_line, old_end_line)
+        """
+        if 'range' not in change or change['range'] is None:
+            old_count = len(self.lines)
+            self.lines = change['text'].split('\n')
+            return 0, old_count, len(self.lines)
+
+        start = change['range']['start']
+        end = change['range']['end']
+        start_line = min(start['line'], len(self.lines) - 1)
+        end_line = min(end['line'], len(self.lines) - 1)
+
+        prefix = self.lines[start_line][:self._index(start_line, start['character'])]
+        suffix = self.lines[end_line][self._index(end_line, end['character']):]
+        new_lines = (prefix + change['text'] + suffix).split('\n')
+
+        self.lines[start_line:end_line + 1] = new_lines
+        return start_line, end_line + 1, len(new_lines)
+
+    def line_range(self, line: int) -> Dict[str, Any]:
+        """LSP range covering a whole 0-based line"""
+        length = len(self.lines[line]) if 0 <= line < len(self.lines) else 0
+        if self.position_encoding == 'utf-16' and 0 <= line < len(self.lines):
+            length = len(self.lines[line].encode('utf-16-le')) // 2
+        return {
+            'start': {'line': line, 'character': 0},
+            'end': {'line': line, 'character': length},
+        }
+
+    def full_range(self) -> Dict[str, Any]:
+        """LSP range covering the whole document"""
+        last = len(self.lines) - 1
+        return {
+            'start': {'line': 0, 'character': 0},
+            'end': self.line_range(last)['end'],
+        }
+
+
+def negotiate_position_encoding(client_capabilities: Optional[Dict[str, Any]]) -> str:
+    """Prefer utf-32 (Python string indices) when the client supports it"""
+    general = (client_capabilities or {}).get('general', {})
+    offered = general.get('positionEncodings') or []
+    return 'utf-32' if 'utf-32' in offered else 'utf-16'
@@ -0,0 +1,69 @@
+"""
+JSON-RPC 2.0 framing for the Language Server Protocol (stdio transport)
+"""
+
+import json
+import threading
+from typing import Any, BinaryIO, Dict, Optional
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Read one Content-Length framed JSON-RPC message
+
+    Args:
+        stream: Binary input stream (usually sys.stdin.buffer)
+
+    Returns:
+        Decoded message, or None when the stream is closed
+    """
+    content_length = None
+
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+
+        header = header.decode('ascii').strip()
+        if not header:
+            break
+
+        name, _, value = header.partition(':')
+        if name.lower() == 'content-length':
+            content_length = int(value.strip())
+
+    if content_length is None:
+        return None
+
+    body = stream.read(content_length)
+    return json.loads(body.decode('utf-8'))
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a JSON-RPC message with its Content-Length header"""
+    body = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    return f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body
+
+
+class JsonRpcConnection:
+    """Thread-safe writer for responses and notifications"""
+
+    def __init__(self, output: BinaryIO):
+        self.output = output
+        self._lock = threading.Lock()
+
+    def send(self, message: Dict[str, Any]):
+        message.setdefault('jsonrpc', '2.0')
+        data = encode_message(message)
+        with self._lock:
+            self.output.write(data)
+            self.output.flush()
+
+    def respond(self, request_id: Any, result: Any = None):
+        self.send({'id': request_id, 'result': result})
+
+    def respond_error(self, request_id: Any, code: int, message: str):
+        self.send({'id': request_id, 'error': {'code': code, 'message': message}})
+
+    def notify(self, method: str, params: Dict[str, Any]):
+        self.send({'method': method, 'params': params})
@@ -0,0 +1,277 @@
+"""
+Documentation language server (stdio transport)
+
+Keeps open documents in memory, publishes diagnostics as writers type and
+offers auto-fixable issues as code actions.
+"""
+
+import argparse
+import gc
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .diagnostics import DiagnosticsEngine, DocumentState
+from .documents import TextDocument, negotiate_position_encoding, uri_to_path
+from .protocol import JsonRpcConnection, read_message
+
+# LSP TextDocumentSyncKind.Incremental
+SYNC_INCREMENTAL = 2
+
+# JSON-RPC error codes
+SERVER_NOT_INITIALIZED = -32002
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+# Young-generation threshold while serving (CPython's default is 700)
+GC_GEN0_THRESHOLD = 5000
+
+
+def settle_heap():
+    """
+    Move the start-up heap out of the cyclic GC's reach
+
+    Call once, after the engine is built. The loaded modules, config and
+    compiled patterns live as long as the server, so freezing them keeps
+    later full collections from rescanning them. Frozen objects are never
+    collected, so this must not run per document. Each fast-lane run
+    allocates a few thousand short-lived objects, so the young-generation
+    threshold is also raised to collect less often while typing.
+    """
+    gc.collect()
+    gc.freeze()
+    _, gen1, gen2 = gc.get_threshold()
+    gc.set_threshold(GC_GEN0_THRESHOLD, gen1, gen2)
+
+
+class DocsLanguageServer:
+    """Minimal LSP server wired to DiagnosticsEngine"""
+
+    def __init__(self, connection: JsonRpcConnection,
+                 engine_factory: Callable[[Optional[Path]], DiagnosticsEngine],
+                 fast_debounce: float = 0.05, slow_debounce: float = 0.6):
+        """
+        Initialize the server
+
+        Args:
+            connection: Output connection for responses and notifications
+            engine_factory: Builds the DiagnosticsEngine once the workspace root is known
+            fast_debounce: Seconds to wait after an edit before the fast lane runs
+            slow_debounce: Seconds of inactivity before the slow lane (fixers) runs
+        """
+        self.connection = connection
+        self.engine_factory = engine_factory
+        self.engine: Optional[DiagnosticsEngine] = None
+        self.fast_debounce = fast_debounce
+        self.slow_debounce = slow_debounce
+        self.position_encoding = 'utf-16'
+        self.documents: Dict[str, DocumentState] = {}
+        self.timers: Dict[tuple, threading.Timer] = {}
+        self.lock = threading.RLock()
+        self.shutdown_requested = False
+
+    # ------------------------------------------------------------------ dispatch
+
+    def handle(self, message: Dict[str, Any]) -> bool:
+        """
+        Dispatch one incoming message
+
+        Returns:
+            False once the client has sent 'exit'
+        """
+        method = message.get('method')
+        request_id = message.get('id')
+        params = message.get('params') or {}
+
+        if method == 'exit':
+            self._cancel_all_timers()
+            return False
+
+        # Until initialize has built the engine, requests fail and notifications are dropped
+        if self.engine is None and method != 'initialize':
+            if request_id is not None and method is not None:
+                self.connection.respond_error(request_id, SERVER_NOT_INITIALIZED, 'Server not initialized')
+            return True
+
+        handler = getattr(self, '_on_' + method.replace('/', '_').replace('$', 'dollar'), None) if method else None
+
+        if handler is None:
+            if request_id is not None and method is not None:
+                self.connection.respond_error(request_id, METHOD_NOT_FOUND, f'Unhandled method: {method}')
+            return True
+
+        try:
+            result = handler(params)
+        except Exception as e:
+            if request_id is not None:
+                self.connection.respond_error(request_id, INTERNAL_ERROR, str(e))
+            else:
+                print(f"⚠️  {method} failed: {e}", file=sys.stderr)
+            return True
+
+        if request_id is not None:
+            self.connection.respond(request_id, result)
+        return True
+
+    def serve(self, stream):
+        """Read and dispatch messages until 'exit' or end of stream"""
+        while True:
+            message = read_message(stream)
+            if message is None or not self.handle(message):
+                break
+
+    # ------------------------------------------------------------------ lifecycle
+
+    def _on_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        root_uri = params.get('rootUri')
+        root = uri_to_path(root_uri) if root_uri else None
+        self.engine = self.engine_factory(root)
+        settle_heap()
+        self.position_encoding = negotiate_position_encoding(params.get('capabilities'))
+
+        return {
+            'capabilities': {
+                'positionEncoding': self.position_encoding,
+                'textDocumentSync': {
+                    'openClose': True,
+                    'change': SYNC_INCREMENTAL,
+                    'save': {'includeText': False},
+                },
+                'codeActionProvider': {'codeActionKinds': ['quickfix']},
+            },
+            'serverInfo': {'name': 'docs-analyzer-lsp'},
+        }
+
+    def _on_initialized(self, params: Dict[str, Any]):
+        return None
+
+    def _on_shutdown(self, params: Dict[str, Any]):
+        self.shutdown_requested = True
+        self._cancel_all_timers()
+        return None
+
+    # ------------------------------------------------------------------ documents
+
+    def _on_textDocument_didOpen(self, params: Dict[str, Any]):
+        item = params['textDocument']
+        document = TextDocument(item['uri'], item['text'], item.get('version', 0), self.position_encoding)
+        with self.lock:
+            self.documents[item['uri']] = self.engine.open(document)
+        self.publish(item['uri'])
+
+    def _on_textDocument_didChange(self, params: Dict[str, Any]):
+        uri = params['textDocument']['uri']
+        with self.lock:
+            state = self.documents.get(uri)
+            if state is None:
+                return
+            state.document.version = params['textDocument'].get('version', state.document.version)
+            self.engine.apply_changes(state, params.get('contentChanges', []))
+
+        self._schedule(uri, 'fast', self.fast_debounce, self._run_fast)
+        self._schedule(uri, 'slow', self.slow_debounce, self._run_slow)
+
+    def _on_textDocument_didSave(self, params: Dict[str, Any]):
+        uri = params['textDocument']['uri']
+        with self.lock:
+            state = self.documents.get(uri)
+            if state is None:
+                return
+            # Link targets may have appeared on disk; drop memoized line results
+            state.line_cache.clear()
+        self._schedule(uri, 'fast', 0, self._run_fast)
+
+    def _on_textDocument_didClose(self, params: Dict[str, Any]):
+        uri = params['textDocument']['uri']
+        with self.lock:
+            self.documents.pop(uri, None)
+            for lane in ('fast', 'slow'):
+                timer = self.timers.pop((uri, lane), None)
+                if timer:
+                    timer.cancel()
+        self.connection.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+
+    def _on_textDocument_codeAction(self, params: Dict[str, Any]):
+        uri = params['textDocument']['uri']
+        with self.lock:
+            state = self.documents.get(uri)
+            if state is None:
+                return []
+            return self.engine.code_actions(state, params['range'])
+
+    # ------------------------------------------------------------------ debounce
+
+    def _schedule(self, uri: str, lane: str, delay: float, callback: Callable[[str], None]):
+        with self.lock:
+            previous = self.timers.pop((uri, lane), None)
+            if previous:
+                previous.cancel()
+            timer = threading.Timer(delay, callback, args=(uri,))
+            timer.daemon = True
+            self.timers[(uri, lane)] = timer
+            timer.start()
+
+    def _cancel_all_timers(self):
+        with self.lock:
+            for timer in self.timers.values():
+                timer.cancel()
+            self.timers.clear()
+
+    def _run_fast(self, uri: str):
+        with self.lock:
+            state = self.documents.get(uri)
+            if state is None:
+                return
+            self.engine.run_fast(state)
+        self.publish(uri)
+
+    def _run_slow(self, uri: str):
+        with self.lock:
+            state = self.documents.get(uri)
+            if state is None:
+                return
+            self.engine.run_slow(state)
+        self.publish(uri)
+
+    def publish(self, uri: str):
+        """Send current diagnostics for a document"""
+        with self.lock:
+            state = self.documents.get(uri)
+            if state is None:
+                return
+            params = {
+                'uri': uri,
+                'version': state.document.version,
+                'diagnostics': self.engine.to_diagnostics(state),
+            }
+        self.connection.notify('textDocument/publishDiagnostics', params)
+
+
+def main():
+    """Run the language server over stdio"""
+    parser = argparse.ArgumentParser(description='Documentation quality language server (stdio)')
+    parser.add_argument('--config', type=Path, default=None, help='Path to configuration file (YAML)')
+    parser.add_argument('--debounce-ms', type=int, default=50,
+                        help='Delay after an edit before fast checks run (default: 50)')
+    parser.add_argument('--fixer-debounce-ms', type=int, default=600,
+                        help='Idle time before fixers run (default: 600)')
+    args = parser.parse_args()
+
+    # stdout carries the protocol; route analyzer/fixer prints to stderr
+    protocol_out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    connection = JsonRpcConnection(protocol_out)
+    server = DocsLanguageServer(
+        connection,
+        engine_factory=lambda root: DiagnosticsEngine.from_config(args.config, root),
+        fast_debounce=args.debounce_ms / 1000,
+        slow_debounce=args.fixer_debounce_ms / 1000,
+    )
+    server.serve(sys.stdin.buffer)
+    sys.exit(0 if server.shutdown_requested else 1)
+
+
+if __name__ == '__main__':
+    main()
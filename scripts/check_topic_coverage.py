@@ -13,24 +13,40 @@ Uses semantic/keyword search to find topic mentions in docs.
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import List, Dict, Any, Set
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.documents import read_text
+from utils.inverted_index import InvertedIndex, query_tokens
+
+# Saved index, kept next to the docs and reused across runs (documents whose
+# content changed are re-indexed)
+INDEX_FILENAME = ".topic_index"
+
+# Topic text that starts and ends with a word, so its first word's postings find every occurrence
+_WORD_SPAN = re.compile(r'\w(?:.*\w)?', re.DOTALL)
 
 
 class TopicCoverageChecker:
     """Checks if requested topics are covered in documentation"""
 
-    def __init__(self, docs_path: str):
+    def __init__(self, docs_path: str, index_path: Path = None):
         """
         Initialize checker with docs directory.
 
         Args:
             docs_path: Path to documentation directory
+            index_path: Where to save and reuse the search index (default: not saved)
         """
         self.docs_path = Path(docs_path)
+        self.index_path = index_path
         self.doc_contents = {}
+        self.index = None  # positional word index, built by _load_docs
         self._load_docs()
 
     def _load_docs(self):
@@ -45,31 +61,53 @@ class TopicCoverageChecker:
 
         for file_path in doc_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Store relative path as key
-                    rel_path = file_path.relative_to(self.docs_path)
-                    self.doc_contents[str(rel_path)] = {
-                        'path': str(rel_path),
-                        'full_path': str(file_path),
-                        'content': content,
-                        'content_lower': content.lower()
-                    }
+                content = read_text(file_path)
+                # Store relative path as key
+                rel_path = file_path.relative_to(self.docs_path)
+                self.doc_contents[str(rel_path)] = {
+                    'path': str(rel_path),
+                    'full_path': str(file_path),
+                    'content': content
+                }
             except Exception as e:
                 print(f"Warning: Could not read {file_path}: {e}")
 
-        print(f"Loaded {len(self.doc_contents)} documentation files")
+        # Index once (or reuse the saved index); topic searches are index lookups
+        self.index, indexed = InvertedIndex.load_or_build(
+            self.index_path, {doc_path: doc_data['content'] for doc_path, doc_data in self.doc_contents.items()})
+
+        print(f"Loaded {len(self.doc_contents)} documentation files ({indexed} indexed)")
+
+    def _related_docs(self, topic_words: Set[str]) -> Set[str]:
+        """Documents containing at least 60% of the topic's words"""
+        hits = Counter()
+        for word in topic_words:
+            hits.update(self.index.documents_with(word))
+        return {doc_path for doc_path, found in hits.items() if found >= len(topic_words) * 0.6}
+
+    @staticmethod
+    def _substring_hit(text: str, topic: str):
+        """First occurrence of topic in text as a posting (position, line number, offset)"""
+        idx = text.find(topic)
+        if idx < 0:
+            return None
+        return (None, text.count('\n', 0, idx) + 1, idx)
 
     def search_topic(self, topic: str) -> Dict[str, Any]:
         """
         Search for a topic in the documentation.
 
-        Uses multiple search strategies:
+        Uses multiple search strategies, all answered from the index:
         1. Exact phrase match
         2. Case-insensitive match
-        3. Word-boundary match (avoids partial matches)
+        3. Word-boundary match (same words, different separators)
         4. Related term matching
 
+        Strategies 1 and 2 match the topic text starting at a word
+        boundary, so "MCP" matches "MCPs" but not "xMCP". Topics that
+        start or end with punctuation (".NET", "C++") or have no words
+        ("++") are matched by a substring scan instead.
+
         Args:
             topic: Topic to search for (e.g., "Bedrock", "MCP", "AskUserQuestion")
 
@@ -86,11 +124,31 @@ class TopicCoverageChecker:
 
         # Normalize topic for searching
         topic_lower = topic.lower()
-        topic_words = set(re.findall(r'\w+', topic_lower))
+        words = query_tokens(topic)
+        topic_words = set(words)
+        indexed = _WORD_SPAN.fullmatch(topic) is not None
+        prefix_hits = self.index.phrase(words, prefix=True) if indexed else {}
+        word_hits = self.index.phrase(words)
+        related_docs = self._related_docs(topic_words) if len(topic_words) > 1 else set()
+        if indexed:
+            candidates = prefix_hits.keys() | word_hits.keys() | related_docs
+        else:
+            candidates = self.doc_contents.keys()
 
         for doc_path, doc_data in self.doc_contents.items():
+            if doc_path not in candidates:
+                continue
             content = doc_data['content']
-            content_lower = doc_data['content_lower']
+
+            # Phrase occurrences whose text matches the topic exactly / ignoring case
+            if indexed:
+                hits = prefix_hits.get(doc_path, [])
+                exact = next((hit for hit in hits if content.startswith(topic, hit[2])), None)
+                insensitive = next((hit for hit in hits
+                                    if content[hit[2]:hit[2] + len(topic)].lower() == topic_lower), None)
+            else:
+                exact = self._substring_hit(content, topic)
+                insensitive = None if exact else self._substring_hit(content.lower(), topic_lower)
 
             match_info = {
                 'file': doc_path,
@@ -100,57 +158,55 @@ class TopicCoverageChecker:
             }
 
             # Strategy 1: Exact case-sensitive match
-            if topic in content:
+            if exact:
                 match_info['match_type'] = 'exact'
                 results['found'] = True
                 results['confidence'] = 'high'
 
                 # Find context around match
-                idx = content.index(topic)
+                idx = exact[2]
                 start = max(0, idx - 50)
                 end = min(len(content), idx + len(topic) + 50)
                 match_info['excerpt'] = content[start:end]
 
-                # Find line number
-                match_info['line_number'] = content[:idx].count('\n') + 1
+                # Line number from the index posting
+                match_info['line_number'] = exact[1]
 
                 results['matches'].append(match_info)
                 if 'exact' not in results['match_types']:
                     results['match_types'].append('exact')
 
             # Strategy 2: Case-insensitive match
-            elif topic_lower in content_lower:
+            elif insensitive:
                 match_info['match_type'] = 'case_insensitive'
                 results['found'] = True
                 if results['confidence'] == 'none':
                     results['confidence'] = 'high'
 
                 # Find context
-                idx = content_lower.index(topic_lower)
+                idx = insensitive[2]
                 start = max(0, idx - 50)
                 end = min(len(content), idx + len(topic) + 50)
                 match_info['excerpt'] = content[start:end]
-                match_info['line_number'] = content[:idx].count('\n') + 1
+                match_info['line_number'] = insensitive[1]
 
                 results['matches'].append(match_info)
                 if 'case_insensitive' not in results['match_types']:
                     results['match_types'].append('case_insensitive')
 
             # Strategy 3: Word boundary match (e.g., "bedrock" as a complete word)
-            elif re.search(rf'\b{re.escape(topic_lower)}\b', content_lower):
+            elif doc_path in word_hits:
                 match_info['match_type'] = 'word_boundary'
                 results['found'] = True
                 if results['confidence'] == 'none':
                     results['confidence'] = 'medium'
 
-                # Find first occurrence
-                match = re.search(rf'\b{re.escape(topic_lower)}\b', content_lower)
-                if match:
-                    idx = match.start()
-                    start = max(0, idx - 50)
-                    end = min(len(content), idx + len(topic) + 50)
-                    match_info['excerpt'] = content[start:end]
-                    match_info['line_number'] = content[:idx].count('\n') + 1
+                # First occurrence of the words in sequence
+                _, line_number, idx = word_hits[doc_path][0]
+                start = max(0, idx - 50)
+                end = min(len(content), idx + len(topic) + 50)
+                match_info['excerpt'] = content[start:end]
+                match_info['line_number'] = line_number
 
                 results['matches'].append(match_info)
                 if 'word_boundary' not in results['match_types']:
@@ -159,21 +215,21 @@ class TopicCoverageChecker:
             # Strategy 4: Related terms (for compound topics)
             # Check if majority of words in topic appear
             elif len(topic_words) > 1:
-                words_found = sum(1 for word in topic_words if word in content_lower)
-                if words_found >= len(topic_words) * 0.6:  # 60% of words found
+                if doc_path in related_docs:  # 60% of words found
                     match_info['match_type'] = 'related_terms'
                     results['found'] = True
                     if results['confidence'] == 'none':
                         results['confidence'] = 'low'
 
                     # Find a relevant excerpt
-                    for word in topic_words:
-                        if word in content_lower:
-                            idx = content_lower.index(word)
+                    for word in words:
+                        postings = self.index.occurrences(word, doc_path)
+                        if postings:
+                            _, line_number, idx = postings[0]
                             start = max(0, idx - 50)
                             end = min(len(content), idx + 100)
                             match_info['excerpt'] = content[start:end]
-                            match_info['line_number'] = content[:idx].count('\n') + 1
+                            match_info['line_number'] = line_number
                             break
 
                     results['matches'].append(match_info)
@@ -369,7 +425,7 @@ def main():
         print("Please update docs_path in the script to point to your Claude docs")
         return 1
 
-    checker = TopicCoverageChecker(docs_path)
+    checker = TopicCoverageChecker(docs_path, index_path=Path(docs_path) / INDEX_FILENAME)
     coverage_results = checker.check_all_topics(requested_topics)
 
     # Generate report
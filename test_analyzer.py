@@ -269,13 +269,14 @@ console.log(x);
         assert report.issues_by_severity['medium'] == 1
         assert report.issues_by_category['style'] == 1
     
-    def test_export_json(self, temp_docs_setup):
+    def test_export_json(self, temp_docs_setup, tmp_path):
         """Test JSON export functionality"""
         docs_path, repo_manager, config = temp_docs_setup
         analyzer = DocumentationAnalyzer(repo_manager, config)
         analyzer.analyze_all()
 
-        output_path = docs_path / "report.json"
+        # Write outside examples/ so the tracked sample report is left alone
+        output_path = tmp_path / "report.json"
         analyzer.export_report('json', str(output_path))
         
         assert output_path.exists()
@@ -0,0 +1,80 @@
+"""
+Tests for AI call telemetry and the cost ledger
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from analyzers.semantic_analyzer import SemanticAnalyzer
+from utils.ai_telemetry import (
+    AITelemetry, calibrate_from_ledger, call_cost, default_ledger_path, ledger_path, load_ledger
+)
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def response(input_tokens=100, output_tokens=50, cache_read=0):
+    usage = SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens,
+                            cache_creation_input_tokens=0, cache_read_input_tokens=cache_read)
+    return SimpleNamespace(content=[SimpleNamespace(text='[]')], usage=usage)
+
+
+class TestAITelemetry:
+    def test_aggregates_latency_tokens_and_cost(self):
+        telemetry = AITelemetry('test')
+        for ms in (100, 200, 300, 400, 6000):
+            telemetry.record('claude-sonnet-4-5-20250929', ms, 0, 800, response())
+        telemetry.record('claude-sonnet-4-5-20250929', 9000, 2, 800, status='rate_limited')
+
+        data = telemetry.to_dict()
+        assert data['calls'] == 6
+        assert data['failed_calls'] == 1
+        assert data['retries'] == 2
+        assert data['latency_ms']['p50'] in (300, 400)
+        assert data['latency_ms']['p95'] == 9000
+        assert data['latency_ms']['histogram']['<=250ms'] == 2
+        assert sum(data['latency_ms']['histogram'].values()) == 6
+        assert data['tokens']['input'] == 500
+        assert abs(data['cost_usd'] - 5 * call_cost('claude-sonnet-4-5-20250929', 100, 50)) < 1e-9
+
+    def test_cache_reads_are_discounted(self):
+        full = call_cost('claude-sonnet-4-5-20250929', 1000, 0)
+        cached = call_cost('claude-sonnet-4-5-20250929', 0, 0, cache_read_input_tokens=1000)
+        assert cached < full
+
+    def test_ledger_appends_once_and_calibrates(self, tmp_path):
+        ledger = tmp_path / 'ledger.jsonl'
+        telemetry = AITelemetry('semantic_analyzer')
+        telemetry.record('m', 10, 0, 3000, response(input_tokens=800, output_tokens=400, cache_read=200))
+        telemetry.write_ledger(ledger)
+        telemetry.write_ledger(ledger)
+
+        records = load_ledger(ledger)
+        assert len(records) == 1
+
+        calibration = calibrate_from_ledger(records, component='semantic_analyzer')
+        assert calibration['chars_per_token'] == 3.0
+        assert calibration['output_tokens_per_call'] == 400
+        assert calibrate_from_ledger(records, component='other') is None
+
+    def test_default_ledger_is_outside_the_checkout(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('XDG_DATA_HOME', str(tmp_path))
+        assert default_ledger_path() == tmp_path / 'docs_analyzer' / 'ai_cost_ledger.jsonl'
+        assert REPO_ROOT.resolve() not in default_ledger_path().resolve().parents
+
+    def test_tests_write_a_private_ledger(self, isolated_cost_ledger):
+        telemetry = AITelemetry('semantic_analyzer')
+        telemetry.record('m', 10, 0, 100, response())
+        assert telemetry.write_ledger() == ledger_path() == isolated_cost_ledger
+
+    def test_analyzer_records_each_call(self):
+        analyzer = SemanticAnalyzer({'gap_detection': {'semantic_analysis': {'enabled': False}}})
+        analyzer.claude_client = SimpleNamespace(messages=SimpleNamespace(create=lambda **kwargs: response()))
+        analyzer.enabled = True
+
+        analyzer.analyze_clarity('page.mdx', '# Page\n\nBody.', [])
+
+        assert analyzer.telemetry.calls == 1
+        record = analyzer.telemetry.records[0]
+        assert record.status == 'ok'
+        assert record.prompt_chars > len('# Page\n\nBody.')
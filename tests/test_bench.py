@@ -0,0 +1,124 @@
+"""
+Tests for the benchmark corpus generator and runner
+"""
+
+from bench.cases import select_cases
+from bench.compare import compare_results, format_table
+from bench.corpus import CorpusSpec, ensure_corpus, generate_corpus
+from bench.redos import PatternSource, adversarial_inputs, audit_pattern, audit_patterns, collect_patterns
+from bench.runner import run_suite
+
+
+class TestCorpus:
+    def test_generation_is_deterministic(self, tmp_path):
+        spec = CorpusSpec(pages=6, lines_per_page=40)
+        first = generate_corpus(tmp_path / 'a', spec)
+        second = generate_corpus(tmp_path / 'b', spec)
+
+        assert len(first) == 6
+        assert (tmp_path / 'a' / 'docs.json').exists()
+        for a, b in zip(first, second):
+            assert a.read_text() == b.read_text()
+
+    def test_feature_mix_follows_spec(self, tmp_path):
+        files = generate_corpus(tmp_path, CorpusSpec(pages=10, lines_per_page=60, code_blocks_per_page=0,
+                                                     components_per_page=0, violation_rate=1.0))
+        text = ''.join(path.read_text() for path in files)
+
+        assert '```' not in text
+        assert '<Note>' not in text
+        assert 'utilize' in text or 'leverage' in text or 'simply' in text
+
+    def test_existing_corpus_reused_only_for_same_spec(self, tmp_path):
+        spec = CorpusSpec(pages=3, lines_per_page=30)
+        files = ensure_corpus(tmp_path, spec)
+        files[0].write_text('edited')
+
+        assert ensure_corpus(tmp_path, spec)[0].read_text() == 'edited'
+        ensure_corpus(tmp_path, CorpusSpec(pages=3, lines_per_page=30, seed=7))
+        assert files[0].read_text() != 'edited'
+
+
+class TestRunner:
+    def test_run_suite_records_cases_and_skips_capped_ones(self, tmp_path):
+        cases = select_cases(['check.check_structure', 'find_duplicates'])
+        results = run_suite([3, 20], cases, repeats=1, spec=CorpusSpec(lines_per_page=30),
+                            corpus_root=tmp_path, progress=lambda line: None)
+
+        small = results['results']['3']
+        assert small['check.check_structure']['median_ms'] >= 0
+        assert 'peak_kb' in small['check.check_structure']
+        assert small['check.check_structure']['target'] == 'DocumentationAnalyzer.check_structure'
+        assert 'skipped' in results['results']['20']['module.ContentDuplicationDetector.find_duplicates']
+
+
+def _results(entries):
+    return {'meta': {}, 'results': {'10': entries}}
+
+
+class TestCompare:
+    def test_flags_slowdown_beyond_tolerance(self):
+        baseline = _results({
+            'fixer.A.check_file': {'target': 'A.check_file', 'median_ms': 100.0, 'min_ms': 98.0, 'max_ms': 103.0},
+            'fixer.B.check_file': {'target': 'B.check_file', 'median_ms': 100.0, 'min_ms': 98.0, 'max_ms': 103.0},
+        })
+        current = _results({
+            'fixer.A.check_file': {'target': 'A.check_file', 'median_ms': 180.0},
+            'fixer.B.check_file': {'target': 'B.check_file', 'median_ms': 110.0},
+        })
+
+        deltas = {d.name: d for d in compare_results(baseline, current)}
+        assert deltas['fixer.A.check_file'].status == 'slower'
+        assert deltas['fixer.B.check_file'].status == 'ok'
+        assert 'A.check_file' in format_table(list(deltas.values()), only_changes=True)
+
+    def test_noise_floor_and_baseline_spread(self):
+        baseline = _results({
+            'check.tiny': {'target': 'tiny', 'median_ms': 0.5, 'min_ms': 0.4, 'max_ms': 0.6},
+            'check.noisy': {'target': 'noisy', 'median_ms': 100.0, 'min_ms': 60.0, 'max_ms': 160.0},
+        })
+        current = _results({
+            'check.tiny': {'target': 'tiny', 'median_ms': 1.5},
+            'check.noisy': {'target': 'noisy', 'median_ms': 150.0},
+        })
+
+        assert all(d.status == 'ok' for d in compare_results(baseline, current))
+        strict = compare_results(baseline, current, case_tolerances={'check.noisy': 0.1})
+        assert {d.name: d.status for d in strict}['check.noisy'] == 'ok'  # spread still wins
+
+    def test_memory_growth_and_missing_cases(self):
+        baseline = _results({
+            'check.a': {'target': 'a', 'median_ms': 10.0, 'peak_kb': 1000.0},
+            'check.b': {'target': 'b', 'median_ms': 10.0},
+        })
+        current = _results({'check.a': {'target': 'a', 'median_ms': 10.0, 'peak_kb': 2000.0}})
+
+        deltas = {d.name: d for d in compare_results(baseline, current)}
+        assert deltas['check.a'].regressed and deltas['check.a'].status == 'memory'
+        assert deltas['check.b'].status == 'missing'
+        assert 'check.b' not in {d.name for d in compare_results(baseline, current, expected={'check.a'})}
+
+
+class TestRedosAudit:
+    def test_collects_configured_and_builtin_patterns(self):
+        sources = {source.source.split(':')[0].split('.')[0] for source in collect_patterns()}
+        assert {'config', 'validation_rules', 'CapitalizationFixer', 'TerminologyConsistencyFixer',
+                'PassiveVoiceConverter', 'CodeLanguageTagFixer', 'ProductionCodeValidator'} <= sources
+
+    def test_inputs_pump_repeats(self):
+        inputs = adversarial_inputs(r'while.*retries?', 0, 100)
+        assert inputs['repeat(whilea)'].startswith('whileawhilea')
+        assert inputs['pump(a)'] == 'while' + 'a' * 95 + '\x00'
+
+    def test_flags_catastrophic_and_quadratic_patterns(self):
+        audits = audit_patterns([
+            PatternSource('linear', r'\bapi\b', 0),
+            PatternSource('quadratic', r'while.*retries?', 0),
+            PatternSource('exponential', r'(a+)+$', 0),
+        ], budget=0.2)
+        assert [(a.source, a.status) for a in audits] == [
+            ('exponential', 'timeout'), ('quadratic', 'superlinear'), ('linear', 'ok')]
+
+    def test_invalid_pattern_is_flagged(self):
+        audit = audit_pattern(PatternSource('broken', r'(unclosed', 0))
+        assert audit.flagged and audit.status == 'invalid' and audit.error
@@ -0,0 +1,187 @@
+"""
+Tests for token-budgeted chunking of AI analysis input
+"""
+
+import json
+import re
+import threading
+from types import SimpleNamespace
+
+import yaml
+
+from utils.chunking import chunk_document, dedupe_issues, estimate_tokens
+from analyzers import RepositoryManager
+from analyzers.semantic_analyzer import SemanticAnalyzer
+from doc_analyzer import DocumentationAnalyzer
+
+
+def make_doc(sections: int = 12, paragraph_words: int = 120) -> str:
+    paragraph = ' '.join(['word'] * paragraph_words)
+    parts = ['---', 'title: Long page', '---', '']
+    for i in range(sections):
+        parts += [f'## Section {i}', '', paragraph, '', '```python', 'x = 1', '', 'y = 2', '```', '']
+    return '\n'.join(parts)
+
+
+class TestChunkDocument:
+    """chunk_document splits at boundaries and keeps line offsets"""
+
+    def test_small_document_is_single_chunk(self):
+        chunks = chunk_document('# Title\n\nShort body.', max_tokens=1000)
+        assert len(chunks) == 1
+        assert (chunks[0].start_line, chunks[0].end_line) == (1, 3)
+
+    def test_chunks_cover_every_line_in_order(self):
+        content = make_doc()
+        chunks = chunk_document(content, max_tokens=300)
+        lines = content.split('\n')
+
+        assert len(chunks) > 1
+        assert chunks[0].start_line == 1
+        assert chunks[-1].end_line == len(lines)
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.start_line == previous.end_line + 1
+        for chunk in chunks:
+            assert chunk.text == '\n'.join(lines[chunk.start_line - 1:chunk.end_line])
+            assert chunk.tokens <= 300
+
+    def test_never_splits_inside_code_fence(self):
+        chunks = chunk_document(make_doc(), max_tokens=200)
+        for chunk in chunks:
+            assert chunk.text.count('```') % 2 == 0
+
+    def test_oversized_block_is_split_by_line(self):
+        content = '\n'.join(['long line of text ' * 5] * 200)
+        chunks = chunk_document(content, max_tokens=250)
+        assert len(chunks) > 1
+        assert all(chunk.tokens <= 250 for chunk in chunks)
+
+    def test_line_offset_and_mapping(self):
+        chunks = chunk_document(make_doc(), max_tokens=300, line_offset=10)
+        second = chunks[1]
+        assert chunks[0].start_line == 11
+        assert second.to_file_line(1) == second.start_line
+        target = second.text.split('\n')[2]
+        if target.strip():
+            assert second.find_line(target) == second.start_line + 2
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens('a' * 400) == 101
+
+
+class TestDedupe:
+    def test_dedupe_preserves_first(self):
+        a = SimpleNamespace(file_path='f', line_number=3, issue_type='t', context='X')
+        b = SimpleNamespace(file_path='f', line_number=3, issue_type='t', context='x ')
+        c = SimpleNamespace(file_path='f', line_number=4, issue_type='t', context='x')
+        assert dedupe_issues([a, b, c]) == [a, c]
+
+
+class FakeMessages:
+    """Records prompts and answers with one issue quoting the chunk's last non-empty line"""
+
+    def __init__(self):
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def create(self, model, max_tokens, messages, system=None):
+        prompt = messages[0]['content']
+        with self.lock:
+            self.prompts.append(prompt)
+        content = prompt.split('Content:\n', 1)[1]
+        quoted = [line for line in content.split('\n') if line.startswith('## ')][-1]
+        body = json.dumps([{'line_number': 1, 'quoted_text': quoted, 'issue_type': 'unclear_heading'}])
+        return SimpleNamespace(content=[SimpleNamespace(text=body)])
+
+
+class TestChunkedClarity:
+    def test_whole_file_is_analyzed_and_lines_map_back(self):
+        analyzer = SemanticAnalyzer({'gap_detection': {'semantic_analysis': {'enabled': False}}})
+        analyzer.claude_client = SimpleNamespace(messages=FakeMessages())
+        analyzer.enabled = True
+        analyzer.chunk_tokens = 300
+
+        content = make_doc()
+        issues = []
+        analyzer.analyze_clarity('page.mdx', content, issues)
+
+        prompts = analyzer.claude_client.messages.prompts
+        assert len(prompts) > 1
+        assert any('## Section 11' in prompt for prompt in prompts)
+
+        lines = content.split('\n')
+        for issue in issues:
+            assert lines[issue.line_number - 1] == issue.context
+
+
+class PackedFakeMessages:
+    """Answers each <file> section with one issue quoting its heading"""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def create(self, model, max_tokens, messages, system=None):
+        prompt = messages[0]['content']
+        with self.lock:
+            self.calls.append((prompt, max_tokens))
+        sections = re.findall(r'<file path="([^"]+)">\n(.*?)\n</file>', prompt, re.DOTALL)
+        body = [
+            {'file': path, 'line_number': 3, 'quoted_text': text.split('\n')[2], 'issue_type': 'unclear_heading'}
+            for path, text in sections
+        ]
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(body))])
+
+
+class TestRequestPacking:
+    def setup_method(self):
+        self.analyzer = SemanticAnalyzer({'gap_detection': {'semantic_analysis': {'enabled': False}}})
+        self.analyzer.claude_client = SimpleNamespace(messages=PackedFakeMessages())
+        self.analyzer.enabled = True
+        self.analyzer.pack_small_files = True
+        self.analyzer.pack_tokens = 200
+        self.analyzer.pack_file_tokens = 100
+
+    def test_small_files_share_requests_and_demultiplex(self):
+        files = [(f'page{i}.mdx', f'# Page {i}\n\n## Heading {i}\n\nShort body.') for i in range(10)]
+        issues = []
+        self.analyzer.analyze_clarity_batch(files, issues)
+
+        calls = self.analyzer.claude_client.messages.calls
+        assert len(calls) < len(files)
+        assert all(prompt.count('<file path=') > 1 for prompt, _ in calls)
+
+        by_file = {issue.file_path: issue for issue in issues}
+        assert sorted(by_file) == sorted(path for path, _ in files)
+        for i in range(10):
+            issue = by_file[f'page{i}.mdx']
+            assert issue.line_number == 3
+            assert issue.context == f'## Heading {i}'
+
+    def test_large_files_and_disabled_packing_use_single_requests(self):
+        self.analyzer.pack_small_files = False
+        self.analyzer.claude_client = SimpleNamespace(messages=FakeMessages())
+        files = [(f'page{i}.mdx', f'# Page {i}\n\n## Heading {i}\n\nShort body.') for i in range(3)]
+        issues = []
+        self.analyzer.analyze_clarity_batch(files, issues)
+
+        assert len(self.analyzer.claude_client.messages.prompts) == 3
+        assert {issue.file_path for issue in issues} == {path for path, _ in files}
+
+    def test_analyzer_queues_only_packable_files(self, tmp_path):
+        (tmp_path / 'small.mdx').write_text('# Small\n\n## Heading\n\nShort body.\n')
+        (tmp_path / 'large.mdx').write_text(make_doc(sections=4))
+        with open('config.yaml', 'r') as f:
+            config = yaml.safe_load(f)
+        config['repository']['path'] = str(tmp_path)
+        config['gap_detection']['semantic_analysis'] = {'enabled': False}
+        analyzer = DocumentationAnalyzer(RepositoryManager(config), config)
+        analyzer.semantic_analyzer = self.analyzer
+        self.analyzer.claude_client = SimpleNamespace(messages=FakeMessages())
+
+        for name in ('small.mdx', 'large.mdx'):
+            analyzer.analyze_file(tmp_path / name)
+
+        # The large file was analyzed right away instead of waiting for phase 2
+        assert [path for path, _ in analyzer._clarity_queue] == ['small.mdx']
+        assert len(self.analyzer.claude_client.messages.prompts) == 1
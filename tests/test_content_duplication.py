@@ -0,0 +1,247 @@
+"""
+Tests for content duplication detection
+"""
+
+import random
+
+import pytest
+
+from analyzers.content_duplication import ContentDuplicationDetector
+from bench.corpus import CorpusSpec, generate_corpus
+from utils import hashed_embeddings
+from utils.hashed_embeddings import HashedEmbedder, similar_pairs
+from utils.signature_index import MIN_CANDIDATE_PROBABILITY, SignatureIndex, bands_for
+
+BOILERPLATE = ("Set your API key in the ANTHROPIC_API_KEY environment variable before running any "
+               "of the examples on this page.")
+TUTORIAL = ("Hooks let you run your own shell commands when the agent uses a tool, so you can "
+            "format files, block edits or log every command it runs.")
+OTHER = ("Billing is monthly and every invoice lists the usage for each workspace in your "
+         "organization, including the models and the number of tokens.")
+
+
+def _detector():
+    return ContentDuplicationDetector({'duplication_detection': {'enabled': True}})
+
+
+def _at_lines(file_paragraphs):
+    """Number each file's paragraphs as if separated by blank lines (lines 1, 3, 5...)"""
+    return {path: [(2 * i + 1, text) for i, text in enumerate(texts)] for path, texts in file_paragraphs.items()}
+
+
+def _copies(issue):
+    """file:line of every copy, as listed in the issue's suggestion"""
+    return issue.suggestion.split(': ', 1)[1].split(', ')
+
+
+class TestExactDuplicates:
+    def test_paragraphs_keep_their_first_line(self):
+        content = f"# Title\n\n{BOILERPLATE}\n\nShort.\n\n\n  {TUTORIAL}\ncontinued\n"
+        assert ContentDuplicationDetector.extract_paragraphs(content) == [
+            (3, BOILERPLATE), (8, TUTORIAL + '\ncontinued')]
+
+    def test_identical_paragraphs_form_one_cluster(self):
+        file_paragraphs = {
+            'a.mdx': [BOILERPLATE, TUTORIAL],
+            'b.mdx': [BOILERPLATE.upper(), OTHER],
+            'c.mdx': [BOILERPLATE.replace(' ', '\n  '), BOILERPLATE],
+        }
+
+        clusters = _detector().find_exact_duplicates(_at_lines(file_paragraphs))
+
+        assert [c.paragraph for c in clusters] == [BOILERPLATE, TUTORIAL, OTHER]
+        assert clusters[0].files == ['a.mdx', 'b.mdx', 'c.mdx']
+        assert clusters[0].occurrences == 4
+        assert clusters[0].locations == [('a.mdx', 1), ('b.mdx', 1), ('c.mdx', 1), ('c.mdx', 3)]
+        assert [c.files for c in clusters[1:]] == [['a.mdx'], ['b.mdx']]
+
+    def test_repeats_within_one_file_are_not_reported(self):
+        issues = []
+        _detector().find_duplicates_in(_at_lines({'a.mdx': [TUTORIAL, TUTORIAL], 'b.mdx': [OTHER]}), issues)
+        assert issues == []
+
+
+class TestDuplicateComponents:
+    def test_one_issue_per_cluster_and_no_fuzzy_work_on_copies(self, monkeypatch):
+        detector = _detector()
+        compared = []
+        original = detector._calculate_similarity
+        monkeypatch.setattr(detector, '_calculate_similarity',
+                            lambda a, b: compared.append((a, b)) or original(a, b))
+        file_paragraphs = {f'page-{i}.mdx': [BOILERPLATE] for i in range(40)}
+        file_paragraphs['page-0.mdx'].append(TUTORIAL)
+        file_paragraphs['page-1.mdx'].append(TUTORIAL.replace('log every', 'record each'))
+        issues = []
+
+        detector.find_duplicates_in(_at_lines(file_paragraphs), issues)
+
+        assert issues[0].description == 'Identical paragraph in 40 files (40 copies)'
+        assert (issues[1].file_path, issues[1].line_number) == ('page-0.mdx', 3)
+        assert _copies(issues[1]) == ['page-0.mdx:3', 'page-1.mdx:3']
+        assert issues[1].description.startswith('Highly similar content in 2 files (2 paragraphs, ')
+        assert len(issues) == 2
+        # One copy of the shared paragraph against the two others, plus the tutorial pair
+        assert len(compared) == 3
+
+    @pytest.mark.parametrize('indexed', [False, True])
+    def test_shared_paragraph_is_compared_within_its_files(self, tmp_path, indexed):
+        # TUTORIAL is in a and b; its near-copy only in a, so the b <-> a match must still be found
+        settings = {'enabled': True, 'index_path': str(tmp_path / 'index.json')} if indexed else {'enabled': True}
+        variant = TUTORIAL.replace('log every', 'record each')
+        issues = []
+
+        ContentDuplicationDetector({'duplication_detection': settings}).find_duplicates_in(
+            _at_lines({'a.mdx': [TUTORIAL, variant], 'b.mdx': [TUTORIAL, OTHER]}), issues)
+
+        assert [_copies(i) for i in issues] == [['a.mdx:1', 'a.mdx:3', 'b.mdx:1']]
+        assert issues[0].description.startswith('Highly similar content in 2 files (3 paragraphs, ')
+
+    def test_similar_pairs_are_merged_transitively(self):
+        variants = [TUTORIAL,
+                    TUTORIAL.replace('log every', 'record each'),
+                    TUTORIAL.replace('log every', 'record each').replace('block edits', 'stop edits')]
+        file_paragraphs = {f'{name}.mdx': [text] for name, text in zip('abc', variants)}
+        file_paragraphs['d.mdx'] = [variants[0], OTHER]
+        issues = []
+
+        _detector().find_duplicates_in(_at_lines(file_paragraphs), issues)
+
+        assert len(issues) == 1
+        assert issues[0].file_path == 'a.mdx'
+        assert _copies(issues[0]) == ['a.mdx:1', 'b.mdx:1', 'c.mdx:1', 'd.mdx:1']
+        assert 'in 4 files (4 paragraphs' in issues[0].description
+        assert issues[0].context == TUTORIAL[:100] + '...'
+
+
+REWORDED = ("With hooks, your own shell commands run whenever the agent calls a tool: you can "
+            "format files, stop edits, or log each command it executes.")
+
+
+class TestRewordedDuplicates:
+    def _detector(self):
+        return ContentDuplicationDetector({'duplication_detection': {
+            'enabled': True, 'semantic': {'enabled': True, 'block_size': 2}}})
+
+    def test_embeddings_join_reworded_paragraphs(self):
+        pytest.importorskip('numpy')
+        issues = []
+
+        self._detector().find_duplicates_in(
+            _at_lines({'a.mdx': [TUTORIAL, OTHER], 'b.mdx': [REWORDED], 'c.mdx': [BOILERPLATE]}), issues)
+
+        assert [(_copies(i), i.description.split(' content')[0]) for i in issues] == [
+            (['a.mdx:1', 'b.mdx:1'], 'Reworded duplicate')]
+
+    def test_shared_paragraph_pairs_with_rewording_in_its_own_file(self):
+        pytest.importorskip('numpy')
+        issues = []
+
+        self._detector().find_duplicates_in(_at_lines({'a.mdx': [TUTORIAL, REWORDED], 'b.mdx': [TUTORIAL]}), issues)
+
+        assert [(_copies(i), i.description.split(' content')[0]) for i in issues] == [
+            (['a.mdx:1', 'a.mdx:3', 'b.mdx:1'], 'Reworded duplicate')]
+
+    def test_same_file_rows_are_never_paired(self):
+        np = pytest.importorskip('numpy')
+        vectors = HashedEmbedder().embed([TUTORIAL, REWORDED, OTHER])
+        assert {(i, j) for i, j, _ in similar_pairs(vectors, 0.3, block_size=2)} == {(0, 1), (1, 0)}
+        assert list(similar_pairs(vectors, 0.3, groups=np.array([0, 0, 1]))) == []
+
+    def test_skipped_without_numpy(self, monkeypatch, capsys):
+        monkeypatch.setattr(hashed_embeddings, 'NUMPY_AVAILABLE', False)
+        issues = []
+        self._detector().find_duplicates_in(_at_lines({'a.mdx': [TUTORIAL], 'b.mdx': [REWORDED]}), issues)
+        assert issues == []
+        assert 'needs numpy' in capsys.readouterr().out
+
+
+class TestSignatureIndex:
+    def _detector(self, path):
+        return ContentDuplicationDetector({'duplication_detection': {'enabled': True, 'index_path': str(path)}})
+
+    def _docs(self):
+        return _at_lines({
+            'a.mdx': [BOILERPLATE, TUTORIAL],
+            'b.mdx': [TUTORIAL.replace('log every', 'record each'), OTHER],
+            'c.mdx': [BOILERPLATE],
+        })
+
+    def test_matches_exhaustive_comparison(self, tmp_path):
+        indexed, exhaustive = [], []
+        self._detector(tmp_path / 'index.json').find_duplicates_in(self._docs(), indexed)
+        _detector().find_duplicates_in(self._docs(), exhaustive)
+        assert [i.to_dict() for i in indexed] == [i.to_dict() for i in exhaustive]
+
+    def test_later_runs_only_sign_changed_paragraphs(self, tmp_path, monkeypatch):
+        path = tmp_path / 'index.json'
+        first = []
+        self._detector(path).find_duplicates_in(self._docs(), first)
+
+        signed = []
+        original = SignatureIndex.signature
+        monkeypatch.setattr(SignatureIndex, 'signature', lambda self, text: signed.append(text) or original(self, text))
+        docs = self._docs()
+        docs['c.mdx'] = [(1, BOILERPLATE), (3, OTHER.replace('monthly', 'quarterly'))]
+        second = []
+        self._detector(path).find_duplicates_in(docs, second)
+
+        assert signed == [OTHER.replace('monthly', 'quarterly')]
+        assert [_copies(i) for i in second] == [['a.mdx:1', 'c.mdx:1'], ['a.mdx:3', 'b.mdx:1'], ['b.mdx:3', 'c.mdx:3']]
+
+    def test_removed_paragraphs_leave_the_index(self, tmp_path):
+        path = tmp_path / 'index.json'
+        self._detector(path).find_duplicates_in(self._docs(), [])
+        docs = self._docs()
+        del docs['b.mdx']
+        issues = []
+        self._detector(path).find_duplicates_in(docs, issues)
+
+        index = SignatureIndex.load(path)
+        assert len(index.signatures) == 2 and index.matches == {}
+        assert list(index.files) == ['a.mdx', 'c.mdx']
+        assert [_copies(i) for i in issues] == [['a.mdx:1', 'c.mdx:1']]
+
+    def test_index_with_other_settings_is_rebuilt(self, tmp_path):
+        path = tmp_path / 'index.json'
+        SignatureIndex(threshold=0.5).save(path)
+        assert SignatureIndex.load_or_new(path, threshold=0.8).settings == (64, 32, 0.8)
+        assert SignatureIndex.load_or_new(path, threshold=0.5).settings == (64, 64, 0.5)
+
+    @pytest.mark.parametrize('threshold', [0.6, 0.8, 0.9])
+    def test_bands_make_pairs_at_the_threshold_candidates(self, threshold):
+        bands = bands_for(threshold)
+        floor = threshold - 0.5
+        assert 1 - (1 - floor ** (64 // bands)) ** bands >= MIN_CANDIDATE_PROBABILITY
+
+    def test_unchanged_files_do_not_rewrite_the_index(self, tmp_path, monkeypatch):
+        path = tmp_path / 'index.json'
+        self._detector(path).find_duplicates_in(self._docs(), [])
+        saved = []
+        monkeypatch.setattr(SignatureIndex, 'save', lambda self, path: saved.append(path))
+        issues = []
+        self._detector(path).find_duplicates_in(self._docs(), issues)
+        assert saved == []
+        assert [_copies(i) for i in issues] == [['a.mdx:1', 'c.mdx:1'], ['a.mdx:3', 'b.mdx:1']]
+
+    def test_bench_corpus_matches_exhaustive_comparison(self, tmp_path):
+        files = generate_corpus(tmp_path / 'docs', CorpusSpec(pages=8, lines_per_page=40, duplicate_rate=0.3))
+        file_paragraphs = {path.name: ContentDuplicationDetector.extract_paragraphs(path.read_text())
+                           for path in files}
+        # Copies with scattered word edits, the near-duplicates LSH can miss
+        rng = random.Random(0)
+        texts = sorted({p for paragraphs in file_paragraphs.values() for _, p in paragraphs})
+        vocabulary = [word for p in texts for word in p.split()]
+        edited = []
+        for paragraph in rng.sample(texts, 20):
+            words = paragraph.split()
+            for _ in range(len(words) // 8):
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            edited.append(' '.join(words))
+        file_paragraphs.update(_at_lines({'edited.mdx': edited}))
+
+        indexed, exhaustive = [], []
+        self._detector(tmp_path / 'index.json').find_duplicates_in(file_paragraphs, indexed)
+        _detector().find_duplicates_in(file_paragraphs, exhaustive)
+
+        assert sum('edited.mdx' in i.suggestion for i in exhaustive) >= 5
+        assert [i.to_dict() for i in indexed] == [i.to_dict() for i in exhaustive]
@@ -0,0 +1,51 @@
+"""
+Tests for mmap-backed file ingestion
+"""
+
+import pytest
+
+from core.documents import DocumentStore, SourceFile, read_text
+
+CONTENT = 'héllo\r\nwörld\n\n# Heading\nlast'
+
+
+@pytest.fixture(params=[1, 1 << 20], ids=['mapped', 'read'])
+def source(request, tmp_path):
+    path = tmp_path / 'page.mdx'
+    path.write_bytes(CONTENT.encode('utf-8'))
+    with SourceFile(path, mmap_threshold=request.param) as source:
+        yield source
+
+
+class TestSourceFile:
+    def test_text_matches_text_mode_read(self, source, tmp_path):
+        with open(tmp_path / 'page.mdx', 'r', encoding='utf-8') as f:
+            expected = f.read()
+        assert source.text == expected
+        assert source.char_count(chunk_size=3) == len(expected)
+
+    def test_lines_without_decoding_everything(self, source):
+        assert source.line_count == 5
+        assert [source.line(n) for n in range(1, 6)] == ['héllo', 'wörld', '', '# Heading', 'last']
+        start = source.line_offsets[3]
+        assert bytes(source.byte_slice(start, start + 9)) == b'# Heading'
+        with pytest.raises(IndexError):
+            source.line(6)
+
+    def test_mapped_only_above_threshold(self, tmp_path):
+        path = tmp_path / 'empty.mdx'
+        path.write_text('')
+        with SourceFile(path, mmap_threshold=0) as empty:
+            assert not empty.mapped and empty.text == '' and empty.line_count == 1
+
+    def test_errors_match_open(self, tmp_path):
+        (tmp_path / 'bad.mdx').write_bytes(b'\xff\xfe bad')
+        with pytest.raises(UnicodeDecodeError):
+            read_text(tmp_path / 'bad.mdx')
+        with pytest.raises(OSError):
+            read_text(tmp_path / 'missing.mdx')
+
+        store = DocumentStore()
+        store.load([tmp_path / 'bad.mdx'])
+        with pytest.raises(UnicodeDecodeError):
+            store.read(tmp_path / 'bad.mdx')
@@ -0,0 +1,62 @@
+"""
+Tests for fixer prefilters (required substrings and document features)
+"""
+
+from pathlib import Path
+
+from core.config import Config
+from core.documents import DocumentFeatures, DocumentStore
+from doc_fixer import DocFixer
+from fixers.code_blocks import CodeBlockFixer
+from fixers.heading_hierarchy import HeadingHierarchyFixer
+from fixers.production_code_validator import ProductionCodeValidator
+from fixers.urls import URLFixer
+
+EXAMPLES = Path(__file__).parent.parent / 'examples'
+PROSE = '---\ntitle: Page\ndescription: A page\n---\n\nJust prose, no markup.\n'
+CODE = PROSE + '\n```python\nclient.messages.create(model="m")\n```\n\nSee [docs](/en/docs/intro).\n'
+
+
+class TestPrefilters:
+    def test_features_of_content(self):
+        assert DocumentFeatures.of(PROSE) == DocumentFeatures(False, False, False, False)
+        features = DocumentFeatures.of('| a |\n![diagram](d.png)\n' + CODE)
+        assert all(getattr(features, name) for name in DocumentFeatures.names())
+
+    def test_applies_to(self):
+        config = Config()
+        prose, code = DocumentFeatures.of(PROSE), DocumentFeatures.of(CODE)
+        assert not CodeBlockFixer(config).applies_to(PROSE, prose)
+        assert CodeBlockFixer(config).applies_to(CODE, code)
+        assert not URLFixer(config).applies_to(PROSE, prose)
+        # Features and substrings must both hold
+        validator = ProductionCodeValidator(config)
+        assert validator.applies_to(CODE, code)
+        assert not validator.applies_to('```bash\nls\n```\n', DocumentFeatures.of('```bash\nls\n```\n'))
+
+    def test_skipped_fixers_find_nothing(self):
+        config = Config()
+        fixers = [CodeBlockFixer(config), URLFixer(config), HeadingHierarchyFixer(config),
+                  ProductionCodeValidator(config)]
+        for path in EXAMPLES.rglob('*.md*'):
+            content = path.read_text(encoding='utf-8')
+            features = DocumentFeatures.of(content)
+            for fixer in fixers:
+                if not fixer.applies_to(content, features):
+                    assert fixer.check_file(str(path), content) == [], (fixer.name, path)
+
+
+class TestDocFixerPrefilters:
+    def test_counts_skips_per_fixer(self, tmp_path):
+        (tmp_path / 'prose.mdx').write_text(PROSE)
+        (tmp_path / 'code.mdx').write_text(CODE)
+        fixer = DocFixer(enable_style_guide=False)
+        fixer.documents = DocumentStore()
+
+        fixer.process_directory(tmp_path, dry_run=True, backup=False)
+
+        skips = fixer.stats.prefilter_skips
+        assert skips[URLFixer(fixer.config).name] == 1
+        assert skips[CodeBlockFixer(fixer.config).name] == 1
+        assert fixer.stats.to_dict()['prefilter_skips'] == skips
+        assert 'Skipped by prefilters' in fixer.stats.summary()
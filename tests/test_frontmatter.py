@@ -0,0 +1,80 @@
+"""
+Tests for the shared frontmatter parser
+"""
+
+import pytest
+import yaml
+
+from analyzers.mdx_parser import MDXParser
+from utils import frontmatter
+from utils.frontmatter import parse_yaml, read_frontmatter
+from utils.text_utils import extract_frontmatter
+
+SAMPLES = [
+    'title: Getting started\ndescription: "Install the CLI: step by step"',
+    "title: 'Quoted'\nicon: rocket\n\nsidebarTitle: Start  ",
+    'title: Use "hooks" [beta] & more\nmode: wide',
+    'draft: yes\npublished: off\nempty:\nnothing: null',
+    'on: x\nversion: 2\nratio: .5\ndate: 2024-01-01',
+    'title: Tips #1\nnote: a # comment',
+    'title: Ends with colon:\nkey:value: x',
+    'tags:\n  - a\n  - b\nnested:\n  key: value',
+    'title: "Escaped \\"quote\\""\nother: \'It\'\'s\'',
+    'title: x\ntitle: y',
+    '# only a comment',
+    'url: https://example.com/path\nicon: /images/icon.svg',
+]
+
+
+def _load(parse, text):
+    try:
+        return parse(text)
+    except yaml.YAMLError:
+        return 'invalid'
+
+
+class TestParseYaml:
+    @pytest.mark.parametrize('text', SAMPLES)
+    def test_matches_safe_load(self, text):
+        assert _load(parse_yaml, text) == _load(yaml.safe_load, text)
+
+    def test_flat_frontmatter_skips_yaml(self, monkeypatch):
+        def no_yaml(*args, **kwargs):
+            raise AssertionError('YAML loader called for flat frontmatter')
+        monkeypatch.setattr(frontmatter.yaml, 'load', no_yaml)
+        assert parse_yaml('title: Flat page\nicon: "star"') == {'title': 'Flat page', 'icon': 'star'}
+
+    def test_results_are_cached_but_not_shared(self):
+        text = 'title: Cached\ntags: [a, b]'
+        hits, _ = frontmatter.cache_info()
+        first = parse_yaml(text)
+        first['tags'].append('c')
+        assert parse_yaml(text) == {'title': 'Cached', 'tags': ['a', 'b']}
+        assert frontmatter.cache_info()[0] > hits
+
+    def test_invalid_yaml_raises(self):
+        with pytest.raises(yaml.YAMLError):
+            parse_yaml('title: [unclosed')
+
+
+class TestReadFrontmatter:
+    def test_body_offset_and_lines(self):
+        content = '---\ntitle: Page\n---\n# Heading\n'
+        block = read_frontmatter(content)
+        assert block.data == {'title': 'Page'}
+        assert block.body(content) == '# Heading\n'
+        assert block.lines == 3
+
+    def test_missing_or_invalid_block(self):
+        assert read_frontmatter('# No frontmatter') is None
+        assert read_frontmatter('---\ntitle: [unclosed\n---\nBody') is None
+
+    def test_block_at_end_of_file(self):
+        assert read_frontmatter('---\ntitle: Only\n---').data == {'title': 'Only'}
+
+    def test_callers_agree(self):
+        content = '---\ntitle: Page\ndescription: "A --- dash"\n---\nBody text\n'
+        assert extract_frontmatter(content) == (
+            {'title': 'Page', 'description': 'A --- dash'}, 'Body text\n', 4)
+        assert MDXParser.parse_frontmatter(content) == (
+            {'title': 'Page', 'description': 'A --- dash'}, 'Body text\n')
@@ -0,0 +1,122 @@
+"""
+Tests for the positional inverted index and topic coverage search
+"""
+
+import pytest
+
+from scripts.check_topic_coverage import TopicCoverageChecker
+from utils import inverted_index
+from utils.inverted_index import InvertedIndex, query_tokens
+
+DOCS = {
+    'a.mdx': "# Hooks\n\nConfigure hooks in settings.\nA PreToolUse hook runs first.",
+    'b.mdx': "Run the command line tool.\n\nThe command-line flags are listed below.",
+}
+
+
+@pytest.fixture
+def always_persist(monkeypatch):
+    """Save indexes however fast they build (the test documents index in microseconds)"""
+    monkeypatch.setattr(inverted_index, 'PERSIST_MIN_SECONDS', 0)
+
+
+class TestInvertedIndex:
+    def test_postings_record_position_line_and_offset(self):
+        index = InvertedIndex()
+        index.update(DOCS)
+
+        content = DOCS['a.mdx']
+        assert index.occurrences('hooks', 'a.mdx') == [(0, 1, 2), (2, 3, content.index('hooks in'))]
+        assert index.documents_with('command') == {'b.mdx'}
+
+    def test_phrase_and_prefix_queries(self):
+        index = InvertedIndex()
+        index.update(DOCS)
+
+        phrase = index.phrase(query_tokens('command line'))
+        assert list(phrase) == ['b.mdx']
+        assert [line for _, line, _ in phrase['b.mdx']] == [1, 3]
+        assert index.phrase(query_tokens('line command')) == {}
+
+        assert index.words('hook') == ['hook', 'hooks']
+        assert set(index.phrase(['configure', 'hook'], prefix=True)) == {'a.mdx'}
+        assert index.phrase(['configure', 'hook']) == {}
+
+    def test_remove_drops_only_the_documents_words(self):
+        index = InvertedIndex()
+        index.update(DOCS)
+        index.remove('a.mdx')
+        assert 'a.mdx' not in index.document_words
+        assert 'hooks' not in index.postings
+        assert index.documents_with('the') == {'b.mdx'}
+
+    def test_fast_builds_are_not_saved(self, tmp_path):
+        path = tmp_path / 'index'
+        InvertedIndex.load_or_build(path, DOCS)
+        assert not path.exists()
+
+    def test_saved_index_only_reindexes_changed_documents(self, tmp_path, always_persist):
+        path = tmp_path / 'index'
+        index, indexed = InvertedIndex.load_or_build(path, DOCS)
+        assert indexed == 2 and path.exists()
+
+        index, indexed = InvertedIndex.load_or_build(path, DOCS)
+        assert indexed == 0
+        assert index.phrase(['command', 'line']).keys() == {'b.mdx'}
+        assert index.occurrences('hooks', 'a.mdx') == [(0, 1, 2), (2, 3, DOCS['a.mdx'].index('hooks in'))]
+
+        index, indexed = InvertedIndex.load_or_build(path, {'a.mdx': "Command line only."})
+        assert indexed == 2
+        assert index.hashes.keys() == {'a.mdx'}
+        assert index.documents_with('hooks') == set()
+        assert index.phrase(['command', 'line']).keys() == {'a.mdx'}
+
+    @pytest.mark.parametrize('saved', ['{"format": "something else"}\n', '{"format": "inverted_index/1"', '[]\n'])
+    def test_unreadable_index_is_rebuilt(self, tmp_path, saved):
+        path = tmp_path / 'index'
+        path.write_text(saved)
+        index, indexed = InvertedIndex.load_or_build(path, DOCS)
+        assert indexed == 2 and index.documents_with('hooks') == {'a.mdx'}
+
+
+class TestTopicSearch:
+    def test_match_strategies(self, tmp_path):
+        for name, content in DOCS.items():
+            (tmp_path / name).write_text(content)
+        checker = TopicCoverageChecker(str(tmp_path), index_path=tmp_path / 'index.json')
+
+        exact = checker.search_topic('PreToolUse hook')
+        assert exact['confidence'] == 'high'
+        assert exact['matches'][0]['match_type'] == 'exact'
+        assert exact['matches'][0]['line_number'] == 4
+
+        assert checker.search_topic('configure Hooks')['matches'][0]['match_type'] == 'case_insensitive'
+
+        # Same words, different separator
+        match_types = {m['file']: m['match_type'] for m in checker.search_topic('command line')['matches']}
+        assert match_types == {'b.mdx': 'exact'}
+        separated = checker.search_topic('command line flags')['matches'][0]
+        assert (separated['match_type'], separated['line_number']) == ('word_boundary', 3)
+
+        assert not checker.search_topic('billing')['found']
+
+    def test_punctuated_topics_fall_back_to_substring_scan(self, tmp_path):
+        (tmp_path / 'a.mdx').write_text("# Runtimes\n\nWorks with .NET and C++ builds.\nUse x++ to increment.")
+        (tmp_path / 'b.mdx').write_text("Our .net guide.")
+        checker = TopicCoverageChecker(str(tmp_path))
+
+        def found(topic):
+            return {m['file']: (m['match_type'], m['line_number']) for m in checker.search_topic(topic)['matches']}
+
+        assert found('.NET') == {'a.mdx': ('exact', 3), 'b.mdx': ('case_insensitive', 1)}
+        assert found('C++') == {'a.mdx': ('exact', 3)}
+        assert found('c++') == {'a.mdx': ('case_insensitive', 3)}
+        assert found('++') == {'a.mdx': ('exact', 3)}
+        assert not checker.search_topic('F#')['found']
+
+    def test_reuses_saved_index(self, tmp_path, capsys, always_persist):
+        for name, content in DOCS.items():
+            (tmp_path / name).write_text(content)
+        TopicCoverageChecker(str(tmp_path), index_path=tmp_path / 'index')
+        TopicCoverageChecker(str(tmp_path), index_path=tmp_path / 'index')
+        assert capsys.readouterr().out.splitlines()[-1] == 'Loaded 2 documentation files (0 indexed)'
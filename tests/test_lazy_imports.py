@@ -0,0 +1,58 @@
+"""
+Tests for the fixer registry and lazy loading of heavy dependencies
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import fixers
+from fixers import FIXERS, enabled_fixers, load_fixer_class
+from fixers.base import BaseFixer
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+class TestFixerRegistry:
+    def test_every_registered_fixer_loads(self):
+        for spec in FIXERS:
+            fixer_class = load_fixer_class(spec.name)
+            assert fixer_class.__name__ == spec.name
+            assert issubclass(fixer_class, BaseFixer)
+            assert getattr(fixers, spec.name) is fixer_class
+
+    def test_env_toggles_and_style_guide_switch(self, monkeypatch):
+        monkeypatch.setenv('ENABLE_CAPITALIZATION_FIXER', 'false')
+        monkeypatch.setenv('ENABLE_BROKEN_LINK_DETECTOR', 'true')
+        names = [spec.name for spec in enabled_fixers(enable_style_guide=False)]
+
+        assert 'CapitalizationFixer' not in names
+        assert 'BrokenLinkDetector' in names
+        assert 'StyleGuideValidationFixer' not in names
+        assert names[0] == 'FrontmatterFixer'
+
+
+class TestLazyImports:
+    def test_cli_modules_do_not_import_anthropic(self):
+        code = (
+            "import sys, doc_analyzer, doc_fixer; "
+            "doc_fixer.DocFixer(enable_style_guide=False); "
+            "print('anthropic' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True,
+                                env={**os.environ, 'ANTHROPIC_API_KEY': ''})
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == 'False'
+
+    def test_embeddings_module_does_not_import_numpy(self):
+        code = "import sys, utils.hashed_embeddings; print('numpy' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == 'False'
+
+    def test_cli_modules_do_not_import_numpy(self):
+        code = "import sys, doc_analyzer, doc_fixer, analyze_docs; print('numpy' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == 'False'
@@ -0,0 +1,189 @@
+"""
+Tests for the documentation language server
+"""
+
+import gc
+import io
+import os
+import weakref
+
+import pytest
+
+from lsp.diagnostics import DiagnosticsEngine
+from lsp.documents import TextDocument
+from lsp.protocol import JsonRpcConnection, encode_message, read_message
+from lsp.server import DocsLanguageServer
+from lsp.benchmark import build_page
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine over a generic repo with the default config and fixers"""
+    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yaml')
+    built = DiagnosticsEngine.from_config(config_path, tmp_path)
+    built.analyzer.repo_manager.repo_type = 'mintlify'
+    return built
+
+
+@pytest.fixture
+def restore_gc():
+    """Undo the heap freeze and GC threshold the server sets on initialize"""
+    threshold = gc.get_threshold()
+    yield
+    gc.unfreeze()
+    gc.set_threshold(*threshold)
+
+
+def full_run_keys(engine, document):
+    """Issues the batch analyzer would report for the line-local and document checks"""
+    analyzer = engine.analyzer
+    text = document.text
+    keys = []
+    for check in (analyzer.check_readability, analyzer.check_style_guide,
+                  analyzer.check_structure, analyzer.check_formatting):
+        keys += [(i.issue_type, i.line_number) for i in engine._collect(check, text, 'page.mdx')]
+    keys += [(i.issue_type, i.line_number) for i in engine._collect(analyzer.check_links, text, 'page.mdx', document.path)]
+    issues = []
+    analyzer.mintlify_validator.validate_internal_links('page.mdx', text, issues)
+    analyzer.mintlify_validator.validate_frontmatter('page.mdx', text, issues)
+    keys += [(i.issue_type, i.line_number) for i in issues]
+    return sorted(keys)
+
+
+class TestTextDocument:
+    """Incremental edits on open documents"""
+
+    def test_insert_and_delete_ranges(self):
+        document = TextDocument('file:///docs/page.mdx', 'one\ntwo\nthree')
+
+        span = document.apply_change({
+            'range': {'start': {'line': 1, 'character': 3}, 'end': {'line': 1, 'character': 3}},
+            'text': '\nnew',
+        })
+        assert document.lines == ['one', 'two', 'new', 'three']
+        assert span == (1, 2, 2)
+
+        document.apply_change({
+            'range': {'start': {'line': 0, 'character': 1}, 'end': {'line': 2, 'character': 1}},
+            'text': '',
+        })
+        assert document.lines == ['oew', 'three']
+
+    def test_utf16_positions(self):
+        document = TextDocument('file:///docs/page.mdx', 'a😀b')
+        # The emoji is two UTF-16 code units, so 'b' starts at character 3
+        document.apply_change({
+            'range': {'start': {'line': 0, 'character': 3}, 'end': {'line': 0, 'character': 4}},
+            'text': 'c',
+        })
+        assert document.text == 'a😀c'
+
+
+class TestDiagnosticsEngine:
+    """Fast-lane results must match a full batch run after any edit sequence"""
+
+    def test_incremental_matches_full_run(self, engine, tmp_path):
+        document = TextDocument((tmp_path / 'page.mdx').as_uri(), build_page(120))
+        state = engine.open(document)
+        state.relative_path = 'page.mdx'
+
+        edits = [
+            # Type into a prose line
+            {'range': {'start': {'line': 6, 'character': 0}, 'end': {'line': 6, 'character': 0}},
+             'text': 'Basically '},
+            # Delete an opening fence, flipping code block state for the rest of the page
+            {'range': {'start': {'line': 11, 'character': 0}, 'end': {'line': 12, 'character': 0}},
+             'text': ''},
+            # Insert a skipped heading level
+            {'range': {'start': {'line': 30, 'character': 0}, 'end': {'line': 30, 'character': 0}},
+             'text': '#### Deep heading\n'},
+        ]
+
+        for change in edits:
+            engine.apply_changes(state, [change])
+            engine.run_fast(state)
+            incremental = sorted((i.issue_type, i.line_number) for i in state.fast_issues)
+            assert incremental == full_run_keys(engine, document)
+
+    def test_slow_issues_shift_with_edits(self, engine, tmp_path):
+        document = TextDocument((tmp_path / 'page.mdx').as_uri(), build_page(60))
+        state = engine.open(document)
+        lines_before = {id(issue): issue.line_number for issue, _ in state.slow_issues if issue.line_number}
+        assert lines_before
+
+        engine.apply_changes(state, [{
+            'range': {'start': {'line': 0, 'character': 0}, 'end': {'line': 0, 'character': 0}},
+            'text': '\n\n',
+        }])
+
+        for issue, _ in state.slow_issues:
+            if id(issue) in lines_before and lines_before[id(issue)] > 1:
+                assert issue.line_number == lines_before[id(issue)] + 2
+
+    def test_code_action_applies_fixer(self, engine, tmp_path):
+        text = '---\ntitle: Page\ndescription: A page that needs a language tag\n---\n\n```\nprint("hi")\n```\n'
+        document = TextDocument((tmp_path / 'page.mdx').as_uri(), text)
+        state = engine.open(document)
+
+        actions = engine.code_actions(state, {'start': {'line': 0, 'character': 0},
+                                              'end': {'line': 10, 'character': 0}})
+        new_texts = [a['edit']['changes'][document.uri][0]['newText'] for a in actions]
+        assert any('```python' in new_text for new_text in new_texts)
+
+
+class TestProtocol:
+    """JSON-RPC framing and server dispatch"""
+
+    def test_round_trip(self):
+        message = {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}}
+        assert read_message(io.BytesIO(encode_message(message))) == message
+
+    def test_open_publishes_diagnostics(self, engine, tmp_path, restore_gc):
+        output = io.BytesIO()
+        server = DocsLanguageServer(JsonRpcConnection(output), engine_factory=lambda root: engine)
+        uri = (tmp_path / 'page.mdx').as_uri()
+
+        server.handle({'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}})
+        server.handle({'method': 'textDocument/didOpen', 'params': {'textDocument': {
+            'uri': uri, 'version': 1, 'text': 'You can simply do it.\n'}}})
+
+        stream = io.BytesIO(output.getvalue())
+        initialize_response = read_message(stream)
+        published = read_message(stream)
+
+        assert initialize_response['result']['capabilities']['textDocumentSync']['change'] == 2
+        assert published['method'] == 'textDocument/publishDiagnostics'
+        assert any(d['code'] == 'weak_language' for d in published['params']['diagnostics'])
+
+    def test_messages_before_initialize(self, engine, tmp_path, restore_gc):
+        output = io.BytesIO()
+        server = DocsLanguageServer(JsonRpcConnection(output), engine_factory=lambda root: engine)
+        uri = (tmp_path / 'page.mdx').as_uri()
+
+        server.handle({'method': 'textDocument/didOpen', 'params': {'textDocument': {
+            'uri': uri, 'version': 1, 'text': 'You can simply do it.\n'}}})
+        server.handle({'method': 'textDocument/didChange', 'params': {
+            'textDocument': {'uri': uri, 'version': 2}, 'contentChanges': [{'text': 'Just do it.\n'}]}})
+        server.handle({'id': 1, 'method': 'textDocument/codeAction', 'params': {
+            'textDocument': {'uri': uri}, 'range': {}}})
+
+        response = read_message(io.BytesIO(output.getvalue()))
+        assert response['id'] == 1 and response['error']['code'] == -32002
+        assert server.documents == {} and server.timers == {}
+
+    def test_closed_documents_are_collectable(self, engine, tmp_path, restore_gc):
+        server = DocsLanguageServer(JsonRpcConnection(io.BytesIO()), engine_factory=lambda root: engine)
+        uri = (tmp_path / 'page.mdx').as_uri()
+        server.handle({'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}})
+        frozen = gc.get_freeze_count()
+
+        server.handle({'method': 'textDocument/didOpen', 'params': {'textDocument': {
+            'uri': uri, 'version': 1, 'text': build_page(40)}}})
+        server._run_slow(uri)
+        state = weakref.ref(server.documents[uri])
+        server.handle({'method': 'textDocument/didClose', 'params': {'textDocument': {'uri': uri}}})
+        gc.collect()
+
+        # Only the start-up heap is frozen; documents are not
+        assert gc.get_freeze_count() <= frozen
+        assert state() is None
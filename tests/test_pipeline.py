@@ -0,0 +1,71 @@
+"""
+Tests for the single-process pipeline of analyze_docs.py
+"""
+
+import argparse
+import json
+
+import pytest
+
+from analyze_docs import run_concurrently, run_in_process
+from bench.corpus import CorpusSpec, generate_corpus
+from core.documents import DocumentStore
+
+
+def _args(docs_dir, **overrides):
+    args = dict(docs_path=str(docs_dir), repo_url=None, repo_type='mintlify', repo_root=None,
+                config=None, format='json', no_ai=True, profile=False, apply_fixes=False,
+                skip_analysis=False, skip_fixes=False, in_process=True)
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+class TestDocumentStore:
+    def test_reads_each_file_once(self, tmp_path):
+        page = tmp_path / 'page.mdx'
+        page.write_text('original', encoding='utf-8')
+        documents = DocumentStore()
+        documents.load([page])
+
+        page.write_text('changed', encoding='utf-8')
+        assert documents.read(page) == 'original'
+        assert page in documents and len(documents) == 1
+
+    def test_read_errors_are_raised_on_read(self, tmp_path):
+        documents = DocumentStore()
+        documents.load([tmp_path / 'missing.mdx'])
+        with pytest.raises(OSError):
+            documents.read(tmp_path / 'missing.mdx')
+
+
+class TestPipeline:
+    def test_run_concurrently_captures_both_stages(self):
+        shared = {'value': 'built before the fork'}
+
+        def first():
+            print(shared['value'])
+
+        def second():
+            print('second stage')
+            raise RuntimeError('boom')
+
+        (first_ok, first_output), (second_ok, second_output) = run_concurrently(first, second)
+        assert first_ok and 'built before the fork' in first_output
+        assert not second_ok and 'boom' in second_output
+
+    def test_in_process_writes_both_reports(self, tmp_path, monkeypatch):
+        docs = tmp_path / 'docs'
+        generate_corpus(docs, CorpusSpec(pages=12))
+        # Fork-based concurrency is used on multi-core machines only; force it here
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        (tmp_path / 'out').mkdir()
+
+        assert run_in_process(_args(docs), tmp_path / 'out')
+
+        analysis = json.loads((tmp_path / 'out' / 'doc_analysis_report.json').read_text())
+        fixes = json.loads((tmp_path / 'out' / 'doc_fix_report.json').read_text())
+        assert analysis['summary']['total_files'] == 12
+        assert fixes['summary']['total_files'] == 12
+        assert fixes['summary']['mode'] == 'dry_run'
+        # A preview leaves the docs untouched
+        assert not any(docs.rglob('.doc_fixer_backups'))
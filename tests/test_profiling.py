@@ -0,0 +1,40 @@
+"""
+Tests for per-check timing instrumentation
+"""
+
+from utils.profiling import Profiler
+
+
+class TestProfiler:
+    def test_aggregates_totals_maxima_and_issue_counts(self):
+        profiler = Profiler()
+        profiler.add('check', 'check_links', 5.0, 'a.mdx', 1)
+        profiler.add('check', 'check_links', 9.0, 'b.mdx', 2)
+        profiler.add('check', 'check_structure', 1.0, 'a.mdx')
+
+        rows = profiler.rows()
+        assert [row['name'] for row in rows] == ['check_links', 'check_structure']
+        links = rows[0]
+        assert links['calls'] == 2
+        assert links['total_ms'] == 14.0
+        assert links['max_file'] == 'b.mdx'
+        assert links['issues'] == 3
+
+    def test_measure_counts_issues_appended(self):
+        profiler = Profiler()
+        issues = ['existing']
+        with profiler.measure('analyzer', 'validate', 'a.mdx', issues):
+            issues.extend(['x', 'y'])
+        with profiler.measure('fixer.check_file', 'Fixer', 'a.mdx') as span:
+            span.issues = 4
+
+        by_name = {row['name']: row for row in profiler.rows()}
+        assert by_name['validate']['issues'] == 2
+        assert by_name['Fixer']['issues'] == 4
+        assert 'validate' in profiler.format_table()
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = Profiler(enabled=False)
+        with profiler.measure('check', 'noop'):
+            pass
+        assert profiler.rows() == []
@@ -0,0 +1,74 @@
+"""
+Tests for cached instruction prefixes in AI prompts
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from analyzers.semantic_analyzer import CLARITY_SYSTEM_PROMPT, SemanticAnalyzer
+from fixers.style_guide_validator import STYLE_GUIDE_SYSTEM_PROMPT
+from utils.prompt_cache import PromptCacheStats, cached_system_prompt, min_cacheable_tokens
+
+
+class RecordingMessages:
+    """Records request kwargs and reports a cache read after the first call"""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        first = len(self.requests) == 1
+        usage = SimpleNamespace(
+            input_tokens=50,
+            cache_creation_input_tokens=1200 if first else 0,
+            cache_read_input_tokens=0 if first else 1200,
+        )
+        return SimpleNamespace(content=[SimpleNamespace(text='[]')], usage=usage)
+
+
+class TestPromptCache:
+    def test_system_prefix_is_marked_for_caching(self):
+        text = 'instructions ' * 400  # ~1300 tokens
+        blocks = cached_system_prompt(text, 'claude-sonnet-4-5-20250929')
+        assert blocks == [{'type': 'text', 'text': text, 'cache_control': {'type': 'ephemeral'}}]
+
+    @pytest.mark.parametrize('prompt', [CLARITY_SYSTEM_PROMPT, STYLE_GUIDE_SYSTEM_PROMPT])
+    def test_real_prompts_are_cached_at_default_model(self, prompt, capsys):
+        blocks = cached_system_prompt(prompt, 'claude-sonnet-4-5-20250929')
+        assert blocks[0]['cache_control'] == {'type': 'ephemeral'}
+        assert 'cache minimum' not in capsys.readouterr().out
+
+    def test_short_prefix_is_sent_unmarked_with_one_warning(self, capsys):
+        text = 'instructions ' * 400
+        model = 'claude-3-5-haiku-20241022'
+        assert min_cacheable_tokens(model) == 2048
+        assert cached_system_prompt(text, model) == [{'type': 'text', 'text': text}]
+        cached_system_prompt(text, model)
+        assert capsys.readouterr().out.count('cache minimum') == 1
+
+    def test_clarity_requests_share_prefix_and_record_usage(self):
+        analyzer = SemanticAnalyzer({'gap_detection': {'semantic_analysis': {'enabled': False}}})
+        analyzer.claude_client = SimpleNamespace(messages=RecordingMessages())
+        analyzer.enabled = True
+
+        for name in ('a.mdx', 'b.mdx'):
+            analyzer.analyze_clarity(name, f'# {name}\n\nBody text.', [])
+
+        requests = analyzer.claude_client.messages.requests
+        assert requests[0]['system'] == requests[1]['system']
+        assert requests[0]['system'][0]['text'] == CLARITY_SYSTEM_PROMPT
+        # The per-file message carries only the content, not the instructions
+        assert 'research-backed principles' not in requests[0]['messages'][0]['content']
+
+        stats = analyzer.cache_stats.to_dict()
+        assert stats['requests'] == 2
+        assert stats['cache_creation_input_tokens'] == 1200
+        assert stats['cache_read_input_tokens'] == 1200
+
+    def test_stats_ignore_responses_without_usage(self):
+        stats = PromptCacheStats()
+        stats.record(SimpleNamespace())
+        assert stats.requests == 0
+        assert stats.hit_rate == 0.0
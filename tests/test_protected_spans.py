@@ -0,0 +1,64 @@
+"""
+Tests for the protected-span interval maps used by the fixers
+"""
+
+import random
+
+from core.config import Config
+from core.models import Issue
+from fixers.terminology import TerminologyFixer
+from utils.protected_spans import SpanMap, inline_code_spans, protected_spans, url_spans
+
+
+class TestSpanMap:
+    def test_merges_and_looks_up(self):
+        spans = SpanMap([(10, 12), (0, 3), (2, 5), (12, 14), (20, 20)])
+        assert list(spans) == [(0, 5), (10, 14)]
+        assert [p for p in range(16) if p in spans] == [0, 1, 2, 3, 4, 10, 11, 12, 13]
+        assert spans.overlaps(4, 6) and spans.overlaps(6, 11) and not spans.overlaps(5, 10)
+        assert not SpanMap() and 3 not in SpanMap()
+
+    def test_segments_rejoin_to_text(self):
+        text = 'ab[cd](ef)gh'
+        segments = SpanMap([(7, 9)]).segments(text)
+        assert segments == [('ab[cd](', False), ('ef', True), (')gh', False)]
+        assert ''.join(segment for segment, _ in segments) == text
+        assert SpanMap().segments('') == [('', False)]
+        assert SpanMap([(0, 2)]).segments('ab') == [('ab', True)]
+
+    def test_inline_code_matches_backtick_parity(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            line = ''.join(rng.choice('ab `') for _ in range(rng.randrange(0, 30)))
+            code = inline_code_spans(line)
+            for position in range(len(line) + 1):
+                assert (position in code) == (line[:position].count('`') % 2 == 1), (line, position)
+
+
+class TestUrlSpans:
+    def test_link_targets_hrefs_and_bare_urls(self):
+        line = 'See [the docs](/en/docs/api) or <a href="/api/sdk">SDK</a> at https://example.com/api.'
+        protected = [line[start:end] for start, end in url_spans(line)]
+        assert protected == ['/en/docs/api', '/api/sdk', 'https://example.com/api.']
+
+    def test_protected_spans_combines_code_and_urls(self):
+        line = 'Use `claude api` or [claude api](/claude-api) with the claude api'
+        spans = protected_spans(line)
+        assert line.index('claude api') in spans
+        assert line.index('/claude-api') in spans
+        assert line.rindex('claude api') not in spans
+        assert not protected_spans('plain prose without markup')
+
+
+class TestTerminologyFixerMasking:
+    def test_replaces_outside_link_targets_only(self):
+        content = ('Utilize\x00the [utilize guide](https://docs.example.com/utilize) or '
+                   '<a href="/utilize">utilize</a>, see https://example.com/utilize.')
+        issues = [Issue('medium', 'consistency', 'page.mdx', 1, 'deprecated_terminology', 'd',
+                        "Replace 'utilize' with 'use'", auto_fixable=True)]
+        result = TerminologyFixer(Config()).fix('page.mdx', content, issues)
+
+        assert result.fixed_content == (
+            'use\x00the [use guide](https://docs.example.com/utilize) or '
+            '<a href="/utilize">use</a>, see https://example.com/utilize.')
+        assert result.fixes_applied == ["Replaced 'utilize' with 'use'"]
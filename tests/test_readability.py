@@ -0,0 +1,117 @@
+"""
+Tests for corpus-wide readability scoring
+"""
+
+import pytest
+
+from analyzers import readability
+from analyzers.readability import (
+    ReadabilityAnalyzer,
+    ReadabilityScores,
+    _percentile,
+    count_syllables,
+    prose_paragraphs,
+    scan_file,
+    score_paragraphs,
+)
+
+EASY = "The cat sat on the mat. It was a good day. We went out to play in the sun. " * 2
+HARD = ("Comprehensive authentication configuration necessitates understanding "
+        "organizational infrastructure considerations, particularly regarding "
+        "administrative authorization hierarchies and interoperability requirements "
+        "across heterogeneous deployment environments.")
+
+
+class TestScoring:
+    def test_count_syllables(self):
+        assert count_syllables('the') == 1
+        assert count_syllables('table') == 2
+        assert count_syllables('documentation') == 5
+        assert count_syllables('2024') == 1
+
+    def test_only_prose_paragraphs_are_scored(self):
+        content = (
+            "---\ntitle: \"Page\"\n---\n\n"
+            "# Heading\n\n"
+            "First line of prose\ncontinues here with a [link](/x).\n\n"
+            "```python\nprint('code is skipped')\n```\n\n"
+            "- list items are skipped\n\n"
+            "<Note>Components are skipped</Note>\n"
+        )
+        assert prose_paragraphs(content) == [(7, "First line of prose continues here with a link.")]
+
+    def test_score_paragraphs_counts(self):
+        (line, words, sentences, syllables), = score_paragraphs(EASY, min_words=5)
+        assert line == 1
+        assert (words, sentences) == (38, 6)
+        assert syllables == 38
+        assert score_paragraphs(EASY, min_words=100) == []
+
+    def test_scan_matches_score_paragraphs(self):
+        content = "---\ntitle: x\n---\n\n" + EASY + "\n\n```\ncode\n```\n\n" + HARD
+        assert scan_file(content, min_words=5).paragraphs == score_paragraphs(content, min_words=5)
+
+    def test_long_sentences_are_reported_at_their_first_line(self):
+        content = ("Intro line one.\n"
+                   "Short one. This sentence starts here and\n"
+                   "wraps onto a third line before it ends.\n\n"
+                   + ' '.join(['many'] * 12) + " words.")
+        scan = scan_file(content, max_sentence_words=10)
+        assert [(line, words) for line, words, _ in scan.long_sentences] == [(2, 13), (5, 13)]
+
+    def test_line_checks(self):
+        content = "# Simply a heading\n" + "x" * 120 + "\nJust do it\n```\nsimply code\n```\nhttp://" + "y" * 120
+        scan = scan_file(content, max_line_length=100, avoid_terms=('simply', 'just'))
+        assert [line for line, _ in scan.long_lines] == [2]
+        assert scan.weak_terms == [(3, 'just', 'Just do it')]
+
+
+class TestReadabilityScores:
+    def test_percentile_matches_linear_interpolation(self):
+        assert _percentile([1, 2, 3, 4], 50) == 2.5
+        assert _percentile([10, 0, 5], 100) == 10
+        assert _percentile([], 90) == 0.0
+
+    def test_same_scores_with_and_without_numpy(self, monkeypatch):
+        counts = {'a.mdx': [(1, 30, 2, 45), (5, 20, 4, 26)], 'b.mdx': [(3, 40, 1, 80)]}
+        monkeypatch.setattr(readability, 'VECTORIZE_MIN_PARAGRAPHS', 0)
+        first = ReadabilityScores(counts)
+        monkeypatch.setattr(readability, 'NUMPY_AVAILABLE', False)
+        second = ReadabilityScores(counts)
+
+        assert first.locations == second.locations == [('a.mdx', 1), ('a.mdx', 5), ('b.mdx', 3)]
+        assert [float(v) for v in first.grade_level] == pytest.approx(second.grade_level)
+        assert first.percentile('grade_level', 90) == pytest.approx(second.percentile('grade_level', 90))
+        assert first.above('grade_level', 10) == second.above('grade_level', 10) == [2]
+
+
+class TestReadabilityAnalyzer:
+    def test_flags_only_hard_outliers(self):
+        analyzer = ReadabilityAnalyzer({'readability': {'min_paragraph_words': 5, 'grade_percentile': 90}})
+        file_counts = {f'easy-{i}.mdx': analyzer.score(EASY) for i in range(9)}
+        file_counts['hard.mdx'] = analyzer.score(HARD)
+        issues = []
+
+        summary = analyzer.analyze(file_counts, issues)
+
+        assert [(issue.file_path, issue.issue_type) for issue in issues] == [('hard.mdx', 'hard_to_read')]
+        assert summary['paragraphs'] == 10
+
+    def test_grade_floor_keeps_easy_sets_quiet(self):
+        analyzer = ReadabilityAnalyzer({'readability': {'min_paragraph_words': 5}})
+        issues = []
+        analyzer.analyze({f'easy-{i}.mdx': analyzer.score(EASY) for i in range(20)}, issues)
+        assert issues == []
+
+    def test_score_reuses_the_last_scan(self, monkeypatch):
+        analyzer = ReadabilityAnalyzer({'readability': {'min_paragraph_words': 5}})
+        calls = []
+        monkeypatch.setattr(readability, 'scan_file', lambda *args: calls.append(args) or readability.ReadabilityScan())
+        analyzer.scan(EASY)
+        analyzer.score(EASY)
+        assert len(calls) == 1
+
+    def test_disabled(self):
+        analyzer = ReadabilityAnalyzer({'readability': {'enabled': False}})
+        assert analyzer.score(HARD) == []
+        assert analyzer.analyze({'a.mdx': [(1, 30, 1, 60)]}, []) == {}
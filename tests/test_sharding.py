@@ -0,0 +1,119 @@
+"""
+Tests for sharded analysis and the deterministic partial merge
+"""
+
+import json
+
+import pytest
+import yaml
+
+from analyzers import RepositoryManager
+from bench.corpus import CorpusSpec, generate_corpus
+from doc_analyzer import DocumentationAnalyzer, merge_partials
+from doc_fixer import merge_fix_reports
+from utils.sharding import check_complete, parse_shard, select_shard, shard_of
+
+
+def _config(docs_dir):
+    with open('config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    config['repository']['path'] = str(docs_dir)
+    config['repository']['type'] = 'mintlify'
+    config['analysis']['enable_ai_analysis'] = False
+    config['gap_detection']['semantic_analysis'] = {'enabled': False}
+    config['duplication_detection']['enabled'] = True
+    return config
+
+
+def _analyzer(config, shard=None):
+    repo_manager = RepositoryManager(config)
+    repo_manager.platform_config = repo_manager.load_platform_config()
+    analyzer = DocumentationAnalyzer(repo_manager, config)
+    analyzer.shard = shard
+    return analyzer
+
+
+class TestShardSpec:
+    def test_parse_shard(self):
+        assert parse_shard('2/4') == (2, 4)
+        for bad in ('0/4', '5/4', '2', 'a/b', '1/0'):
+            with pytest.raises(ValueError):
+                parse_shard(bad)
+
+    def test_assignment_is_stable_and_partitions_files(self, tmp_path):
+        files = [tmp_path / f'section/page-{i}.mdx' for i in range(50)]
+        shards = [select_shard(files, tmp_path, index, 3) for index in (1, 2, 3)]
+
+        assert sorted(f for shard in shards for f in shard) == sorted(files)
+        assert shard_of('section/page-7.mdx', 3) == shard_of('section/page-7.mdx', 3)
+
+    def test_check_complete(self):
+        check_complete([(2, 2), (1, 2)])
+        with pytest.raises(ValueError):
+            check_complete([(1, 2)])
+        with pytest.raises(ValueError):
+            check_complete([(1, 2), (1, 2)])
+        with pytest.raises(ValueError):
+            check_complete([(1, 2), (2, 3)])
+
+
+class TestAnalyzerMerge:
+    def test_merged_shards_match_single_run(self, tmp_path):
+        docs = tmp_path / 'docs'
+        generate_corpus(docs, CorpusSpec(pages=8, lines_per_page=40, duplicate_rate=0.5))
+
+        single = _analyzer(_config(docs))
+        single.analyze_all()
+
+        partials = []
+        for index in (1, 2, 3):
+            shard = _analyzer(_config(docs), shard=(index, 3))
+            shard.analyze_all()
+            partials.append(shard.export_partial(str(tmp_path)))
+
+        merged = merge_partials(partials, _config(docs))
+
+        assert merged.report.total_files == single.report.total_files
+        assert [i.to_dict() for i in merged.report.issues] == [i.to_dict() for i in single.report.issues]
+        assert merged.report.recommendations == single.report.recommendations
+        assert any(i.issue_type == 'duplicate_content' for i in merged.report.issues)
+
+    def test_merge_rejects_incomplete_partials(self, tmp_path):
+        docs = tmp_path / 'docs'
+        generate_corpus(docs, CorpusSpec(pages=4, lines_per_page=30))
+        shard = _analyzer(_config(docs), shard=(1, 2))
+        shard.analyze_all()
+        partial = shard.export_partial(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            merge_partials([partial], _config(docs))
+
+
+class TestFixReportMerge:
+    def _report(self, path, index, fixes, mode='dry_run'):
+        data = {
+            'timestamp': '', 'repository': {'path': 'docs', 'type': 'local', 'shard': {'index': index, 'count': 2}},
+            'summary': {'total_files': 2, 'files_modified': 1, 'total_fixes': len(fixes),
+                        'fixes_by_type': {fix: 1 for fix in fixes}, 'errors': [], 'mode': mode},
+            'fixes': [{'file': file, 'type': fix, 'description': fix, 'applied': False} for file, fix in fixes.items()],
+            'recommendations': [], 'profile': {'total_ms': 0, 'checks': []},
+        }
+        path.write_text(json.dumps(data))
+        return path
+
+    def test_merge_orders_fixes_by_file_and_sums_counts(self, tmp_path):
+        first = self._report(tmp_path / 'a.json', 1, {'b/page.mdx': 'fix b'})
+        second = self._report(tmp_path / 'b.json', 2, {'a/page.mdx': 'fix a'})
+
+        report, stats = merge_fix_reports([second, first])
+
+        assert [fix['file'] for fix in report.fixes] == ['a/page.mdx', 'b/page.mdx']
+        assert report.summary['total_files'] == 4
+        assert stats.total_fixes_applied == 2
+        assert 'shard' not in report.repository
+
+    def test_merge_rejects_mixed_modes(self, tmp_path):
+        first = self._report(tmp_path / 'a.json', 1, {}, mode='dry_run')
+        second = self._report(tmp_path / 'b.json', 2, {}, mode='applied')
+        with pytest.raises(ValueError):
+            merge_fix_reports([first, second])
@@ -0,0 +1,77 @@
+"""
+Tests for the sparse term-document matrix and its users
+"""
+
+from analyzers import RepositoryManager
+from doc_analyzer import DocumentationAnalyzer
+from scripts.check_topic_coverage import TopicCoverageChecker
+from utils.term_matrix import PhraseCounter, TermDocumentMatrix, normalize_term, tokenize
+
+
+class TestPhraseCounter:
+    def test_tokens_keep_inner_hyphens_and_dots(self):
+        assert tokenize("The command-line A.P.I. isn't") == ['the', 'command-line', 'a.p.i', "isn't"]
+        assert normalize_term('Claude  Code') == 'claude code'
+
+    def test_counts_words_and_phrases_on_token_boundaries(self):
+        counter = PhraseCounter(['api', 'command line', 'command-line', 'claude code', 'set up the cli'])
+        counts = counter.count_text(
+            "Rapid API work: the command-line tool, the command line. "
+            "Claude Code, claude codes and CLAUDE CODE. Set up the CLI."
+        )
+        assert counts == {'api': 1, 'command-line': 1, 'command line': 1, 'claude code': 2, 'set up the cli': 1}
+
+
+class TestTermDocumentMatrix:
+    def test_rows_columns_and_reductions(self):
+        matrix = TermDocumentMatrix.from_counts(
+            {'a.mdx': {'api': 2, 'cli': 1}, 'b.mdx': {'api': 1}, 'c.mdx': {}},
+            terms=['api', 'cli', 'sdk'])
+
+        assert matrix.shape == (3, 3) and matrix.nnz == 3
+        assert matrix.row('api') == {'a.mdx': 2, 'b.mdx': 1}
+        assert matrix.document_frequency('api') == 2
+        assert matrix.total('api') == 3
+        assert matrix.documents_with('sdk') == [] and matrix.document_frequency('unknown') == 0
+        assert matrix.column('a.mdx') == {'api': 2, 'cli': 1}
+        assert matrix.column('c.mdx') == {}
+
+
+class TestConsistencyAnalysis:
+    def test_reports_terms_with_more_than_two_variants(self, tmp_path):
+        (tmp_path / 'doc1.mdx').write_text("Use the CLI to access features.")
+        (tmp_path / 'doc2.mdx').write_text("The command-line interface is powerful.")
+        (tmp_path / 'doc3.mdx').write_text("Try the command line tools.")
+        (tmp_path / 'doc4.mdx').write_text("Log in first.")
+        config = {
+            'repository': {'path': str(tmp_path), 'type': 'generic'},
+            'analysis': {'enable_ai_analysis': False},
+            'gap_detection': {'semantic_analysis': {'enabled': False}},
+            'duplication_detection': {'enabled': False},
+            'consistency': {'term_variants': {
+                'cli': {'canonical': 'CLI', 'variants': ['cli', 'command-line', 'command line']},
+                'login': {'canonical': 'log in', 'variants': ['login', 'log-in']},
+            }},
+        }
+        repo_manager = RepositoryManager(config)
+        repo_manager.repo_type = 'generic'
+        analyzer = DocumentationAnalyzer(repo_manager, config)
+
+        analyzer.analyze_consistency(sorted(tmp_path.glob('*.mdx')))
+
+        issues = [i for i in analyzer.report.issues if i.issue_type == 'term_inconsistency']
+        assert [i.description for i in issues] == ['Inconsistent usage of "cli": 3 variants']
+        assert issues[0].context == 'cli (1 files), command-line (1 files), command line (1 files)'
+        assert analyzer.term_matrix.column('doc2.mdx') == {'command-line': 1}
+
+
+class TestTopicCoverage:
+    def test_related_terms_use_word_rows(self, tmp_path):
+        (tmp_path / 'hooks.mdx').write_text("Configure a hook for each tool event.")
+        (tmp_path / 'other.mdx').write_text("Unrelated page about billing.")
+        checker = TopicCoverageChecker(str(tmp_path))
+
+        result = checker.search_topic('tool hook configuration')
+
+        assert result['found'] and result['confidence'] == 'low'
+        assert [m['file'] for m in result['matches']] == ['hooks.mdx']
@@ -0,0 +1,79 @@
+"""
+Tests for per-check and per-file time budgets
+"""
+
+import re
+import threading
+import time
+
+import pytest
+import yaml
+
+from analyzers import RepositoryManager
+from doc_analyzer import DocumentationAnalyzer
+from utils.watchdog import CheckTimeout, Watchdog, finditer
+
+# Nested quantifier: exponential backtracking on a near-miss
+CATASTROPHIC = re.compile(r'(a+)+$')
+NEAR_MISS = 'a' * 40 + 'b'
+
+
+def _stall(*args):
+    return CATASTROPHIC.search(NEAR_MISS)
+
+
+class TestWatchdog:
+    def test_interrupts_backtracking_regex(self):
+        watchdog = Watchdog(check_seconds=0.2)
+        start = time.monotonic()
+        with pytest.raises(CheckTimeout) as info:
+            with watchdog.file('page.mdx'):
+                watchdog.call('stall', _stall)
+        assert time.monotonic() - start < 5
+        assert (info.value.check, info.value.seconds, info.value.scope) == ('stall', 0.2, 'check')
+
+    def test_file_budget_caps_checks(self):
+        watchdog = Watchdog(check_seconds=10, file_seconds=0.2)
+        with watchdog.file('page.mdx'):
+            assert watchdog.call('fast', len, 'abc') == 3
+            with pytest.raises(CheckTimeout) as info:
+                watchdog.call('stall', _stall)
+        assert info.value.scope == 'file'
+
+    def test_disabled_and_off_main_thread_calls_through(self):
+        assert Watchdog.from_config({'per_check': 0, 'per_file': 0}).call('fast', len, 'abc') == 3
+
+        results = []
+        watchdog = Watchdog(check_seconds=0.01)
+        thread = threading.Thread(target=lambda: results.append(watchdog.call('sleep', time.sleep, 0.05) or 'done'))
+        thread.start()
+        thread.join()
+        assert results == ['done']
+
+    def test_finditer_matches_re(self):
+        assert [m.group() for m in finditer(r'\bapi\b', 'API and api', re.IGNORECASE, timeout=1)] == ['API', 'api']
+
+
+class TestAnalyzerBudgets:
+    def test_stalled_check_becomes_issue(self, tmp_path, capsys):
+        (tmp_path / 'page.mdx').write_text('---\ntitle: Page\ndescription: A page\n---\n\n# Page\n\nText.\n')
+        with open('config.yaml', 'r') as f:
+            config = yaml.safe_load(f)
+        config['repository']['path'] = str(tmp_path)
+        config['analysis']['enable_ai_analysis'] = False
+        config['analysis']['time_budgets'] = {'per_check': 0.2, 'per_file': 0}
+        config['gap_detection']['semantic_analysis'] = {'enabled': False}
+        analyzer = DocumentationAnalyzer(RepositoryManager(config), config)
+
+        def check_structure(content, file_path):
+            _stall()
+        analyzer.check_structure = check_structure
+
+        analyzer.analyze_file(tmp_path / 'page.mdx')
+        timeouts = [i for i in analyzer.report.issues if i.issue_type == 'check_timeout']
+        assert [(i.file_path, i.context) for i in timeouts] == [('page.mdx', 'check_structure')]
+        # Later checks still ran
+        assert any(row['name'] == 'check_links' for row in analyzer.profiler.rows())
+
+        analyzer._finish_report()
+        assert 'check_structure: 1 file' in capsys.readouterr().out
@@ -9,11 +9,45 @@ from .text_utils import (
     count_lines,
     find_line_number
 )
+from .frontmatter import (
+    Frontmatter,
+    read_frontmatter
+)
+from .chunking import (
+    Chunk,
+    chunk_document,
+    estimate_tokens,
+    dedupe_issues
+)
+from .prompt_cache import (
+    cached_system_prompt,
+    min_cacheable_tokens,
+    PromptCacheStats
+)
+from .ai_telemetry import (
+    AITelemetry,
+    AICallRecord,
+    load_ledger,
+    calibrate_from_ledger
+)
 
 __all__ = [
     'extract_frontmatter',
     'replace_frontmatter',
     'normalize_whitespace',
     'count_lines',
-    'find_line_number'
+    'find_line_number',
+    'Frontmatter',
+    'read_frontmatter',
+    'Chunk',
+    'chunk_document',
+    'estimate_tokens',
+    'dedupe_issues',
+    'cached_system_prompt',
+    'min_cacheable_tokens',
+    'PromptCacheStats',
+    'AITelemetry',
+    'AICallRecord',
+    'load_ledger',
+    'calibrate_from_ledger'
 ]
@@ -0,0 +1,274 @@
+"""
+Telemetry for Claude API calls
+
+Every messages.create call made by the analyzers and fixers is recorded with
+its wall time, token usage (including prompt cache reads/writes), retries and
+model. Records are aggregated per run into latency percentiles, a latency
+histogram and dollar totals, and appended to a cumulative JSONL cost ledger
+that estimate_cost.py uses to calibrate its estimates.
+"""
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .prompt_cache import PromptCacheStats
+
+# Claude API Pricing (as of Jan 2025)
+# https://www.anthropic.com/pricing
+PRICING = {
+    'claude-3-5-haiku-20241022': {
+        'input': 0.80 / 1_000_000,   # $0.80 per million input tokens
+        'output': 4.00 / 1_000_000,  # $4 per million output tokens
+    },
+    'claude-sonnet-4-5-20250929': {
+        'input': 3.00 / 1_000_000,   # $3 per million input tokens
+        'output': 15.00 / 1_000_000,  # $15 per million output tokens
+    },
+    'claude-3-5-sonnet-20241022': {
+        'input': 3.00 / 1_000_000,
+        'output': 15.00 / 1_000_000,
+    },
+    'claude-opus-4-20250514': {
+        'input': 15.00 / 1_000_000,
+        'output': 75.00 / 1_000_000,
+    }
+}
+
+DEFAULT_PRICING_MODEL = 'claude-sonnet-4-5-20250929'
+
+# Prompt cache writes cost 1.25x base input, reads 0.1x
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS = [250, 500, 1000, 2000, 5000, 10000, 20000, 60000]
+
+LEDGER_FILENAME = 'ai_cost_ledger.jsonl'
+
+
+def default_ledger_path() -> Path:
+    """Per-user ledger shared by every checkout: $XDG_DATA_HOME (or ~/.local/share)/docs_analyzer"""
+    data_home = os.getenv('XDG_DATA_HOME') or Path.home() / '.local' / 'share'
+    return Path(data_home) / 'docs_analyzer' / LEDGER_FILENAME
+
+
+def ledger_path() -> Path:
+    """Cost ledger location (AI_COST_LEDGER overrides the default)"""
+    return Path(os.getenv('AI_COST_LEDGER') or default_ledger_path())
+
+
+def call_cost(model: str, input_tokens: int, output_tokens: int,
+              cache_creation_input_tokens: int = 0, cache_read_input_tokens: int = 0) -> float:
+    """Dollar cost of one call (unknown models are priced as Sonnet)"""
+    pricing = PRICING.get(model, PRICING[DEFAULT_PRICING_MODEL])
+    input_cost = pricing['input'] * (
+        input_tokens
+        + cache_creation_input_tokens * CACHE_WRITE_MULTIPLIER
+        + cache_read_input_tokens * CACHE_READ_MULTIPLIER
+    )
+    return input_cost + pricing['output'] * output_tokens
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+@dataclass
+class AICallRecord:
+    """One messages.create call, including its retries"""
+    timestamp: str
+    component: str
+    model: str
+    status: str  # ok | rate_limited | error
+    wall_ms: float
+    retries: int
+    prompt_chars: int
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+class AITelemetry:
+    """Thread-safe per-run collector of AI call records"""
+
+    def __init__(self, component: str):
+        self.component = component
+        self.records: List[AICallRecord] = []
+        self.cache = PromptCacheStats()
+        self._lock = threading.Lock()
+        self._flushed = 0
+
+    def record(self, model: str, wall_ms: float, retries: int, prompt_chars: int,
+               response: Any = None, status: str = 'ok') -> AICallRecord:
+        """
+        Record one call
+
+        Args:
+            model: Model the request was sent to
+            wall_ms: Wall time including retries and backoff
+            retries: Number of retried attempts
+            prompt_chars: Characters sent (system prefix + user message)
+            response: messages.create response, if any
+            status: 'ok', 'rate_limited' or 'error'
+        """
+        usage = getattr(response, 'usage', None)
+        tokens = {
+            name: getattr(usage, name, 0) or 0
+            for name in ('input_tokens', 'output_tokens',
+                         'cache_creation_input_tokens', 'cache_read_input_tokens')
+        }
+        entry = AICallRecord(
+            timestamp=datetime.now().isoformat(),
+            component=self.component,
+            model=model,
+            status=status,
+            wall_ms=round(wall_ms, 1),
+            retries=retries,
+            prompt_chars=prompt_chars,
+            cost_usd=call_cost(model, **tokens),
+            **tokens
+        )
+        if response is not None:
+            self.cache.record(response)
+        with self._lock:
+            self.records.append(entry)
+        return entry
+
+    def merge_records(self, records: List[Dict[str, Any]]):
+        """
+        Adopt call records from another run (e.g. shard partials)
+
+        They count towards this run's totals but are not written to the
+        ledger again; the run that made the calls already did.
+        """
+        entries = [AICallRecord(**record) for record in records]
+        for entry in entries:
+            if entry.status == 'ok':
+                self.cache.add(entry.input_tokens, entry.cache_creation_input_tokens, entry.cache_read_input_tokens)
+        with self._lock:
+            self.records[:0] = entries
+            self._flushed += len(entries)
+
+    @property
+    def calls(self) -> int:
+        return len(self.records)
+
+    def latency_histogram(self) -> Dict[str, int]:
+        """Call counts per latency bucket, keyed by upper bound"""
+        counts = {f"<={bound}ms": 0 for bound in LATENCY_BUCKETS_MS}
+        counts[f">{LATENCY_BUCKETS_MS[-1]}ms"] = 0
+        for entry in self.records:
+            for bound in LATENCY_BUCKETS_MS:
+                if entry.wall_ms <= bound:
+                    counts[f"<={bound}ms"] += 1
+                    break
+            else:
+                counts[f">{LATENCY_BUCKETS_MS[-1]}ms"] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        latencies = [entry.wall_ms for entry in self.records]
+        return {
+            'calls': self.calls,
+            'failed_calls': sum(1 for entry in self.records if entry.status != 'ok'),
+            'retries': sum(entry.retries for entry in self.records),
+            'models': sorted({entry.model for entry in self.records}),
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50), 1),
+                'p95': round(percentile(latencies, 95), 1),
+                'max': round(max(latencies), 1) if latencies else 0.0,
+                'histogram': self.latency_histogram(),
+            },
+            'tokens': {
+                'input': sum(entry.input_tokens for entry in self.records),
+                'output': sum(entry.output_tokens for entry in self.records),
+                'cache_creation_input': sum(entry.cache_creation_input_tokens for entry in self.records),
+                'cache_read_input': sum(entry.cache_read_input_tokens for entry in self.records),
+            },
+            'cost_usd': round(sum(entry.cost_usd for entry in self.records), 6),
+            'prompt_cache': self.cache.to_dict(),
+        }
+
+    def summary(self) -> str:
+        data = self.to_dict()
+        return (f"💵 AI calls: {data['calls']} ({data['failed_calls']} failed, {data['retries']} retries), "
+                f"p50 {data['latency_ms']['p50']:.0f} ms, p95 {data['latency_ms']['p95']:.0f} ms, "
+                f"${data['cost_usd']:.4f}")
+
+    def write_ledger(self, path: Optional[Path] = None) -> Optional[Path]:
+        """Append records not yet written to the JSONL cost ledger"""
+        with self._lock:
+            pending = self.records[self._flushed:]
+            self._flushed = len(self.records)
+        if not pending:
+            return None
+
+        path = Path(path) if path else ledger_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                for entry in pending:
+                    f.write(json.dumps(asdict(entry)) + '\n')
+        except OSError as e:
+            print(f"⚠️  Could not write AI cost ledger {path}: {e}")
+            return None
+        return path
+
+
+def load_ledger(path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Read ledger records, skipping malformed lines"""
+    path = Path(path) if path else ledger_path()
+    if not path.exists():
+        return []
+
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def calibrate_from_ledger(records: List[Dict[str, Any]], component: Optional[str] = None) -> Optional[Dict[str, float]]:
+    """
+    Observed token ratios from past successful calls
+
+    Returns:
+        chars_per_token (prompt characters per billed input token, cached or
+        not), output_tokens_per_call and calls, or None without usable data
+    """
+    usable = [
+        r for r in records
+        if r.get('status') == 'ok' and r.get('prompt_chars')
+        and (component is None or r.get('component') == component)
+    ]
+    if not usable:
+        return None
+
+    prompt_chars = sum(r['prompt_chars'] for r in usable)
+    input_tokens = sum(
+        r.get('input_tokens', 0) + r.get('cache_creation_input_tokens', 0) + r.get('cache_read_input_tokens', 0)
+        for r in usable
+    )
+    if not input_tokens:
+        return None
+
+    return {
+        'calls': len(usable),
+        'chars_per_token': prompt_chars / input_tokens,
+        'output_tokens_per_call': sum(r.get('output_tokens', 0) for r in usable) / len(usable),
+    }
@@ -0,0 +1,168 @@
+"""
+Token-budgeted document chunking for AI analysis
+
+Splits a document at heading or paragraph boundaries (never inside a code
+fence) so each chunk fits within a token budget, and keeps the original line
+offsets so issues reported per chunk map back to file line numbers.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+HEADING_PATTERN = re.compile(r'^#{1,6}\s')
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimation: ~4 chars per token for English"""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class Chunk:
+    """A contiguous slice of a document"""
+    text: str
+    start_line: int  # 1-based line number of the first line in the file
+    end_line: int    # 1-based line number of the last line in the file
+    tokens: int
+
+    def to_file_line(self, chunk_line: Optional[int]) -> Optional[int]:
+        """Map a 1-based line number within the chunk to the file line number"""
+        if chunk_line is None:
+            return None
+        try:
+            chunk_line = int(chunk_line)
+        except (TypeError, ValueError):
+            return None
+        chunk_line = min(max(chunk_line, 1), self.end_line - self.start_line + 1)
+        return self.start_line + chunk_line - 1
+
+    def find_line(self, quoted_text: Optional[str]) -> Optional[int]:
+        """File line number of the first chunk line containing quoted_text"""
+        if not quoted_text:
+            return None
+        needle = quoted_text.strip()[:50]
+        if not needle:
+            return None
+        pos = self.text.find(needle)
+        if pos < 0:
+            return None
+        return self.start_line + self.text.count('\n', 0, pos)
+
+
+def _split_blocks(lines: List[str]) -> List[Tuple[int, int, bool]]:
+    """
+    Split lines into blocks at blank lines and headings
+
+    Returns:
+        List of (start_index, end_index_exclusive, starts_with_heading)
+    """
+    blocks = []
+    start = 0
+    in_code_block = False
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+
+        if HEADING_PATTERN.match(stripped) and i > start:
+            blocks.append((start, i, HEADING_PATTERN.match(lines[start].strip()) is not None))
+            start = i
+        elif not stripped:
+            blocks.append((start, i + 1, HEADING_PATTERN.match(lines[start].strip()) is not None))
+            start = i + 1
+
+    if start < len(lines):
+        blocks.append((start, len(lines), HEADING_PATTERN.match(lines[start].strip()) is not None))
+
+    return blocks
+
+
+def chunk_document(content: str, max_tokens: int, line_offset: int = 0) -> List[Chunk]:
+    """
+    Split content into chunks of at most max_tokens (estimated)
+
+    Blocks are packed greedily; once a chunk is at least half full, a new
+    heading starts a new chunk so sections stay together. Blocks larger than
+    the budget on their own (huge tables or code listings) are split by line.
+
+    Args:
+        content: Text to split
+        max_tokens: Token budget per chunk
+        line_offset: Number of lines preceding content in the file (for bodies
+                     extracted after frontmatter)
+
+    Returns:
+        List of chunks covering every line of content, in order
+    """
+    lines = content.split('\n')
+    if estimate_tokens(content) <= max_tokens:
+        return [Chunk(content, line_offset + 1, line_offset + len(lines), estimate_tokens(content))]
+
+    chunks = []
+    current_start = None
+    current_end = 0
+    current_tokens = 0
+
+    def flush():
+        nonlocal current_start, current_tokens
+        if current_start is not None:
+            text = '\n'.join(lines[current_start:current_end])
+            chunks.append(Chunk(text, line_offset + current_start + 1, line_offset + current_end, current_tokens))
+        current_start = None
+        current_tokens = 0
+
+    for start, end, is_heading in _split_blocks(lines):
+        block_tokens = sum(estimate_tokens(line) for line in lines[start:end])
+
+        if current_start is not None and (
+            current_tokens + block_tokens > max_tokens
+            or (is_heading and current_tokens >= max_tokens // 2)
+        ):
+            flush()
+
+        if block_tokens > max_tokens:
+            # Oversized block: split on line boundaries
+            for i in range(start, end):
+                line_tokens = estimate_tokens(lines[i])
+                if current_start is not None and current_tokens + line_tokens > max_tokens:
+                    flush()
+                if current_start is None:
+                    current_start = i
+                current_end = i + 1
+                current_tokens += line_tokens
+            continue
+
+        if current_start is None:
+            current_start = start
+        current_end = end
+        current_tokens += block_tokens
+
+    flush()
+    return chunks
+
+
+def dedupe_issues(issues: Iterable, key: Optional[Callable] = None) -> List:
+    """
+    Drop repeated issues while preserving order
+
+    Args:
+        issues: Issues merged from several chunks
+        key: Identity function (default: file, line, type and context)
+    """
+    if key is None:
+        key = lambda i: (i.file_path, i.line_number, i.issue_type, (i.context or '').strip().lower())
+
+    seen = set()
+    unique = []
+    for issue in issues:
+        identity = key(issue)
+        if identity in seen:
+            continue
+        seen.add(identity)
+        unique.append(issue)
+    return unique
@@ -0,0 +1,135 @@
+"""
+Frontmatter parsing shared by the analyzers and fixers
+
+Several checkers look at the same file's frontmatter in one run, so the
+YAML is parsed once per distinct frontmatter text and served from a
+cache afterwards. Flat `key: plain value` blocks (most MDX pages) are
+parsed without YAML at all; anything else goes through yaml.CSafeLoader
+when PyYAML was built with libyaml. The body is reported as an offset
+into the content so callers that only need the frontmatter don't copy it.
+"""
+
+import copy
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+import yaml
+
+# YAML frontmatter between --- delimiters at the start of the file
+_FRONTMATTER = re.compile(r'---\s*\n(.*?)\n---\s*(?:\n|\Z)', re.DOTALL)
+
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# One `key: value` line; anything fancier (nesting, lists, comments) goes to YAML
+_FLAT_LINE = re.compile(r'([A-Za-z_][\w-]*):(?: +(.*?))? *')
+_DOUBLE_QUOTED = re.compile(r'"([^"\\]*)"')
+_SINGLE_QUOTED = re.compile(r"'([^']*)'")
+
+# Plain words YAML 1.1 resolves to booleans or null
+_RESERVED = {
+    'yes', 'Yes', 'YES', 'no', 'No', 'NO', 'true', 'True', 'TRUE', 'false', 'False', 'FALSE',
+    'on', 'On', 'ON', 'off', 'Off', 'OFF', 'null', 'Null', 'NULL',
+}
+
+_INVALID = object()
+
+
+@dataclass(frozen=True)
+class Frontmatter:
+    """Parsed frontmatter block of one file"""
+    data: Any         # parsed YAML (usually a dict; None for an empty block)
+    body_start: int   # offset of the body in the content
+    lines: int        # lines taken by the block, delimiters included
+
+    def body(self, content: str) -> str:
+        return content[self.body_start:]
+
+
+def _flat_value(value: Optional[str]) -> Any:
+    """Value of a flat line as YAML would load it, or _INVALID if unsure"""
+    if not value:
+        return None
+    if not value.isprintable():
+        return _INVALID
+    if value[0] == '"':
+        match = _DOUBLE_QUOTED.fullmatch(value)
+        return match.group(1) if match else _INVALID
+    if value[0] == "'":
+        match = _SINGLE_QUOTED.fullmatch(value)
+        return match.group(1) if match else _INVALID
+    # Plain scalars starting with a letter are strings unless YAML reads them as bool/null
+    if (not value[0].isalpha() or value in _RESERVED or ': ' in value
+            or ' #' in value or value.endswith(':')):
+        return _INVALID
+    return value
+
+
+def _parse_flat(text: str) -> Any:
+    """Parse frontmatter made only of `key: value` lines, or return _INVALID"""
+    data = {}
+    for line in text.split('\n'):
+        if not line:
+            continue
+        match = _FLAT_LINE.fullmatch(line)
+        if not match or match.group(1) in _RESERVED:
+            return _INVALID
+        value = _flat_value(match.group(2))
+        if value is _INVALID:
+            return _INVALID
+        data[match.group(1)] = value
+    return data if data else _INVALID
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(text: str) -> Any:
+    """Parsed frontmatter text (shared, don't mutate), or _INVALID for bad YAML"""
+    data = _parse_flat(text)
+    if data is not _INVALID:
+        return data
+    try:
+        return yaml.load(text, Loader=_SafeLoader)
+    except yaml.YAMLError:
+        return _INVALID
+
+
+def parse_yaml(text: str) -> Any:
+    """
+    Parse frontmatter YAML, memoized by text
+
+    Returns:
+        The same value yaml.safe_load would (a fresh copy per call)
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    data = _parse_cached(text)
+    if data is _INVALID:
+        raise yaml.YAMLError('invalid frontmatter YAML')
+    if isinstance(data, dict) and all(isinstance(value, (str, int, float, type(None))) for value in data.values()):
+        return dict(data)
+    return copy.deepcopy(data)
+
+
+def read_frontmatter(content: str) -> Optional[Frontmatter]:
+    """
+    Find and parse the frontmatter block of a Markdown/MDX file
+
+    Returns:
+        None if the file has no frontmatter block or its YAML is invalid
+    """
+    match = _FRONTMATTER.match(content)
+    if not match:
+        return None
+    try:
+        data = parse_yaml(match.group(1))
+    except yaml.YAMLError:
+        return None
+    return Frontmatter(data, match.end(), content.count('\n', 0, match.end()))
+
+
+def cache_info() -> Tuple[int, int]:
+    """(hits, misses) of the parse cache"""
+    info = _parse_cached.cache_info()
+    return info.hits, info.misses
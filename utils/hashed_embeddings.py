@@ -0,0 +1,127 @@
+"""
+Local paragraph embeddings from hashed TF-IDF features
+
+Each word is hashed to a few signed dimensions of a small dense vector (a
+sparse random projection of the hashed TF-IDF vector), so no vocabulary
+or model has to be stored and nothing leaves the machine. Cosine
+similarity of the unit-length rows finds paragraphs that use the same
+words even when they are phrased differently.
+
+Needs numpy; callers check NUMPY_AVAILABLE first.
+"""
+
+import hashlib
+import importlib.util
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Optional dependency for the embedding matrix and the similarity search, imported
+# only when they run so loading the analyzers stays cheap
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+_WORD = re.compile(r'[^\W\d_]{2,}')
+
+# Signed dimensions per word; each gets weight 1/sqrt(n) so vector norms are kept
+_PROJECTIONS = 4
+
+
+@lru_cache(maxsize=65536)
+def _word_dimensions(word: str, dimensions: int) -> Tuple[Tuple[int, ...], Tuple[float, ...]]:
+    """(dimensions, signed weights) a word is projected to"""
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=4 * _PROJECTIONS).digest()
+    scale = 1 / math.sqrt(_PROJECTIONS)
+    dims, signs = [], []
+    for r in range(_PROJECTIONS):
+        value = int.from_bytes(digest[4 * r:4 * r + 4], 'little')
+        dims.append((value >> 1) % dimensions)
+        signs.append(scale if value & 1 else -scale)
+    return tuple(dims), tuple(signs)
+
+
+class HashedEmbedder:
+    """Embed paragraphs as unit float32 vectors of hashed TF-IDF features"""
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+
+    def embed(self, paragraphs: Sequence[str]) -> 'np.ndarray':
+        """
+        Embed a set of paragraphs (IDF weights come from the set itself)
+
+        Returns:
+            (len(paragraphs), dimensions) float32 matrix of unit rows (zero rows for paragraphs without words)
+        """
+        import numpy as np
+
+        words = [Counter(_WORD.findall(paragraph.lower())) for paragraph in paragraphs]
+        document_frequency = Counter(word for counts in words for word in counts)
+        total = len(paragraphs)
+
+        vectors = np.zeros((total, self.dimensions), dtype=np.float32)
+        for i, counts in enumerate(words):
+            dims: List[int] = []
+            weights: List[float] = []
+            for word, count in counts.items():
+                # Sublinear term frequency x smoothed inverse document frequency
+                tf_idf = (1 + math.log(count)) * (math.log((1 + total) / (1 + document_frequency[word])) + 1)
+                word_dims, signs = _word_dimensions(word, self.dimensions)
+                dims.extend(word_dims)
+                weights.extend(sign * tf_idf for sign in signs)
+            if dims:
+                np.add.at(vectors[i], dims, weights)
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1, norms)
+        return vectors
+
+
+def similar_pairs(vectors: 'np.ndarray', threshold: float, top_k: int = 5, block_size: int = 1024,
+                  groups: Optional[Sequence[int]] = None) -> Iterator[Tuple[int, int, float]]:
+    """
+    Most similar rows of each row, computed one block x block tile at a time
+
+    Memory stays at a few tiles plus top_k candidates per row of the
+    current block, whatever the number of rows.
+
+    Args:
+        vectors: Unit rows (see HashedEmbedder.embed)
+        threshold: Minimum cosine similarity
+        top_k: Candidates kept per row
+        block_size: Rows per tile side
+        groups: Group id per row; rows of the same group are never paired (e.g. same file)
+
+    Yields:
+        (row, other row, cosine similarity), each row's pairs best first;
+        a pair can appear from both sides
+    """
+    import numpy as np
+
+    total = len(vectors)
+    group_ids = np.asarray(groups) if groups is not None else np.arange(total)
+    for start in range(0, total, block_size):
+        rows = vectors[start:start + block_size]
+        row_groups = group_ids[start:start + len(rows), None]
+        best = np.full((len(rows), top_k), -np.inf, dtype=np.float32)
+        best_index = np.zeros((len(rows), top_k), dtype=np.int64)
+
+        for column in range(0, total, block_size):
+            tile = rows @ vectors[column:column + block_size].T
+            # Rows never pair with their own group (each row is its own group by default)
+            tile[row_groups == group_ids[None, column:column + tile.shape[1]]] = -np.inf
+
+            candidates = np.concatenate([best, tile], axis=1)
+            candidate_index = np.concatenate(
+                [best_index, np.broadcast_to(np.arange(column, column + tile.shape[1]), tile.shape)], axis=1)
+            keep = np.argpartition(-candidates, top_k - 1, axis=1)[:, :top_k]
+            best = np.take_along_axis(candidates, keep, axis=1)
+            best_index = np.take_along_axis(candidate_index, keep, axis=1)
+
+        order = np.argsort(-best, axis=1)
+        for r in range(len(rows)):
+            for k in order[r]:
+                if best[r, k] < threshold:
+                    break
+                yield start + r, int(best_index[r, k]), float(best[r, k])
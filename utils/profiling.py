@@ -0,0 +1,131 @@
+"""
+Lightweight per-check timing for the analyzer and fixer pipelines
+
+Each instrumented call (an analyzer check, an analyzer module, a fixer's
+check_file/fix, an export step) is timed with perf_counter and aggregated
+into per-check totals, call counts, the slowest file and issue counts.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+
+class TimingSpan:
+    """Handle yielded by Profiler.measure; set issues when the count is only known afterwards"""
+    __slots__ = ('issues',)
+
+    def __init__(self):
+        self.issues = 0
+
+
+class Profiler:
+    """Thread-safe aggregation of timings keyed by (category, name)"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._stats: Dict[tuple, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, category: str, name: str, file_path: Optional[str] = None,
+                issues: Optional[list] = None):
+        """
+        Time the enclosed block
+
+        Args:
+            category: Group such as 'check', 'analyzer', 'fixer.check_file'
+            name: Check, module or fixer name
+            file_path: File being processed (for the per-file maximum)
+            issues: Issue list the block appends to; the growth is counted
+        """
+        span = TimingSpan()
+        if not self.enabled:
+            yield span
+            return
+
+        before = len(issues) if issues is not None else 0
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if issues is not None:
+                span.issues = len(issues) - before
+            self.add(category, name, elapsed_ms, file_path, span.issues)
+
+    def add(self, category: str, name: str, elapsed_ms: float,
+            file_path: Optional[str] = None, issues: int = 0):
+        """Record one timed call"""
+        with self._lock:
+            stat = self._stat(category, name)
+            stat['calls'] += 1
+            stat['total_ms'] += elapsed_ms
+            stat['issues'] += issues
+            if elapsed_ms > stat['max_ms']:
+                stat['max_ms'] = elapsed_ms
+                stat['max_file'] = file_path
+
+    def merge(self, rows: List[Dict[str, Any]]):
+        """Fold in rows from another profiler (see rows()), e.g. from shard partials"""
+        with self._lock:
+            for row in rows:
+                stat = self._stat(row['category'], row['name'])
+                stat['calls'] += row['calls']
+                stat['total_ms'] += row['total_ms']
+                stat['issues'] += row['issues']
+                if row['max_ms'] > stat['max_ms']:
+                    stat['max_ms'] = row['max_ms']
+                    stat['max_file'] = row['max_file']
+
+    def _stat(self, category: str, name: str) -> Dict[str, Any]:
+        """Aggregate for (category, name); caller holds the lock"""
+        stat = self._stats.get((category, name))
+        if stat is None:
+            stat = self._stats[(category, name)] = {
+                'category': category,
+                'name': name,
+                'calls': 0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+                'max_file': None,
+                'issues': 0,
+            }
+        return stat
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Per-check statistics, slowest total first"""
+        with self._lock:
+            rows = [dict(stat) for stat in self._stats.values()]
+        for row in rows:
+            row['total_ms'] = round(row['total_ms'], 3)
+            row['max_ms'] = round(row['max_ms'], 3)
+            row['mean_ms'] = round(row['total_ms'] / row['calls'], 3) if row['calls'] else 0.0
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        rows = self.rows()
+        return {
+            'total_ms': round(sum(row['total_ms'] for row in rows if row['category'] != 'export'), 3),
+            'checks': rows,
+        }
+
+    def format_table(self, limit: Optional[int] = None) -> str:
+        """Sorted timing table for the console"""
+        rows = self.rows()[:limit] if limit else self.rows()
+        if not rows:
+            return "No timings recorded"
+
+        name_width = max(len(f"{row['category']}:{row['name']}") for row in rows)
+        lines = [
+            f"{'Check':<{name_width}}  {'Calls':>6}  {'Total ms':>10}  {'Mean ms':>9}  {'Max ms':>9}  {'Issues':>6}  Slowest file",
+            '-' * (name_width + 60),
+        ]
+        for row in rows:
+            label = f"{row['category']}:{row['name']}"
+            lines.append(
+                f"{label:<{name_width}}  {row['calls']:>6}  {row['total_ms']:>10.1f}  {row['mean_ms']:>9.2f}  "
+                f"{row['max_ms']:>9.2f}  {row['issues']:>6}  {row['max_file'] or ''}"
+            )
+        return '\n'.join(lines)
@@ -0,0 +1,111 @@
+"""
+Prompt-prefix caching helpers for Claude requests
+
+The fixed instruction text of the clarity and style guide prompts is sent as
+a system prompt marked with cache_control, so repeated requests across a run
+read it from the prompt cache instead of paying for it on every file. Only
+the per-file content follows in the user message.
+
+The API silently ignores the marker on a prefix shorter than the model's
+minimum cacheable length. Such prefixes are sent unmarked, with a warning.
+"""
+
+import threading
+from typing import Any, Dict, List
+
+from utils.chunking import estimate_tokens
+
+# Minimum cacheable prefix by model family (first match wins), in tokens
+MIN_CACHEABLE_TOKENS = [
+    ('haiku-4-5', 4096),
+    ('opus-4-5', 4096),
+    ('haiku', 2048),
+]
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+_warned = set()
+_warned_lock = threading.Lock()
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Shortest prefix the model will cache"""
+    for family, tokens in MIN_CACHEABLE_TOKENS:
+        if family in (model or ''):
+            return tokens
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+def cached_system_prompt(text: str, model: str) -> List[Dict[str, Any]]:
+    """
+    System prompt blocks with the instruction prefix marked for caching
+
+    Args:
+        text: Fixed instruction prefix
+        model: Model the request goes to
+
+    Returns:
+        One text block; marked with cache_control only if the (estimated)
+        prefix length reaches the model's minimum
+    """
+    block = {"type": "text", "text": text}
+    tokens, minimum = estimate_tokens(text), min_cacheable_tokens(model)
+    if tokens >= minimum:
+        block["cache_control"] = {"type": "ephemeral"}
+        return [block]
+
+    with _warned_lock:
+        first = (model, text) not in _warned
+        _warned.add((model, text))
+    if first:
+        print(f"⚠️  Prompt prefix of ~{tokens} tokens is under {model}'s {minimum}-token "
+              f"cache minimum; sending it uncached")
+    return [block]
+
+
+class PromptCacheStats:
+    """Thread-safe per-run totals of cached and uncached input tokens"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.input_tokens = 0
+        self.cache_creation_input_tokens = 0
+        self.cache_read_input_tokens = 0
+
+    def record(self, response: Any):
+        """Add the usage of one messages.create response"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        self.add(getattr(usage, 'input_tokens', 0) or 0,
+                 getattr(usage, 'cache_creation_input_tokens', 0) or 0,
+                 getattr(usage, 'cache_read_input_tokens', 0) or 0)
+
+    def add(self, input_tokens: int = 0, cache_creation_input_tokens: int = 0, cache_read_input_tokens: int = 0):
+        """Add the token counts of one request"""
+        with self._lock:
+            self.requests += 1
+            self.input_tokens += input_tokens
+            self.cache_creation_input_tokens += cache_creation_input_tokens
+            self.cache_read_input_tokens += cache_read_input_tokens
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of prompt tokens served from the cache"""
+        total = self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
+        return self.cache_read_input_tokens / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'input_tokens': self.input_tokens,
+            'cache_creation_input_tokens': self.cache_creation_input_tokens,
+            'cache_read_input_tokens': self.cache_read_input_tokens,
+            'cache_hit_rate': round(self.hit_rate, 3),
+        }
+
+    def summary(self) -> str:
+        return (f"💾 Prompt cache: {self.cache_read_input_tokens:,} tokens read, "
+                f"{self.cache_creation_input_tokens:,} written, "
+                f"{self.input_tokens:,} uncached over {self.requests} requests "
+                f"({self.hit_rate:.0%} hit rate)")
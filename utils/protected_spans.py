@@ -0,0 +1,96 @@
+"""
+Protected regions of Markdown text as sorted interval maps
+
+Fixers must not rewrite inline code or link targets. Instead of
+re-inspecting the text before every match (counting backticks in the
+line prefix), the protected spans of a line or document are computed
+once and each "is this position protected" query is a bisect over the
+sorted span starts.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+# URL of a Markdown link [text](url), an href value, a bare URL
+_MARKDOWN_LINK = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+_HREF = re.compile(r'href=([\"\'])([^\"\']+)\1')
+_BARE_URL = re.compile(r'https?://[^\s\)]+')
+
+
+class SpanMap:
+    """Sorted, non-overlapping [start, end) intervals"""
+
+    def __init__(self, spans: Iterable[Tuple[int, int]] = ()):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for start, end in sorted(span for span in spans if span[1] > span[0]):
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)  # overlapping or touching: merge
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __contains__(self, position: int) -> bool:
+        i = bisect_right(self.starts, position) - 1
+        return i >= 0 and position < self.ends[i]
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """True if any position in [start, end) is protected"""
+        i = bisect_right(self.starts, start) - 1
+        if i >= 0 and start < self.ends[i]:
+            return True
+        return i + 1 < len(self.starts) and self.starts[i + 1] < end
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def union(self, other: 'SpanMap') -> 'SpanMap':
+        return SpanMap(list(self) + list(other))
+
+    def segments(self, text: str) -> List[Tuple[str, bool]]:
+        """text split at the span edges into (segment, protected) pairs, in order"""
+        segments = []
+        position = 0
+        for start, end in self:
+            if start > position:
+                segments.append((text[position:start], False))
+            segments.append((text[start:end], True))
+            position = end
+        if position < len(text) or not segments:
+            segments.append((text[position:], False))
+        return segments
+
+
+def inline_code_spans(line: str) -> SpanMap:
+    """
+    Positions of a line inside `inline code`
+
+    A position counts as code when an odd number of backticks precede it
+    on the line (an unclosed backtick protects the rest of the line).
+    """
+    ticks = [i for i, char in enumerate(line) if char == '`']
+    if len(ticks) % 2:
+        ticks.append(len(line))
+    return SpanMap((ticks[k] + 1, ticks[k + 1] + 1) for k in range(0, len(ticks), 2))
+
+
+def url_spans(text: str) -> SpanMap:
+    """Link targets of Markdown links, href values and bare URLs"""
+    spans = [match.span(2) for match in _MARKDOWN_LINK.finditer(text)]
+    spans.extend(match.span(2) for match in _HREF.finditer(text))
+    spans.extend(match.span() for match in _BARE_URL.finditer(text))
+    return SpanMap(spans)
+
+
+def protected_spans(line: str) -> SpanMap:
+    """Inline code and link targets of one line"""
+    if '`' not in line and '](' not in line and 'href=' not in line and '://' not in line:
+        return SpanMap()
+    return inline_code_spans(line).union(url_spans(line))
@@ -0,0 +1,58 @@
+"""
+Sharding helpers for splitting a run across machines
+
+Files are assigned to shards by a stable hash of their path relative to the
+docs root, so every machine computes the same split regardless of checkout
+location or filesystem order. Shards are numbered 1..N (`--shard 2/4`).
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse an "i/N" shard spec
+
+    Raises:
+        ValueError: If the spec is malformed or i is outside 1..N
+    """
+    index, sep, count = value.partition('/')
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}': expected i/N, e.g. 1/4") from None
+    if not sep or count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}': i must be between 1 and N")
+    return index, count
+
+
+def shard_of(relative_path: str, count: int) -> int:
+    """Shard number (1..count) owning a relative path"""
+    digest = hashlib.sha1(Path(relative_path).as_posix().encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count + 1
+
+
+def select_shard(files: Iterable[Path], root: Path, index: int, count: int) -> List[Path]:
+    """Files belonging to shard index of count, in their original order"""
+    return [f for f in files if shard_of(str(Path(f).relative_to(root)), count) == index]
+
+
+def check_complete(shards: List[Tuple[int, int]]):
+    """
+    Verify a set of (index, count) pairs covers every shard exactly once
+
+    Raises:
+        ValueError: On mixed shard counts, duplicates or missing shards
+    """
+    counts = {count for _, count in shards}
+    if len(counts) != 1:
+        raise ValueError(f"Partials come from runs with different shard counts: {sorted(counts)}")
+    count = counts.pop()
+    indexes = sorted(index for index, _ in shards)
+    if len(set(indexes)) != len(indexes):
+        raise ValueError(f"Duplicate shards in partials: {indexes}")
+    missing = sorted(set(range(1, count + 1)) - set(indexes))
+    if missing:
+        raise ValueError(f"Missing shards {missing} of {count}")
@@ -0,0 +1,170 @@
+"""
+Sparse term-document matrix
+
+Documents are tokenized once; tracked terms (single words or multi-word
+phrases) are counted from the document's word counts. Counts are stored
+in compressed sparse row (CSR) form with one row per term, so per-term
+lookups (which documents use a term, how often) are row slices, and
+per-document usage is a column of the lazily built transpose. Arrays come
+from the standard library `array` module; no SciPy needed.
+"""
+
+import re
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Words keep inner hyphens and dots ("command-line", "a.p.i") so variants stay distinct
+_TOKEN = re.compile(r"\w+(?:[-.']\w+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of text"""
+    return _TOKEN.findall(text.lower())
+
+
+def normalize_term(term: str) -> str:
+    """Canonical key of a term: its tokens joined by single spaces"""
+    return ' '.join(tokenize(term))
+
+
+class PhraseCounter:
+    """Counts occurrences of a fixed set of terms in token streams"""
+
+    def __init__(self, terms: Iterable[str]):
+        self._words: Set[str] = set()
+        # Multi-word phrases by their first two tokens: (first, second) -> [(tokens, term)]
+        self._phrases: Dict[Tuple[str, str], List[Tuple[Tuple[str, ...], str]]] = {}
+        self._first_words: Set[str] = set()
+        for term in {normalize_term(term) for term in terms}:
+            tokens = tuple(term.split())
+            if len(tokens) == 1:
+                self._words.add(term)
+            elif tokens:
+                self._phrases.setdefault(tokens[:2], []).append((tokens, term))
+                self._first_words.add(tokens[0])
+
+    def count(self, tokens: Sequence[str]) -> Dict[str, int]:
+        """Tracked term (normalized) -> occurrences in tokens"""
+        words = Counter(tokens)
+        counts = {word: words[word] for word in self._words if word in words}
+
+        # One pass for phrases, looking only at tokens that start one
+        if self._phrases and not self._first_words.isdisjoint(words):
+            phrases, first_words = self._phrases, self._first_words
+            for i in range(len(tokens) - 1):
+                if tokens[i] in first_words:
+                    for phrase, term in phrases.get((tokens[i], tokens[i + 1]), ()):
+                        if len(phrase) == 2 or tuple(tokens[i:i + len(phrase)]) == phrase:
+                            counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def count_text(self, text: str) -> Dict[str, int]:
+        return self.count(tokenize(text))
+
+
+class TermDocumentMatrix:
+    """Term x document occurrence counts in CSR form"""
+
+    def __init__(self, terms: List[str], documents: List[str],
+                 indptr: array, indices: array, data: array):
+        self.terms = terms
+        self.documents = documents
+        self.indptr = indptr    # row i spans indices[indptr[i]:indptr[i + 1]]
+        self.indices = indices  # document index of each stored count
+        self.data = data        # occurrence counts
+        self._term_index = {term: i for i, term in enumerate(terms)}
+        self._document_index = {document: j for j, document in enumerate(documents)}
+        self._columns: Optional[Tuple[array, array, array]] = None
+
+    @classmethod
+    def from_counts(cls, document_counts: Mapping[str, Mapping[str, int]],
+                    terms: Optional[Iterable[str]] = None) -> 'TermDocumentMatrix':
+        """
+        Build from per-document term counts
+
+        Args:
+            document_counts: Document id -> {term: count}
+            terms: Rows to include, also when unused (default: every counted term)
+        """
+        documents = list(document_counts)
+        vocabulary = sorted(set(terms) if terms is not None else
+                            {term for counts in document_counts.values() for term in counts})
+        term_index = {term: i for i, term in enumerate(vocabulary)}
+
+        rows: List[List[Tuple[int, int]]] = [[] for _ in vocabulary]
+        for j, document in enumerate(documents):
+            for term, count in document_counts[document].items():
+                i = term_index.get(term)
+                if i is not None and count:
+                    rows[i].append((j, count))
+
+        indptr, indices, data = array('l', [0]), array('l'), array('l')
+        for row in rows:
+            for j, count in row:
+                indices.append(j)
+                data.append(count)
+            indptr.append(len(indices))
+        return cls(vocabulary, documents, indptr, indices, data)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.terms), len(self.documents)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def _row(self, term: str) -> Tuple[int, int]:
+        i = self._term_index.get(term)
+        if i is None:
+            return 0, 0
+        return self.indptr[i], self.indptr[i + 1]
+
+    def row(self, term: str) -> Dict[str, int]:
+        """Document -> count for one term"""
+        start, end = self._row(term)
+        return {self.documents[self.indices[k]]: self.data[k] for k in range(start, end)}
+
+    def document_frequency(self, term: str) -> int:
+        """Number of documents using a term"""
+        start, end = self._row(term)
+        return end - start
+
+    def total(self, term: str) -> int:
+        """Occurrences of a term across all documents (row sum)"""
+        start, end = self._row(term)
+        return sum(self.data[start:end])
+
+    def documents_with(self, term: str) -> List[str]:
+        start, end = self._row(term)
+        return [self.documents[self.indices[k]] for k in range(start, end)]
+
+    def column(self, document: str) -> Dict[str, int]:
+        """Term -> count for one document"""
+        j = self._document_index.get(document)
+        if j is None:
+            return {}
+        indptr, indices, data = self._transpose()
+        return {self.terms[indices[k]]: data[k] for k in range(indptr[j], indptr[j + 1])}
+
+    def _transpose(self) -> Tuple[array, array, array]:
+        """CSC arrays (document-major), built on first column access"""
+        if self._columns is None:
+            counts = array('l', [0] * (len(self.documents) + 1))
+            for j in self.indices:
+                counts[j + 1] += 1
+            for j in range(len(self.documents)):
+                counts[j + 1] += counts[j]
+            indptr = array('l', counts)
+            indices = array('l', [0] * self.nnz)
+            data = array('l', [0] * self.nnz)
+            cursor = array('l', counts[:-1])
+            for i in range(len(self.terms)):
+                for k in range(self.indptr[i], self.indptr[i + 1]):
+                    j = self.indices[k]
+                    indices[cursor[j]] = i
+                    data[cursor[j]] = self.data[k]
+                    cursor[j] += 1
+            self._columns = (indptr, indices, data)
+        return self._columns
@@ -6,6 +6,8 @@ import re
 import yaml
 from typing import Optional, Tuple, Dict, Any
 
+from .frontmatter import read_frontmatter
+
 
 def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str, int]:
     """
@@ -18,24 +20,11 @@ def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, Any]], str, in
         Tuple of (frontmatter_dict, body_content, frontmatter_end_line)
         Returns (None, content, 0) if no frontmatter found
     """
-    # Match YAML frontmatter between --- delimiters
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
+    frontmatter = read_frontmatter(content)
+    if frontmatter is None:
         return None, content, 0
 
-    frontmatter_text = match.group(1)
-    body = content[match.end():]
-
-    # Count lines in frontmatter (including delimiters)
-    frontmatter_lines = content[:match.end()].count('\n')
-
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        return frontmatter, body, frontmatter_lines
-    except yaml.YAMLError:
-        return None, content, 0
+    return frontmatter.data, frontmatter.body(content), frontmatter.lines
 
 
 def replace_frontmatter(content: str, new_frontmatter: Dict[str, Any]) -> str:
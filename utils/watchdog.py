@@ -0,0 +1,123 @@
+"""
+Time budgets for per-file checks
+
+A malformed page (an unterminated JSX tag, a single multi-megabyte line)
+can send a backtracking regex into a near-endless search. Watchdog runs
+each check under a per-check budget, capped by what is left of the
+file's budget, and raises CheckTimeout when it runs out.
+
+Budgets are enforced with a SIGALRM interval timer, which also
+interrupts `re` mid-match. Signals only reach the main thread, so on
+other threads (or platforms without setitimer) checks run unbudgeted.
+
+Patterns that come from configuration (validation_rules.yaml) can go
+through `finditer`, which uses the `regex` module's own match timeout
+when it is installed.
+"""
+
+import re
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+# Optional dependency: per-match timeouts for configured patterns
+try:
+    import regex
+except ImportError:
+    regex = None
+
+
+class CheckTimeout(Exception):
+    """A check ran past its time budget"""
+
+    def __init__(self, check: str, seconds: float, scope: str = 'check'):
+        super().__init__(f"{check} exceeded its {seconds:g}s {scope} time budget")
+        self.check = check
+        self.seconds = seconds
+        self.scope = scope  # 'check' or 'file'
+
+
+def _signals_available() -> bool:
+    return hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+
+
+def finditer(pattern: str, text: str, flags: int = 0, timeout: Optional[float] = None) -> List[Any]:
+    """
+    All matches of pattern in text, giving up after timeout seconds
+
+    Uses the regex module's match timeout when installed; otherwise re,
+    bounded only by the watchdog budget of the enclosing check.
+
+    Raises:
+        CheckTimeout: If the regex module's timeout expires
+    """
+    if regex is not None and timeout:
+        try:
+            return list(regex.finditer(pattern, text, flags, timeout=timeout))
+        except TimeoutError:
+            raise CheckTimeout(f"pattern {pattern[:40]!r}", timeout, 'pattern')
+    return list(re.finditer(pattern, text, flags))
+
+
+class Watchdog:
+    """Per-check and per-file time budgets"""
+
+    def __init__(self, check_seconds: Optional[float] = None, file_seconds: Optional[float] = None):
+        self.check_seconds = check_seconds or None
+        self.file_seconds = file_seconds or None
+        self._file_deadline: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, budgets: Dict[str, Any]) -> 'Watchdog':
+        """From a time_budgets config section ({'per_check': s, 'per_file': s}, 0 = no limit)"""
+        return cls(budgets.get('per_check'), budgets.get('per_file'))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.check_seconds or self.file_seconds)
+
+    @contextmanager
+    def file(self, file_path: str):
+        """Budget the checks run for one file"""
+        self._file_deadline = time.monotonic() + self.file_seconds if self.file_seconds else None
+        try:
+            yield self
+        finally:
+            self._file_deadline = None
+
+    def _budget(self, check: str):
+        """(seconds, scope) left for the next check"""
+        seconds, scope = self.check_seconds, 'check'
+        if self._file_deadline is not None:
+            remaining = self._file_deadline - time.monotonic()
+            if seconds is None or remaining < seconds:
+                seconds, scope = remaining, 'file'
+            if seconds <= 0:
+                raise CheckTimeout(check, self.file_seconds, 'file')
+        return seconds, scope
+
+    def call(self, check: str, func: Callable, *args, **kwargs):
+        """
+        Run func(*args, **kwargs) within the current budget
+
+        Raises:
+            CheckTimeout: If the check (or the file's checks so far) ran out of time
+        """
+        if not self.enabled or not _signals_available():
+            return func(*args, **kwargs)
+
+        seconds, scope = self._budget(check)
+        limit = self.file_seconds if scope == 'file' else self.check_seconds
+
+        def expire(signum, frame):
+            raise CheckTimeout(check, limit, scope)
+
+        previous = signal.signal(signal.SIGALRM, expire)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)